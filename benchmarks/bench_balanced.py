@@ -0,0 +1,75 @@
+"""Benchmark the balanced chunk strategy against greedy chunking.
+
+Chunks generated mrkdwn documents of 1 MB up to --max-mb with both
+strategies and reports chunk count, smallest chunk and time. Besides a
+mixed document, it chunks sentence-only prose and a list with a blank
+line between items, where every chunk has hundreds of candidate splits.
+Balanced chunking should never need more chunks than greedy, should
+avoid tiny trailing chunks, and its time per MB should stay flat as
+inputs grow.
+
+Usage:
+    python benchmarks/bench_balanced.py [--max-mb N] [--chunk-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from md2slack.chunker import CHUNK_STRATEGIES, DEFAULT_CHUNK_SIZE, chunk_content
+
+PARAGRAPHS = (
+    "*Status update* for the migration. Rows were copied without errors.\n\n",
+    "Next step is the cutover! Any questions? Ping the channel. The rollback "
+    "plan is in the runbook and has been rehearsed twice this week.\n\n",
+    "• One more item.\n\n",
+)
+CODE_BLOCK = "```\n" + "SELECT * FROM table WHERE id = 1;\n" * 5 + "```\n\n"
+
+
+SENTENCES = "Rows copied. Next step is the cutover! Any questions? "
+LIST_ITEMS = "".join(f"• Item {n} is done.\n\n" for n in range(10))
+
+
+def build_document(size: int, unit: str) -> str:
+    """Build a mrkdwn document of about size characters by repeating unit."""
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+DOCUMENTS = {
+    "mixed": "".join(PARAGRAPHS) * 6 + CODE_BLOCK + PARAGRAPHS[1] * 3,
+    "sentences": SENTENCES,
+    "list": LIST_ITEMS,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-mb", type=float, default=10)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    print(
+        f"{'document':>9} {'size':>8} {'strategy':>9} {'chunks':>7} "
+        f"{'smallest':>9} {'seconds':>8} {'s/MB':>7}"
+    )
+    for name, unit in DOCUMENTS.items():
+        megabytes = 1.0
+        while megabytes <= args.max_mb:
+            document = build_document(int(megabytes * 1024 * 1024), unit)
+            for strategy in CHUNK_STRATEGIES:
+                start = time.perf_counter()
+                result = chunk_content(document, args.chunk_size, strategy=strategy)
+                elapsed = time.perf_counter() - start
+                smallest = min(len(chunk.content) for chunk in result.chunks)
+                print(
+                    f"{name:>9} {megabytes:>6.0f}MB {strategy:>9} "
+                    f"{result.chunk_count:>7} {smallest:>9} {elapsed:>8.3f} "
+                    f"{elapsed / megabytes:>7.3f}"
+                )
+            megabytes *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark chunk_content scaling on large documents.
+
+Chunks generated mrkdwn documents from 100 KB up to --max-mb and reports
+time and throughput for each size. Time per MB should stay roughly flat
+as the document grows.
+
+Usage:
+    python benchmarks/bench_chunker.py [--max-mb N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from md2slack.chunker import chunk_content
+
+PARAGRAPH = (
+    "*Status update* for the migration. Rows were copied without errors. "
+    "Next step is the cutover! Any questions? Ping the channel.\n\n"
+)
+CODE_BLOCK = "```\n" + "SELECT * FROM table WHERE id = 1;\n" * 5 + "```\n\n"
+
+
+def build_document(size: int) -> str:
+    """Build a mrkdwn document of about size characters."""
+    unit = PARAGRAPH * 8 + CODE_BLOCK
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-mb", type=float, default=100)
+    args = parser.parse_args()
+
+    size = 100 * 1024
+    print(f"{'size':>10} {'chunks':>8} {'seconds':>9} {'s/MB':>8}")
+    while size <= args.max_mb * 1024 * 1024:
+        document = build_document(size)
+        start = time.perf_counter()
+        result = chunk_content(document)
+        elapsed = time.perf_counter() - start
+        megabytes = size / (1024 * 1024)
+        print(
+            f"{megabytes:>8.1f}MB {result.chunk_count:>8} "
+            f"{elapsed:>9.3f} {elapsed / megabytes:>8.3f}"
+        )
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark per-call conversion overhead.
+
+Compares building a fresh mistune parser on every call (the previous
+behaviour of ``convert()``) with reusing a compiled ``Converter``, and
+sequential conversion of a batch of documents with ``convert_batch()``.
+
+Usage:
+    python benchmarks/bench_converter.py [--calls N] [--docs N] [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import timeit
+
+import mistune
+
+from md2slack.converter import (
+    DEFAULT_PLUGINS,
+    Converter,
+    SlackMrkdwnRenderer,
+    convert_batch,
+    convert_many,
+)
+
+SAMPLE = "Deploy **finished** for `api` - see [logs](https://example.com/logs)."
+
+
+def convert_uncached(markdown: str) -> str:
+    """Convert markdown by compiling a new parser for this call only."""
+    md = mistune.create_markdown(
+        renderer=SlackMrkdwnRenderer(),
+        plugins=list(DEFAULT_PLUGINS),
+    )
+    return md(markdown)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    converter = Converter()
+    assert convert_uncached(SAMPLE) == converter.convert(SAMPLE)
+
+    before = timeit.timeit(lambda: convert_uncached(SAMPLE), number=args.calls)
+    after = timeit.timeit(lambda: converter.convert(SAMPLE), number=args.calls)
+
+    print(f"calls:            {args.calls}")
+    print(f"per-call parser:  {before / args.calls * 1e6:8.1f} us/call")
+    print(f"compiled parser:  {after / args.calls * 1e6:8.1f} us/call")
+    print(f"speedup:          {before / after:8.2f}x")
+
+    docs = [f"# Report {i}\n\n" + SAMPLE * 20 for i in range(args.docs)]
+    start = time.perf_counter()
+    sequential = convert_many(docs)
+    sequential_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = convert_batch(docs, workers=args.jobs)
+    parallel_time = time.perf_counter() - start
+    assert parallel == sequential
+
+    print(f"batch docs:       {args.docs}")
+    print(f"convert_many:     {sequential_time * 1000:8.1f} ms")
+    print(f"convert_batch:    {parallel_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
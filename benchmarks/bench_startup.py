@@ -0,0 +1,79 @@
+"""Check the cold-start import cost of the md2slack CLI.
+
+Imports ``md2slack.cli`` in fresh interpreters with ``python -X importtime``,
+reports the best cumulative import time, and exits with status 1 if it is
+over budget or if heavy modules (slack_sdk, mistune) were imported.
+
+Usage:
+    python benchmarks/bench_startup.py [--budget-ms N] [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+HEAVY_MODULES = ("slack_sdk", "mistune")
+DEFAULT_BUDGET_MS = 150.0
+
+
+def import_profile(module: str) -> tuple[float, set[str]]:
+    """Import a module in a fresh interpreter.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        Tuple of (cumulative import time in ms, names of imported modules)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_ms = 0.0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            cumulative_ms = int(cumulative) / 1000
+    return cumulative_ms, imported
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    timings = []
+    imported: set[str] = set()
+    for _ in range(args.runs):
+        elapsed, imported = import_profile("md2slack.cli")
+        timings.append(elapsed)
+    best = min(timings)
+
+    heavy = sorted(
+        name
+        for name in imported
+        if any(name == m or name.startswith(f"{m}.") for m in HEAVY_MODULES)
+    )
+    print(f"md2slack.cli import: {best:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if heavy:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(heavy)}")
+        return 1
+    if best > args.budget_ms:
+        print("FAIL: startup import time over budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Benchmark table cell formatting stripping on large tables.
+
+Converts a generated report table with the current
+``_strip_mrkdwn_formatting`` and with the previous implementation (five
+uncompiled ``re.sub`` passes per cell), checks both outputs are identical
+and reports the time spent, both for the whole conversion and for
+stripping alone over the rendered cells of the same table.
+
+Usage:
+    python benchmarks/bench_tables.py [--rows N] [--cols N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+
+from md2slack import converter
+
+
+def strip_formatting_reference(text: str) -> str:
+    """Previous implementation: one uncompiled regex pass per markup type."""
+    text = text.replace("`", "")
+    text = re.sub(r"<([^|>]+)\|([^>]+)>", r"\2", text)
+    text = re.sub(r"<([^>]+)>", r"\1", text)
+    text = re.sub(r"\*([^*]+)\*", r"\1", text)
+    text = re.sub(r"(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])", r"\1", text)
+    text = re.sub(r"~([^~]+)~", r"\1", text)
+    return text
+
+
+def build_table(rows: int, cols: int) -> str:
+    """Build a markdown table with a mix of plain and formatted cells."""
+    samples = [
+        "plain value {n}",
+        "**bold {n}**",
+        "`code_{n}`",
+        "[link {n}](https://example.com/{n})",
+        "~~old {n}~~",
+        "*note* {n}",
+        "snake_case_{n}",
+    ]
+    header = "| " + " | ".join(f"Col {c}" for c in range(cols)) + " |"
+    separator = "|" + "---|" * cols
+    lines = [header, separator]
+    for r in range(rows):
+        cells = [samples[(r + c) % len(samples)].format(n=r) for c in range(cols)]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def time_convert(markdown: str) -> tuple[float, str]:
+    """Convert markdown and return (seconds, output)."""
+    start = time.perf_counter()
+    output = converter.convert(markdown)
+    return time.perf_counter() - start, output
+
+
+def rendered_cells(markdown: str) -> list[str]:
+    """Return the rendered cells that conversion passes to the stripper."""
+    current = converter._strip_mrkdwn_formatting
+    cells: list[str] = []
+
+    def record(text: str) -> str:
+        cells.append(text)
+        return current(text)
+
+    converter._strip_mrkdwn_formatting = record
+    try:
+        converter.convert(markdown)
+    finally:
+        converter._strip_mrkdwn_formatting = current
+    return cells
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--cols", type=int, default=10)
+    args = parser.parse_args()
+
+    markdown = build_table(args.rows, args.cols)
+    current = converter._strip_mrkdwn_formatting
+    cells = rendered_cells(markdown)  # also warms up the parser
+
+    converter._strip_mrkdwn_formatting = strip_formatting_reference
+    try:
+        before, reference_output = time_convert(markdown)
+    finally:
+        converter._strip_mrkdwn_formatting = current
+    after, output = time_convert(markdown)
+
+    assert output == reference_output, "output changed"
+
+    start = time.perf_counter()
+    for cell in cells:
+        strip_formatting_reference(cell)
+    strip_before = time.perf_counter() - start
+    start = time.perf_counter()
+    for cell in cells:
+        current(cell)
+    strip_after = time.perf_counter() - start
+
+    print(f"table:            {args.rows} rows x {args.cols} cols")
+    print(f"convert before:   {before * 1000:8.1f} ms")
+    print(f"convert after:    {after * 1000:8.1f} ms")
+    print(f"strip {len(cells)} cells: {strip_before * 1000:8.1f} ms -> "
+          f"{strip_after * 1000:.1f} ms ({strip_before / strip_after:.1f}x)")
+    print("output identical: yes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Asyncio Slack client for md2slack.
+
+This module mirrors SlackClient on top of slack_sdk's AsyncWebClient so a
+single event loop can post to many threads concurrently. It needs aiohttp,
+available with the ``async`` extra::
+
+    pip install "md2slack[async]"
+
+Example:
+    async with AsyncSlackClient(token) as client:
+        await asyncio.gather(
+            *(post_chunks(client, ref.channel_id, ref.thread_ts, chunks)
+              for ref in threads)
+        )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterable, Iterable
+from types import TracebackType
+
+import aiohttp
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from md2slack.chunker import Chunk
+from md2slack.slack import BaseSlackClient, RateLimiter, RetryPolicy
+
+__all__ = ["AsyncSlackClient", "post_chunks"]
+
+# Failures meaning Slack could not be reached at all
+_CONNECTION_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, OSError)
+
+
+class AsyncSlackClient(BaseSlackClient):
+    """Asyncio client for posting messages to Slack threads.
+
+    Requests share one aiohttp session, created on first use inside the
+    running event loop, so connections are reused across posts. Close the
+    client with close() or by using it as an async context manager.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        """Initialize Slack client with bot token.
+
+        Args:
+            token: Slack bot token (xoxb-...)
+            rate_limiter: Limiter consulted before each post; may be shared
+                with sync clients in other threads (default: a new
+                RateLimiter with Slack's posting limits)
+            retry_policy: How failed calls are retried (default: RetryPolicy())
+            base_url: Slack Web API URL, e.g. a local server in tests
+        """
+        super().__init__(rate_limiter, retry_policy)
+        self.client = AsyncWebClient(
+            token=token, base_url=base_url or AsyncWebClient.BASE_URL
+        )
+
+    async def __aenter__(self) -> AsyncSlackClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared HTTP session, if one was opened."""
+        session = self.client.session
+        self.client.session = None
+        if session is not None:
+            await session.close()
+
+    async def post_message(
+        self, channel_id: str, thread_ts: str, text: str
+    ) -> dict[str, str]:
+        """Post a message to a Slack thread.
+
+        Waits for the rate limiter before each attempt without blocking
+        the event loop, and retries transient failures according to the
+        retry policy.
+
+        Args:
+            channel_id: Slack channel ID (e.g., C0123ABCD)
+            thread_ts: Parent message timestamp (e.g., 1234567890.123456)
+            text: Message content in mrkdwn format
+
+        Returns:
+            Dict with 'ts' (message timestamp) and 'permalink'
+
+        Raises:
+            SlackError: If the API call fails for good
+        """
+        if self.client.session is None:
+            self.client.session = aiohttp.ClientSession()
+        method = "chat.postMessage"
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            wait = self.rate_limiter.reserve(method, channel_id)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                response = await self.client.chat_postMessage(
+                    channel=channel_id,
+                    text=text,
+                    thread_ts=thread_ts,
+                )
+            except (SlackApiError, *_CONNECTION_ERRORS) as e:
+                self._failed(
+                    method, channel_id, attempt, started, e, _CONNECTION_ERRORS
+                )
+            else:
+                self._succeeded(method, attempt, started)
+                return self._message_result(channel_id, response)
+
+
+async def post_chunks(
+    client: AsyncSlackClient,
+    channel_id: str,
+    thread_ts: str,
+    chunks: Iterable[Chunk] | AsyncIterable[Chunk],
+) -> list[dict[str, str]]:
+    """Post chunks to one thread in order.
+
+    Chunks of a thread are posted one after another so they appear in
+    order; run several post_chunks() calls concurrently to post to many
+    threads at once.
+
+    Args:
+        client: Client to post with
+        channel_id: Slack channel ID of the thread
+        thread_ts: Parent message timestamp of the thread
+        chunks: Chunks to post, with continuation indicators
+
+    Returns:
+        Results of post_message() for each chunk, in order
+
+    Raises:
+        SlackError: If a chunk fails to post; earlier chunks stay posted
+    """
+
+    async def post(chunk: Chunk) -> None:
+        results.append(
+            await client.post_message(channel_id, thread_ts, chunk.with_indicator)
+        )
+
+    results: list[dict[str, str]] = []
+    if isinstance(chunks, AsyncIterable):
+        async for chunk in chunks:
+            await post(chunk)
+    else:
+        for chunk in chunks:
+            await post(chunk)
+    return results
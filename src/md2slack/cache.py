@@ -0,0 +1,203 @@
+"""Content-addressed cache for markdown conversion results.
+
+This module provides a cache around the converter keyed by a hash of the
+markdown input and the converter options. Results are kept in an
+in-process LRU and, optionally, in an on-disk store with size-bounded
+eviction so repeated conversions of templated content are served without
+re-parsing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from md2slack.converter import Converter, get_default_converter
+
+__all__ = ["CacheStats", "ConversionCache", "default_cache_dir"]
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return the on-disk cache directory (honors XDG_CACHE_HOME).
+
+    Returns:
+        Path such as ~/.cache/md2slack
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "md2slack"
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a ConversionCache.
+
+    Attributes:
+        hits: Lookups served from memory or disk
+        misses: Lookups that required a conversion
+        disk_hits: Subset of hits served from the on-disk store
+    """
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Return the total number of lookups."""
+        return self.hits + self.misses
+
+
+class ConversionCache:
+    """Cache of converted mrkdwn keyed by input and converter options."""
+
+    def __init__(
+        self,
+        converter: Converter | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        directory: Path | str | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            converter: Converter used on a miss (default: shared converter)
+            max_entries: Maximum entries kept in the in-process LRU
+            directory: On-disk store location, or None for memory only
+            max_bytes: Maximum total size of the on-disk store
+        """
+        self.converter = converter or get_default_converter()
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, markdown: str) -> str:
+        """Return the cache key for markdown under this cache's converter.
+
+        Args:
+            markdown: Markdown input
+
+        Returns:
+            Hex SHA-256 digest of the converter fingerprint and input
+        """
+        digest = hashlib.sha256(self.converter.fingerprint.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(markdown.encode("utf-8"))
+        return digest.hexdigest()
+
+    def convert(self, markdown: str) -> str:
+        """Convert markdown, serving repeated inputs from the cache.
+
+        Args:
+            markdown: The markdown string to convert.
+
+        Returns:
+            The converted Slack mrkdwn string.
+        """
+        key = self.key(markdown)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return cached
+
+        cached = self._read_disk(key)
+        if cached is not None:
+            with self._lock:
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+            self._remember(key, cached)
+            return cached
+
+        result = self.converter.convert(markdown)
+        with self._lock:
+            self.stats.misses += 1
+        self._remember(key, result)
+        self._write_disk(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Remove all entries from memory and from the on-disk store."""
+        with self._lock:
+            self._entries.clear()
+        for path in self._disk_entries():
+            path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, value: str) -> None:
+        """Store a value in the in-process LRU, evicting the oldest entry."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the on-disk path for a key."""
+        assert self.directory is not None
+        return self.directory / "conversions" / f"{key}.mrkdwn"
+
+    def _disk_entries(self) -> list[Path]:
+        """Return all on-disk entry files."""
+        if self.directory is None:
+            return []
+        return list((self.directory / "conversions").glob("*.mrkdwn"))
+
+    def _read_disk(self, key: str) -> str | None:
+        """Read an entry from disk, refreshing its age for LRU eviction."""
+        if self.directory is None:
+            return None
+        path = self._entry_path(key)
+        try:
+            value = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            return None
+        return value
+
+    def _write_disk(self, key: str, value: str) -> None:
+        """Write an entry to disk atomically, then enforce the size bound.
+
+        Disk errors are ignored: the cache is an optimization only.
+        """
+        if self.directory is None:
+            return
+        path = self._entry_path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(value, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        entries = []
+        total = 0
+        for path in self._disk_entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
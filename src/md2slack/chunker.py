@@ -7,15 +7,43 @@ sentences) while preserving code blocks and tables intact.
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
-
-__all__ = ["Chunk", "ChunkResult", "chunk_content"]
+from typing import overload
+
+from md2slack.lines import LineIndex
+from md2slack.sizes import METRIC_UNITS, SizeIndex, text_size
+
+__all__ = [
+    "Chunk",
+    "BoundaryIndex",
+    "ChunkResult",
+    "CodeBlockIndex",
+    "Segment",
+    "chunk_content",
+    "chunk_segments",
+    "iter_chunks",
+    "oversized_block_warnings",
+    "split_oversized_code_blocks",
+]
 
 # Slack silently splits messages over ~4046 characters server-side.
 # Use 3900 as default to leave buffer for continuation indicators.
 # See: https://github.com/slackapi/java-slack-sdk/issues/704
 DEFAULT_CHUNK_SIZE = 3900
 MIN_CHUNK_SIZE = 500
+CHUNK_STRATEGIES = ("greedy", "balanced")
+
+# Balanced strategy: cost of ending a chunk on each kind of split, in units
+# of a completely full chunk's size penalty
+_SPLIT_PENALTIES = {"paragraph": 0.0, "sentence": 0.5, "hard": 2.0}
+
+_NON_WHITESPACE = re.compile(r"\S")
+# Boundary text starts: "\n\n" (overlapping runs) and ". ", "! ", "? "
+_PARAGRAPH_BREAK = re.compile(r"\n(?=\n)")
+_SENTENCE_END = re.compile(r"[.!?](?= )")
 
 
 @dataclass
@@ -25,19 +53,25 @@ class Chunk:
     Attributes:
         content: The text content of this chunk
         index: 0-based position in the sequence
-        total: Total number of chunks in the sequence
-        split_type: How this chunk was split: "paragraph", "sentence", "hard", or "none"
+        total: Total number of chunks in the sequence, or None while
+            still unknown (see iter_chunks)
+        split_type: How this chunk was split: "paragraph", "sentence", "hard",
+            "block" (between segments), "end" or "none"
     """
 
     content: str
     index: int
-    total: int
+    total: int | None
     split_type: str
 
     @property
     def indicator(self) -> str:
-        """Return the continuation indicator in (N/M) format."""
-        return f"({self.index + 1}/{self.total})"
+        """Return the continuation indicator in (N/M) format.
+
+        An unknown total is shown as "?".
+        """
+        total = "?" if self.total is None else self.total
+        return f"({self.index + 1}/{total})"
 
     @property
     def with_indicator(self) -> str:
@@ -45,7 +79,7 @@ class Chunk:
 
         Only adds indicator if there are multiple chunks.
         """
-        if self.total <= 1:
+        if self.total is not None and self.total <= 1:
             return self.content
         return f"{self.content}\n{self.indicator}"
 
@@ -70,12 +104,110 @@ class ChunkResult:
         return len(self.chunks)
 
 
-def chunk_content(content: str, max_size: int = DEFAULT_CHUNK_SIZE) -> ChunkResult:
+@dataclass
+class Segment:
+    """A rendered top-level block of a document, for block-wise chunking.
+
+    Attributes:
+        text: Rendered mrkdwn for the block, including trailing newlines
+        kind: Block type: "paragraph", "heading", "list" (one segment per
+            top-level item), "quote", "code", "table", "rule", "html" or
+            "other"
+    """
+
+    text: str
+    kind: str
+
+
+class CodeBlockIndex(Sequence[tuple[int, int]]):
+    """Sorted, non-overlapping code block ranges with O(log n) queries.
+
+    Behaves as a read-only sequence of (start, end) tuples, so it can be
+    used anywhere a list of ranges is expected.
+    """
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        """Build the index.
+
+        Args:
+            ranges: (start, end) tuples for each code block
+        """
+        self._ranges = sorted(ranges)
+        self._starts = [start for start, _ in self._ranges]
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[int, int]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[int, int]]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> tuple[int, int] | list[tuple[int, int]]:
+        return self._ranges[index]
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self._ranges)
+
+    def __repr__(self) -> str:
+        return f"CodeBlockIndex({self._ranges!r})"
+
+    def block_at(self, position: int) -> tuple[int, int] | None:
+        """Return the code block containing position, if any.
+
+        Args:
+            position: Character position to check
+
+        Returns:
+            The (start, end) range containing position, or None
+        """
+        i = bisect_right(self._starts, position) - 1
+        if i >= 0 and position < self._ranges[i][1]:
+            return self._ranges[i]
+        return None
+
+    def contains(self, position: int) -> bool:
+        """Return True if position is inside a code block."""
+        return self.block_at(position) is not None
+
+    def next_block_start(self, position: int) -> int | None:
+        """Return the start of the first code block at or after position.
+
+        Args:
+            position: Character position to search from
+
+        Returns:
+            Start offset of the next code block, or None if there is none
+        """
+        i = bisect_left(self._starts, position)
+        if i < len(self._starts):
+            return self._starts[i]
+        return None
+
+
+def chunk_content(
+    content: str,
+    max_size: int = DEFAULT_CHUNK_SIZE,
+    strategy: str = "greedy",
+    split_code_blocks: bool = False,
+    continued_marker: str | None = None,
+    size_metric: str = "chars",
+) -> ChunkResult:
     """Split content into chunks that fit within the size limit.
 
     Args:
         content: The mrkdwn content to split
         max_size: Maximum characters per chunk (default: 39000)
+        strategy: "greedy" fills each chunk as far as possible; "balanced"
+            minimizes the chunk count, then awkward splits and uneven sizes
+        split_code_blocks: Split code blocks larger than max_size on line
+            boundaries instead of posting them whole
+        continued_marker: Line added after each piece of a split code block
+            except the last (only with split_code_blocks)
+        size_metric: How max_size is measured, one of SIZE_METRICS
 
     Returns:
         ChunkResult containing the chunks and any warnings
@@ -84,90 +216,619 @@ def chunk_content(content: str, max_size: int = DEFAULT_CHUNK_SIZE) -> ChunkResu
         max_size = MIN_CHUNK_SIZE
 
     original_length = len(content)
-    warnings: list[str] = []
 
     # If content fits in one chunk, return as-is
-    if len(content) <= max_size:
+    if text_size(content, size_metric) <= max_size:
         return ChunkResult(
             chunks=[Chunk(content=content, index=0, total=1, split_type="none")],
-            warnings=warnings,
+            warnings=[],
             original_length=original_length,
         )
 
-    # Find all code block boundaries
-    code_block_ranges = find_code_block_boundaries(content)
+    if split_code_blocks:
+        content, warnings = split_oversized_code_blocks(
+            content, max_size, continued_marker, size_metric
+        )
+        code_block_ranges = find_code_block_boundaries(content)
+    else:
+        # Find all code block boundaries once and share them
+        code_block_ranges = find_code_block_boundaries(content)
+        warnings = oversized_block_warnings(
+            content, max_size, code_block_ranges, size_metric
+        )
 
-    # Check for oversized code blocks
-    for start, end in code_block_ranges:
-        block_size = end - start
-        if block_size > max_size:
-            # Find line number for warning
-            line_num = content[:start].count("\n") + 1
-            warnings.append(
-                f"Code block at line {line_num} exceeds chunk size "
-                f"({block_size:,} chars). Block will be posted as-is; "
-                "Slack may truncate."
+    return ChunkResult(
+        chunks=list(
+            iter_chunks(
+                content,
+                max_size,
+                strategy=strategy,
+                code_block_ranges=code_block_ranges,
+                size_metric=size_metric,
             )
+        ),
+        warnings=warnings,
+        original_length=original_length,
+    )
 
-    chunks: list[Chunk] = []
-    remaining = content
-    position = 0
 
-    while remaining:
-        if len(remaining) <= max_size:
-            # Last chunk - fits entirely
-            chunks.append(
-                Chunk(
-                    content=remaining,
-                    index=len(chunks),
-                    total=0,  # Will be updated
-                    split_type="none" if len(chunks) == 0 else "end",
-                )
-            )
-            break
+def iter_chunks(
+    content: str,
+    max_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    strategy: str = "greedy",
+    count_total: bool = True,
+    code_block_ranges: Sequence[tuple[int, int]] | None = None,
+    size_metric: str = "chars",
+) -> Iterator[Chunk]:
+    """Lazily yield chunks that fit within the size limit.
+
+    Chunk text is only sliced out of content as each chunk is requested.
+    With count_total, split points are found in a pre-pass over offsets
+    so every chunk carries the final total. Without it, nothing is
+    computed ahead and total is None until the last chunk. The balanced
+    strategy always plans every split before yielding.
 
-        # Find the best split point
-        split_pos, split_type = find_best_split_point(
-            remaining, max_size, code_block_ranges, position
+    Args:
+        content: The mrkdwn content to split
+        max_size: Maximum characters per chunk
+        strategy: Split strategy, one of CHUNK_STRATEGIES
+        count_total: Resolve total before yielding the first chunk
+        code_block_ranges: Precomputed code block ranges (found if omitted)
+        size_metric: How max_size is measured, one of SIZE_METRICS
+
+    Yields:
+        Chunks in document order
+
+    Raises:
+        ValueError: If strategy or size_metric is unknown
+    """
+    if strategy not in CHUNK_STRATEGIES:
+        raise ValueError(
+            f"Unknown chunk strategy {strategy!r}; "
+            f"expected one of: {', '.join(CHUNK_STRATEGIES)}"
         )
+    if max_size < MIN_CHUNK_SIZE:
+        max_size = MIN_CHUNK_SIZE
 
-        # Create chunk from content up to split point
-        chunk_content_str = remaining[:split_pos].rstrip()
-        if chunk_content_str:  # Skip empty chunks
-            chunks.append(
-                Chunk(
-                    content=chunk_content_str,
-                    index=len(chunks),
-                    total=0,  # Will be updated
-                    split_type=split_type,
-                )
+    sizes = SizeIndex(content, size_metric)
+    if sizes.size() <= max_size:
+        yield Chunk(content=content, index=0, total=1, split_type="none")
+        return
+
+    if code_block_ranges is None:
+        code_block_ranges = find_code_block_boundaries(content)
+    if strategy == "balanced":
+        spans = iter(_balanced_spans(content, max_size, code_block_ranges, sizes))
+    else:
+        spans = _iter_spans(content, max_size, code_block_ranges, sizes)
+
+    if count_total:
+        span_list = list(spans)
+        total = len(span_list)
+        for index, (start, end, split_type) in enumerate(span_list):
+            yield Chunk(
+                content=content[start:end],
+                index=index,
+                total=total,
+                split_type=split_type,
             )
+        return
+
+    # Look one span ahead so the last chunk knows it is last
+    index = 0
+    pending = next(spans, None)
+    while pending is not None:
+        following = next(spans, None)
+        start, end, split_type = pending
+        yield Chunk(
+            content=content[start:end],
+            index=index,
+            total=index + 1 if following is None else None,
+            split_type=split_type,
+        )
+        index += 1
+        pending = following
+
 
-        # Move to remaining content
-        remaining = remaining[split_pos:].lstrip()
-        position += split_pos
+def chunk_segments(
+    segments: Iterable[Segment],
+    max_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    split_code_blocks: bool = False,
+    continued_marker: str | None = None,
+    size_metric: str = "chars",
+) -> ChunkResult:
+    """Pack rendered block segments into chunks.
 
-    # Update total count in all chunks
-    total = len(chunks)
-    for chunk in chunks:
-        chunk.total = total
+    Consecutive segments are packed into a chunk while they fit, so
+    chunks only end between blocks and a list item or block quote is
+    never split. A segment too large for a chunk on its own is chunked
+    by its text, as chunk_content would.
 
-    # Filter out empty chunks
-    chunks = [c for c in chunks if c.content.strip()]
+    Args:
+        segments: Rendered blocks in document order
+        max_size: Maximum size per chunk
+        split_code_blocks: Split oversized code blocks on line boundaries
+        continued_marker: Line added after each piece of a split code block
+        size_metric: How max_size is measured, one of SIZE_METRICS
 
-    # Re-index after filtering
-    for i, chunk in enumerate(chunks):
-        chunk.index = i
-        chunk.total = len(chunks)
+    Returns:
+        ChunkResult containing the chunks and any warnings; chunks ending
+        between two segments have split_type "block"
+    """
+    segments = list(segments)
+    content = "".join(segment.text for segment in segments)
+    if max_size < MIN_CHUNK_SIZE:
+        max_size = MIN_CHUNK_SIZE
 
+    # If content fits in one chunk, return as-is
+    if text_size(content, size_metric) <= max_size:
+        return ChunkResult(
+            chunks=[Chunk(content=content, index=0, total=1, split_type="none")],
+            warnings=[],
+            original_length=len(content),
+        )
+
+    pieces: list[tuple[str, str]] = []
+    warnings: list[str] = []
+    packed: list[str] = []
+    packed_size = 0
+    line = 1
+
+    def flush() -> None:
+        text = "".join(packed).rstrip()
+        if text:
+            pieces.append((text, "block"))
+        packed.clear()
+
+    for segment in segments:
+        segment_size = text_size(segment.text, size_metric)
+        if segment_size > max_size:
+            flush()
+            packed_size = 0
+            text = segment.text
+            if split_code_blocks:
+                text, block_warnings = split_oversized_code_blocks(
+                    text, max_size, continued_marker, size_metric, line
+                )
+            else:
+                block_warnings = oversized_block_warnings(
+                    text, max_size, None, size_metric, line
+                )
+            warnings.extend(block_warnings)
+            for chunk in iter_chunks(text, max_size, size_metric=size_metric):
+                split_type = chunk.split_type
+                if split_type in ("none", "end"):
+                    split_type = "block"
+                pieces.append((chunk.content.rstrip(), split_type))
+        else:
+            if packed and packed_size + segment_size > max_size:
+                flush()
+                packed_size = 0
+            packed.append(segment.text)
+            packed_size += segment_size
+        line += segment.text.count("\n")
+    flush()
+
+    total = len(pieces)
+    chunks = [
+        Chunk(
+            content=text,
+            index=index,
+            total=total,
+            split_type="end" if index == total - 1 else split_type,
+        )
+        for index, (text, split_type) in enumerate(pieces)
+    ]
     return ChunkResult(
         chunks=chunks,
         warnings=warnings,
-        original_length=original_length,
+        original_length=len(content),
     )
 
 
-def find_code_block_boundaries(content: str) -> list[tuple[int, int]]:
+def oversized_block_warnings(
+    content: str,
+    max_size: int = DEFAULT_CHUNK_SIZE,
+    code_block_ranges: Sequence[tuple[int, int]] | None = None,
+    size_metric: str = "chars",
+    first_line: int = 1,
+) -> list[str]:
+    """Return warnings for code blocks too large to fit in one chunk.
+
+    Args:
+        content: The mrkdwn content being chunked
+        max_size: Maximum characters per chunk
+        code_block_ranges: Precomputed code block ranges (found if omitted)
+        size_metric: How max_size is measured, one of SIZE_METRICS
+        first_line: Line number of the first line of content, for messages
+
+    Returns:
+        One warning message per oversized code block
+    """
+    if max_size < MIN_CHUNK_SIZE:
+        max_size = MIN_CHUNK_SIZE
+    if text_size(content, size_metric) <= max_size:
+        return []
+    if code_block_ranges is None:
+        code_block_ranges = find_code_block_boundaries(content)
+
+    warnings: list[str] = []
+    line_index: LineIndex | None = None
+    unit = METRIC_UNITS[size_metric]
+    for block_start, block_end in code_block_ranges:
+        block_size = text_size(content[block_start:block_end], size_metric)
+        if block_size > max_size:
+            # Find line number for warning
+            if line_index is None:
+                line_index = LineIndex(content)
+            line_num = line_index.line_number(block_start) + first_line - 1
+            warnings.append(
+                f"Code block at line {line_num} exceeds chunk size "
+                f"({block_size:,} {unit}). Block will be posted as-is; "
+                "Slack may truncate."
+            )
+    return warnings
+
+
+def split_oversized_code_blocks(
+    content: str,
+    max_size: int = DEFAULT_CHUNK_SIZE,
+    continued_marker: str | None = None,
+    size_metric: str = "chars",
+    first_line: int = 1,
+) -> tuple[str, list[str]]:
+    """Split code blocks larger than max_size into several code blocks.
+
+    Each oversized block is cut on line boundaries into pieces that close
+    the fence and re-open it with the original opening line (keeping any
+    language tag), separated by blank lines so the chunker can split
+    between them. A single line too long to fit is kept whole in its
+    own piece and reported.
+
+    Args:
+        content: The mrkdwn content to rewrite
+        max_size: Maximum characters per piece, fences included
+        continued_marker: Line added after each piece except the last
+        size_metric: How max_size is measured, one of SIZE_METRICS
+        first_line: Line number of the first line of content, for messages
+
+    Returns:
+        Tuple of (rewritten content, warnings for pieces still oversized)
+    """
+    if max_size < MIN_CHUNK_SIZE:
+        max_size = MIN_CHUNK_SIZE
+
+    warnings: list[str] = []
+    parts: list[str] = []
+    line_index: LineIndex | None = None
+    pos = 0
+
+    def measure(text: str) -> int:
+        return text_size(text, size_metric)
+
+    unit = METRIC_UNITS[size_metric]
+    for block_start, block_end in find_code_block_boundaries(content):
+        if measure(content[block_start:block_end]) <= max_size:
+            continue
+        if line_index is None:
+            line_index = LineIndex(content)
+
+        lines = content[block_start:block_end].split("\n")
+        opening = lines[0]
+        closed = len(lines) > 1 and lines[-1].strip().startswith("```")
+        closing = lines[-1] if closed else "```"
+        body = lines[1:-1] if closed else lines[1:]
+
+        marker = f"\n{continued_marker}" if continued_marker else ""
+        # Opening line, closing line and their newlines wrap every piece
+        budget = max_size - measure(opening) - measure(closing) - 2 - measure(marker)
+
+        pieces: list[list[str]] = [[]]
+        size = 0
+        for line in body:
+            line_size = measure(line) + 1
+            if pieces[-1] and size + line_size > budget:
+                pieces.append([])
+                size = 0
+            pieces[-1].append(line)
+            size += line_size
+
+        rendered = []
+        for number, piece in enumerate(pieces, start=1):
+            last = number == len(pieces)
+            text = "\n".join([opening, *piece])
+            if closed or not last:
+                text += f"\n{closing}"
+            if not last:
+                text += marker
+            piece_size = measure(text)
+            if piece_size > max_size:
+                line_num = line_index.line_number(block_start) + first_line - 1
+                warnings.append(
+                    f"Code block at line {line_num} has a line longer than the "
+                    f"chunk size (piece {number} is {piece_size:,} {unit}). It "
+                    "will be posted as-is; Slack may truncate."
+                )
+            rendered.append(text)
+
+        parts.append(content[pos:block_start])
+        parts.append("\n\n".join(rendered))
+        pos = block_end
+
+    if not parts:
+        return content, warnings
+    parts.append(content[pos:])
+    return "".join(parts), warnings
+
+
+def _balanced_spans(
+    content: str,
+    max_size: int,
+    code_block_ranges: Sequence[tuple[int, int]],
+    sizes: SizeIndex,
+) -> list[tuple[int, int, str]]:
+    """Return (start, end, split_type) offsets of an optimal chunking.
+
+    Dynamic programming over split candidates, one chunk at a time: the
+    cost of reaching a split is (chunks so far, penalty so far), so
+    the fewest chunks always wins and the penalty (split type plus the
+    squared fill ratio of each chunk, which favors even sizes) breaks
+    ties. Candidates follow the greedy precedence: paragraph boundaries
+    in reach, else sentence boundaries, else a hard split. Candidates
+    that cannot lead to the greedy chunk count are never visited.
+    """
+    length = len(content)
+    first_text = _NON_WHITESPACE.search(content)
+    if first_text is None:
+        return []
+
+    index = _as_index(code_block_ranges)
+    boundaries = BoundaryIndex(content, index)
+
+    def text_start(split: int) -> int:
+        next_text = _NON_WHITESPACE.search(content, split)
+        return next_text.start() if next_text else length
+
+    def chunk_start(split: int) -> tuple[int, int]:
+        """Return where the chunk after split starts and where its text does."""
+        # The first chunk keeps any leading whitespace, like greedy
+        if split == 0:
+            return 0, first_text.start()
+        start = text_start(split)
+        return start, start
+
+    def fits(split: int) -> bool:
+        """Return whether everything after split fits in one chunk."""
+        start, text = chunk_start(split)
+        return text >= length or sizes.size(start, length) <= max_size
+
+    def reach(split: int) -> int:
+        """Return the furthest candidate after split, the greedy choice."""
+        start, text = chunk_start(split)
+        limit = sizes.limit(start, max_size)
+        target = boundaries.last_paragraph(text, limit)
+        if target is None:
+            target = boundaries.last_sentence(text, limit)
+        if target is None:
+            target = _hard_split(start, limit, index)
+        return target
+
+    def earliest(latest: int, ok: Callable[[int], bool]) -> int:
+        """Return the first position up to latest passing ok, by galloping.
+
+        latest itself is never excluded, so the greedy split stays in
+        bounds even where a boundary rule makes reach() non-monotonic.
+        """
+        good, bad, step = latest, 0, 1
+        while good - step > 0:
+            if not ok(good - step):
+                bad = good - step
+                break
+            good -= step
+            step *= 2
+        while good - bad > 1:
+            middle = (good + bad) // 2
+            if ok(middle):
+                good = middle
+            else:
+                bad = middle
+        return good
+
+    # Bound the split after each chunk: greedy reaches furthest going
+    # forward, and working back from the end gives the earliest split
+    # that still finishes in as few chunks. Only candidates between the
+    # two can be part of a chunking with the fewest chunks, which keeps
+    # the walk narrow on documents with a boundary every few characters.
+    latest = [0]
+    while not fits(latest[-1]):
+        latest.append(reach(latest[-1]))
+    earliest_splits = latest[:]
+    for i in range(len(latest) - 1, 0, -1):
+        if i == len(latest) - 1:
+            first = earliest(latest[i], fits)
+        else:
+            after = earliest_splits[i + 1]
+            first = earliest(latest[i], lambda split: reach(split) >= after)
+        earliest_splits[i] = first
+
+    # Split position -> best (chunks, penalty) for the content before it
+    best: dict[int, tuple[int, float]] = {0: (0, 0.0)}
+    previous: dict[int, tuple[int, str]] = {}
+    final: tuple[tuple[int, float], int] | None = None
+    # Candidate of the next layer -> (penalty, split before it, split type)
+    reached: dict[int, tuple[float, int, str]] = {}
+
+    def offer(target: int, penalty: float, split: int, split_type: str) -> None:
+        known = reached.get(target)
+        if known is None or (penalty, split) < known[:2]:
+            reached[target] = (penalty, split, split_type)
+
+    def relax(split_type: str, group: list[tuple[int, int, int, int]]) -> None:
+        """Offer every candidate of one boundary kind its best split.
+
+        group holds (split, start, text, limit) in document order, so both
+        ends of the splits that can reach a candidate only move forward.
+        The fill penalty is a square of size differences, which keeps the
+        best split monotone too: divide and conquer finds each candidate's
+        leftmost best split without trying every pair.
+        """
+        low, high = earliest_splits[chunks + 1], latest[chunks + 1]
+        text, limit = group[0][2], group[-1][3]
+        if split_type == "paragraph":
+            targets = boundaries.paragraph_splits(
+                max(text, low - 2), min(limit, high + 2)
+            )
+        else:
+            targets = boundaries.sentence_splits(
+                max(text, low - 2), min(limit, high + 2)
+            )
+        # Range of group entries whose window contains each target
+        firsts, lasts = [], []
+        first = last = 0
+        for target in targets:
+            while first < len(group) and group[first][3] < target:
+                first += 1
+            while last < len(group) and group[last][2] <= target - 2:
+                last += 1
+            firsts.append(first)
+            lasts.append(last - 1)
+
+        type_penalty = _SPLIT_PENALTIES[split_type]
+        stack = [(0, len(targets) - 1, 0, len(group) - 1)]
+        while stack:
+            lo, hi, group_lo, group_hi = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            target = targets[mid]
+            choice: tuple[float, int] | None = None
+            for i in range(max(group_lo, firsts[mid]), min(group_hi, lasts[mid]) + 1):
+                split, start = group[i][:2]
+                fill = sizes.size(start, target) / max_size
+                penalty = type_penalty + best[split][1] + fill**2
+                if choice is None or penalty < choice[0]:
+                    choice = (penalty, i)
+            if choice is None:
+                stack.append((lo, mid - 1, group_lo, group_hi))
+                stack.append((mid + 1, hi, group_lo, group_hi))
+                continue
+            penalty, i = choice
+            offer(target, penalty, group[i][0], split_type)
+            stack.append((lo, mid - 1, group_lo, i))
+            stack.append((mid + 1, hi, i, group_hi))
+
+    # Walk layer by layer: every split in a layer ends the same number of
+    # chunks, and the next layer holds the candidates they reach first
+    layer = [0]
+    chunks = 0
+    while layer:
+        groups: dict[str, list[tuple[int, int, int, int]]] = {}
+        for split in layer:
+            penalty = best[split][1]
+            start, text = chunk_start(split)
+
+            if text >= length:
+                # Only whitespace follows; the previous chunk was the last
+                cost = (chunks, penalty)
+            elif (size := sizes.size(start, length)) <= max_size:
+                cost = (chunks + 1, penalty + (size / max_size) ** 2)
+            else:
+                cost = None
+            if cost is not None:
+                if final is None or (cost, split) < final:
+                    final = (cost, split)
+                continue
+            if chunks + 1 >= len(latest):
+                continue
+
+            limit = sizes.limit(start, max_size)
+            if boundaries.last_paragraph(text, limit) is not None:
+                groups.setdefault("paragraph", []).append((split, start, text, limit))
+            elif boundaries.last_sentence(text, limit) is not None:
+                groups.setdefault("sentence", []).append((split, start, text, limit))
+            else:
+                target = _hard_split(start, limit, index)
+                low, high = earliest_splits[chunks + 1], latest[chunks + 1]
+                if low <= target <= high:
+                    fill = sizes.size(start, target) / max_size
+                    penalty = _SPLIT_PENALTIES["hard"] + penalty + fill**2
+                    offer(target, penalty, split, "hard")
+
+        for split_type, group in groups.items():
+            relax(split_type, group)
+        chunks += 1
+        layer = sorted(target for target in reached if target not in best)
+        for target in layer:
+            penalty, split, split_type = reached[target]
+            best[target] = (chunks, penalty)
+            previous[target] = (split, split_type)
+        reached.clear()
+
+    assert final is not None  # the last reachable split always ends the walk
+
+    # Walk the chosen splits back to the start of the document
+    spans: list[tuple[int, int, str]] = []
+    split = final[1]
+    start = 0 if split == 0 else text_start(split)
+    if start < length:
+        spans.append((start, length, "end"))
+    while split:
+        before, split_type = previous[split]
+        start = 0 if before == 0 else text_start(before)
+        end = split
+        while end > start and content[end - 1].isspace():
+            end -= 1
+        spans.append((start, end, split_type))
+        split = before
+    spans.reverse()
+    return spans
+
+
+def _iter_spans(
+    content: str,
+    max_size: int,
+    code_block_ranges: Sequence[tuple[int, int]],
+    sizes: SizeIndex,
+) -> Iterator[tuple[int, int, str]]:
+    """Yield (start, end, split_type) offsets of each non-empty chunk.
+
+    Walks the document by offset without slicing it; trailing whitespace
+    is excluded from each span and leading whitespace is skipped before
+    the next one.
+    """
+    length = len(content)
+    start = 0
+    first = True
+    index = _as_index(code_block_ranges)
+    boundaries = BoundaryIndex(content, index)
+
+    while start < length:
+        if sizes.size(start, length) <= max_size:
+            # Last chunk - fits entirely
+            yield start, length, "none" if first else "end"
+            return
+
+        # Find the best split point
+        split_pos, split_type = find_best_split_point(
+            content, start, max_size, index, boundaries, sizes
+        )
+
+        # Trim trailing whitespace; skip chunks that are empty
+        end = split_pos
+        while end > start and content[end - 1].isspace():
+            end -= 1
+        if end > start:
+            yield start, end, split_type
+            first = False
+
+        # Skip whitespace before the next chunk
+        next_text = _NON_WHITESPACE.search(content, split_pos)
+        start = next_text.start() if next_text else length
+
+
+def find_code_block_boundaries(content: str) -> CodeBlockIndex:
     """Find all code block start/end positions in the content.
 
     Code blocks are delimited by triple backticks (```) on their own lines.
@@ -176,7 +837,7 @@ def find_code_block_boundaries(content: str) -> list[tuple[int, int]]:
         content: The content to scan
 
     Returns:
-        List of (start, end) tuples for each code block
+        CodeBlockIndex of (start, end) ranges for each code block
     """
     boundaries: list[tuple[int, int]] = []
     in_block = False
@@ -204,98 +865,198 @@ def find_code_block_boundaries(content: str) -> list[tuple[int, int]]:
     if in_block:
         boundaries.append((block_start, len(content)))
 
-    return boundaries
+    return CodeBlockIndex(boundaries)
+
+
+def _as_index(code_block_ranges: Sequence[tuple[int, int]]) -> CodeBlockIndex:
+    """Return code_block_ranges as a CodeBlockIndex, building one if needed."""
+    if isinstance(code_block_ranges, CodeBlockIndex):
+        return code_block_ranges
+    return CodeBlockIndex(code_block_ranges)
 
 
 def is_inside_code_block(
-    position: int, code_block_ranges: list[tuple[int, int]]
+    position: int, code_block_ranges: Sequence[tuple[int, int]]
 ) -> bool:
     """Check if a position is inside a code block.
 
     Args:
         position: Character position to check
-        code_block_ranges: List of (start, end) tuples for code blocks
+        code_block_ranges: CodeBlockIndex (or list of (start, end) tuples)
 
     Returns:
         True if position is inside a code block
     """
-    for start, end in code_block_ranges:
-        if start <= position < end:
-            return True
-    return False
+    return _as_index(code_block_ranges).contains(position)
+
+
+class BoundaryIndex:
+    """Paragraph and sentence boundaries of a document, outside code blocks.
+
+    Built with one regex scan per boundary kind (sentences only once first
+    needed), after which the last boundary before any limit is a bisect
+    lookup. Boundaries are stored as the offset of the boundary text
+    ("\\n\\n", or ". ", "! ", "? "); the split position is two characters
+    later.
+    """
+
+    def __init__(
+        self,
+        content: str,
+        code_block_ranges: Sequence[tuple[int, int]] = (),
+        start: int = 0,
+        end: int | None = None,
+    ) -> None:
+        """Scan content[start:end] for boundaries.
+
+        Args:
+            content: The full document
+            code_block_ranges: Code block ranges whose boundaries are ignored
+            start: Position to scan from
+            end: Position to scan up to (default: end of content)
+        """
+        if end is None:
+            end = len(content)
+        self._content = content
+        self._span = (start, end)
+        self._index = _as_index(code_block_ranges)
+        self._paragraphs = self._scan(_PARAGRAPH_BREAK)
+        # Most splits land on paragraphs; sentences are scanned on first use
+        self._sentences: list[int] | None = None
+
+    def _scan(self, pattern: re.Pattern[str]) -> list[int]:
+        """Return sorted offsets of pattern matches outside code blocks."""
+        start, end = self._span
+        positions = [m.start() for m in pattern.finditer(self._content, start, end)]
+        return _outside_blocks(positions, self._index)
+
+    def last_paragraph(self, start: int, limit: int) -> int | None:
+        """Return the last paragraph split position in content[start:limit].
+
+        Args:
+            start: Position the chunk begins at
+            limit: Maximum split position
+
+        Returns:
+            Position after the paragraph boundary, or None if not found
+        """
+        return _last_split(self._paragraphs, start, limit)
+
+    def last_sentence(self, start: int, limit: int) -> int | None:
+        """Return the last sentence split position in content[start:limit].
+
+        Args:
+            start: Position the chunk begins at
+            limit: Maximum split position
+
+        Returns:
+            Position after the sentence boundary, or None if not found
+        """
+        if self._sentences is None:
+            self._sentences = self._scan(_SENTENCE_END)
+        return _last_split(self._sentences, start, limit)
+
+    def paragraph_splits(self, start: int, limit: int) -> list[int]:
+        """Return every paragraph split position in content[start:limit]."""
+        return _splits_between(self._paragraphs, start, limit)
+
+    def sentence_splits(self, start: int, limit: int) -> list[int]:
+        """Return every sentence split position in content[start:limit]."""
+        if self._sentences is None:
+            self._sentences = self._scan(_SENTENCE_END)
+        return _splits_between(self._sentences, start, limit)
+
+
+def _outside_blocks(positions: list[int], index: CodeBlockIndex) -> list[int]:
+    """Drop sorted positions that fall inside a code block."""
+    if not index:
+        return positions
+    kept: list[int] = []
+    previous_end = 0
+    for block_start, block_end in index:
+        kept.extend(
+            positions[
+                bisect_left(positions, previous_end) : bisect_left(
+                    positions, block_start
+                )
+            ]
+        )
+        previous_end = block_end
+    kept.extend(positions[bisect_left(positions, previous_end) :])
+    return kept
+
+
+def _splits_between(positions: list[int], start: int, limit: int) -> list[int]:
+    """Return the splits after every boundary in [start, limit - 2]."""
+    lo = bisect_left(positions, start)
+    hi = bisect_right(positions, limit - 2)
+    return [pos + 2 for pos in positions[lo:hi]]
+
+
+def _last_split(positions: list[int], start: int, limit: int) -> int | None:
+    """Return the split after the last boundary in [start, limit - 2]."""
+    i = bisect_right(positions, limit - 2) - 1
+    if i >= 0 and positions[i] >= start:
+        return positions[i] + 2
+    return None
 
 
 def find_paragraph_boundary(
-    content: str, max_pos: int, code_block_ranges: list[tuple[int, int]], offset: int
+    content: str,
+    max_pos: int,
+    code_block_ranges: Sequence[tuple[int, int]],
+    start: int = 0,
 ) -> int | None:
-    """Find the last paragraph boundary (\\n\\n) before max_pos.
+    """Find the last paragraph boundary (\\n\\n) in content[start:max_pos].
 
     Only considers boundaries that are not inside code blocks.
-    Prefers boundaries in the last 50% of the search range but will search
-    further back if needed to find a valid split point.
 
     Args:
-        content: Content to search
+        content: The full document
         max_pos: Maximum position to search up to
         code_block_ranges: Code block ranges to avoid
-        offset: Offset of content in original document
+        start: Position to search from
 
     Returns:
         Position after the paragraph boundary (for splitting), or None if not found
     """
-    # Search the entire range for \n\n, starting from the end
-    pos = content.rfind("\n\n", 0, max_pos)
-
-    while pos >= 0:
-        # Check if this position is inside a code block
-        if not is_inside_code_block(pos + offset, code_block_ranges):
-            return pos + 2  # Split after the newlines
-        # Keep searching backward
-        pos = content.rfind("\n\n", 0, pos)
-
-    return None
+    boundaries = BoundaryIndex(content, code_block_ranges, start, max_pos)
+    return boundaries.last_paragraph(start, max_pos)
 
 
 def find_sentence_boundary(
-    content: str, max_pos: int, code_block_ranges: list[tuple[int, int]], offset: int
+    content: str,
+    max_pos: int,
+    code_block_ranges: Sequence[tuple[int, int]],
+    start: int = 0,
 ) -> int | None:
-    """Find the last sentence boundary before max_pos.
+    """Find the last sentence boundary in content[start:max_pos].
 
     Sentence boundaries are: ". ", "! ", "? "
     Only considers boundaries that are not inside code blocks.
 
     Args:
-        content: Content to search
+        content: The full document
         max_pos: Maximum position to search up to
         code_block_ranges: Code block ranges to avoid
-        offset: Offset of content in original document
+        start: Position to search from
 
     Returns:
         Position after the sentence boundary, or None if not found
     """
-    # Find best sentence ending in the entire range
-    best_pos = None
-
-    for ending in [". ", "! ", "? "]:
-        pos = content.rfind(ending, 0, max_pos)
-        while pos >= 0:
-            if not is_inside_code_block(pos + offset, code_block_ranges):
-                if best_pos is None or pos > best_pos:
-                    best_pos = pos + 2  # Split after the ending
-                break
-            # Keep searching backward
-            pos = content.rfind(ending, 0, pos)
-
-    return best_pos
+    boundaries = BoundaryIndex(content, code_block_ranges, start, max_pos)
+    return boundaries.last_sentence(start, max_pos)
 
 
 def find_best_split_point(
     content: str,
+    start: int,
     max_size: int,
-    code_block_ranges: list[tuple[int, int]],
-    offset: int,
+    code_block_ranges: Sequence[tuple[int, int]],
+    boundaries: BoundaryIndex | None = None,
+    sizes: SizeIndex | None = None,
 ) -> tuple[int, str]:
-    """Find the best position to split content.
+    """Find the best position to end a chunk that begins at start.
 
     Priority:
     1. Paragraph boundary (\\n\\n)
@@ -303,37 +1064,43 @@ def find_best_split_point(
     3. Hard split at max_size
 
     Args:
-        content: Content to split
+        content: The full document
+        start: Position where the chunk begins
         max_size: Maximum chunk size
         code_block_ranges: Code block ranges to avoid splitting
-        offset: Offset of content in original document
+        boundaries: Prebuilt BoundaryIndex for the document (if omitted,
+            only content[start:start + max_size] is scanned)
+        sizes: SizeIndex measuring max_size (default: characters)
 
     Returns:
-        Tuple of (split_position, split_type)
+        Tuple of (split_position, split_type), with the position in
+        document coordinates
     """
+    index = _as_index(code_block_ranges)
+    limit = start + max_size if sizes is None else sizes.limit(start, max_size)
+    if boundaries is None:
+        boundaries = BoundaryIndex(content, index, start, limit)
+
     # Try paragraph boundary first
-    para_pos = find_paragraph_boundary(content, max_size, code_block_ranges, offset)
-    if para_pos is not None and para_pos > 0:
+    para_pos = boundaries.last_paragraph(start, limit)
+    if para_pos is not None:
         return para_pos, "paragraph"
 
     # Try sentence boundary
-    sent_pos = find_sentence_boundary(content, max_size, code_block_ranges, offset)
-    if sent_pos is not None and sent_pos > 0:
+    sent_pos = boundaries.last_sentence(start, limit)
+    if sent_pos is not None:
         return sent_pos, "sentence"
 
     # Last resort: hard split
-    # Try to avoid splitting inside a code block
-    split_pos = max_size
-
-    # If we're about to split inside a code block, try to find the block start
-    if is_inside_code_block(split_pos + offset, code_block_ranges):
-        # Find which block we're in and split before it
-        for start, end in code_block_ranges:
-            if start <= split_pos + offset < end:
-                # Split just before the code block if possible
-                if start - offset > MIN_CHUNK_SIZE // 2:
-                    return start - offset, "hard"
-                # Otherwise we have to split inside (oversized block case)
-                break
+    return _hard_split(start, limit, index), "hard"
+
+
+def _hard_split(start: int, limit: int, index: CodeBlockIndex) -> int:
+    """Return where to hard split a chunk with no natural boundary by limit."""
+    # If we're about to split inside a code block, split before it if possible
+    block = index.block_at(limit)
+    if block is not None and block[0] - start > MIN_CHUNK_SIZE // 2:
+        return block[0]
 
-    return split_pos, "hard"
+    # Otherwise we have to split inside (oversized block case)
+    return limit
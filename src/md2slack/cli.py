@@ -1,22 +1,41 @@
-"""CLI entry point for md2slack."""
+"""CLI entry point for md2slack.
+
+Heavy modules (the mistune-based converter and the slack_sdk client) are
+imported inside the commands that need them, so ``--help`` and
+``convert`` start quickly.
+"""
 
 from __future__ import annotations
 
 import re
 import sys
-import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from md2slack.chunker import DEFAULT_CHUNK_SIZE, MIN_CHUNK_SIZE, chunk_content
-from md2slack.converter import convert as convert_markdown
-from md2slack.slack import (
-    SlackClient,
-    SlackError,
-    get_token,
-    parse_thread_url,
+from md2slack.chunker import (
+    CHUNK_STRATEGIES,
+    DEFAULT_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    Chunk,
+    Segment,
+    chunk_segments,
+    find_code_block_boundaries,
+    iter_chunks,
+    oversized_block_warnings,
+    split_oversized_code_blocks,
 )
+from md2slack.lines import LineIndex
+from md2slack.sizes import SIZE_METRICS
+
+if TYPE_CHECKING:
+    from md2slack.cache import ConversionCache
+    from md2slack.converter import Converter
+    from md2slack.journal import PostJournal
+    from md2slack.slack import SlackClient, SlackError, ThreadReference
 
 
 def parse_line_range(
@@ -65,21 +84,44 @@ def parse_line_range(
     return (start, end)
 
 
-def extract_lines(content: str, start: int, end: int) -> str:
+def extract_lines(
+    content: str, start: int, end: int, index: LineIndex | None = None
+) -> str:
     """Extract a range of lines from content.
 
     Args:
         content: The full content string
         start: First line to include (1-indexed)
         end: Last line to include (1-indexed, inclusive)
+        index: Prebuilt LineIndex for content (built if omitted)
 
     Returns:
         String containing only the specified lines
     """
-    lines = content.splitlines(keepends=True)
-    # Convert to 0-indexed, end is inclusive so we use end (not end-1)
-    selected = lines[start - 1 : end]
-    return "".join(selected)
+    if index is None:
+        index = LineIndex(content)
+    start_offset, end_offset = index.line_span(start, end)
+    return content[start_offset:end_offset]
+
+
+def select_lines(content: str, lines: tuple[int, int], source: str) -> str:
+    """Validate a --lines range against content and extract it.
+
+    Args:
+        content: The full content string
+        lines: Tuple of (start, end) line numbers (1-indexed, inclusive)
+        source: Description of input source for error message
+
+    Returns:
+        String containing only the specified lines
+
+    Raises:
+        click.ClickException: If range extends beyond total line count
+    """
+    start, end = lines
+    index = LineIndex(content)
+    validate_line_range(start, end, index.line_count, source)
+    return extract_lines(content, start, end, index)
 
 
 def validate_line_range(
@@ -111,11 +153,71 @@ def cli(ctx: click.Context) -> None:
         click.echo(ctx.get_help())
 
 
+cache_option = click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Reuse cached conversions (stored under ~/.cache/md2slack)",
+)
+cache_stats_option = click.option(
+    "--cache-stats",
+    is_flag=True,
+    help="Print conversion cache hit/miss counters to stderr (implies --cache)",
+)
+
+
+def make_cache(
+    use_cache: bool, cache_stats: bool, converter: Converter | None = None
+) -> ConversionCache | None:
+    """Create the conversion cache requested by --cache/--cache-stats.
+
+    Args:
+        use_cache: Whether --cache was given
+        cache_stats: Whether --cache-stats was given
+        converter: Converter to cache results for (default: shared one)
+
+    Returns:
+        A ConversionCache backed by the default cache directory, or None
+    """
+    if not (use_cache or cache_stats):
+        return None
+    from md2slack.cache import ConversionCache, default_cache_dir
+
+    return ConversionCache(converter, directory=default_cache_dir())
+
+
+def report_cache_stats(cache: ConversionCache | None) -> None:
+    """Print cache hit/miss counters to stderr."""
+    if cache is None:
+        return
+    stats = cache.stats
+    click.echo(
+        f"Cache: {stats.hits} hits ({stats.disk_hits} from disk), "
+        f"{stats.misses} misses",
+        err=True,
+    )
+
+
+def output_path_for(file: str) -> Path:
+    """Return the side-by-side output path for a converted file.
+
+    Args:
+        file: Input markdown path (e.g., notes.md)
+
+    Returns:
+        Path with a .mrkdwn suffix next to the input (e.g., notes.mrkdwn)
+    """
+    path = Path(file)
+    if path.suffix == ".mrkdwn":
+        return path.with_name(f"{path.name}.mrkdwn")
+    return path.with_suffix(".mrkdwn")
+
+
 @cli.command()
 @click.argument(
-    "file",
+    "files",
+    nargs=-1,
     type=click.Path(exists=True, dir_okay=False, readable=True),
-    required=False,
 )
 @click.option("--text", "-t", help="Markdown text to convert (alternative to file)")
 @click.option(
@@ -124,38 +226,293 @@ def cli(ctx: click.Context) -> None:
     callback=parse_line_range,
     help="Extract only specified line range (1-indexed, inclusive). Format: START-END",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for converting several files (default: CPU count)",
+)
+@cache_option
+@cache_stats_option
 def convert(
-    file: str | None, text: str | None, lines: tuple[int, int] | None
+    files: tuple[str, ...],
+    text: str | None,
+    lines: tuple[int, int] | None,
+    jobs: int | None,
+    use_cache: bool,
+    cache_stats: bool,
 ) -> None:
     """Convert markdown to Slack mrkdwn format.
 
     Reads markdown from FILE or --text and outputs Slack mrkdwn.
     If no input is provided, reads from stdin.
+
+    With several FILES, each is converted in parallel and written next to
+    its input with a .mrkdwn suffix (e.g., notes.md -> notes.mrkdwn).
     """
     # Validate --lines cannot be used with --text
     if lines and text:
         raise click.UsageError("--lines requires file or stdin input, not --text")
 
+    from md2slack.converter import convert as convert_markdown
+    from md2slack.converter import convert_stream
+
+    if len(files) > 1:
+        if text or lines or use_cache or cache_stats:
+            raise click.UsageError(
+                "--text, --lines and --cache cannot be used with multiple files"
+            )
+        convert_files(files, jobs)
+        return
+
+    file = files[0] if files else None
+    cache = make_cache(use_cache, cache_stats)
+
     if text:
         markdown = text
-    elif file:
-        markdown = Path(file).read_text(encoding="utf-8")
-        input_source = "File"
-    elif not sys.stdin.isatty():
-        markdown = sys.stdin.read()
-        input_source = "Input"
-    else:
+    elif not file and sys.stdin.isatty():
         raise click.UsageError("Provide FILE, --text, or pipe markdown to stdin")
+    elif lines or cache:
+        # Line ranges and cache keys need the whole input
+        if file:
+            markdown = Path(file).read_text(encoding="utf-8")
+            input_source = "File"
+        else:
+            markdown = sys.stdin.read()
+            input_source = "Input"
+    else:
+        # Stream block by block so large inputs convert in bounded memory
+        if file:
+            with open(file, encoding="utf-8") as stream:
+                for fragment in convert_stream(stream):
+                    click.echo(fragment, nl=False)
+        else:
+            for fragment in convert_stream(sys.stdin):
+                click.echo(fragment, nl=False)
+        return
 
     # Extract line range if specified
     if lines:
-        start, end = lines
-        total_lines = len(markdown.splitlines())
-        validate_line_range(start, end, total_lines, input_source)
-        markdown = extract_lines(markdown, start, end)
+        markdown = select_lines(markdown, lines, input_source)
 
-    result = convert_markdown(markdown)
+    if cache:
+        result = cache.convert(markdown)
+    else:
+        result = convert_markdown(markdown)
     click.echo(result, nl=False)
+    if cache_stats:
+        report_cache_stats(cache)
+
+
+def convert_files(files: tuple[str, ...], jobs: int | None) -> None:
+    """Convert several files in parallel, writing outputs side by side.
+
+    Args:
+        files: Input markdown paths
+        jobs: Number of worker processes (None for CPU count)
+    """
+    from md2slack.converter import convert_batch
+
+    documents = [Path(file).read_text(encoding="utf-8") for file in files]
+    results = convert_batch(documents, workers=jobs)
+    for file, result in zip(files, results):
+        output_path = output_path_for(file)
+        output_path.write_text(result, encoding="utf-8")
+        click.echo(f"Wrote {output_path}", err=True)
+
+
+def convert_cached(
+    converter: Converter, markdown: str, use_cache: bool, cache_stats: bool
+) -> str:
+    """Convert markdown, through the cache when --cache/--cache-stats is given.
+
+    Args:
+        converter: Converter to use
+        markdown: Markdown to convert
+        use_cache: Whether --cache was given
+        cache_stats: Whether --cache-stats was given
+
+    Returns:
+        Converted mrkdwn
+    """
+    cache = make_cache(use_cache, cache_stats, converter)
+    mrkdwn = cache.convert(markdown) if cache else converter.convert(markdown)
+    if cache_stats:
+        report_cache_stats(cache)
+    return mrkdwn
+
+
+def chunk_text(
+    mrkdwn: str,
+    prefix_text: str,
+    chunk_size: int,
+    chunk_strategy: str,
+    split_code_blocks: bool,
+    continued_marker: str | None,
+    size_metric: str,
+) -> tuple[Iterator[Chunk], list[str]]:
+    """Chunk converted mrkdwn lazily for posting.
+
+    Args:
+        mrkdwn: Converted content
+        prefix_text: Text prepended before the content
+        chunk_size: Maximum size per chunk
+        chunk_strategy: Text chunk strategy (greedy or balanced)
+        split_code_blocks: Split oversized code blocks on line boundaries
+        continued_marker: Line added after each piece of a split code block
+        size_metric: How chunk_size is measured
+
+    Returns:
+        Tuple of (chunk iterator, warnings)
+    """
+    mrkdwn = prefix_text + mrkdwn
+
+    # Optionally split code blocks too large for one message
+    if split_code_blocks:
+        mrkdwn, warnings = split_oversized_code_blocks(
+            mrkdwn, chunk_size, continued_marker, size_metric
+        )
+        code_block_ranges = find_code_block_boundaries(mrkdwn)
+    else:
+        code_block_ranges = find_code_block_boundaries(mrkdwn)
+        warnings = oversized_block_warnings(
+            mrkdwn, chunk_size, code_block_ranges, size_metric
+        )
+
+    # Chunk content lazily (always enabled - handles both long and short
+    # content); split points are found up front so totals are known
+    chunks = iter_chunks(
+        mrkdwn,
+        chunk_size,
+        strategy=chunk_strategy,
+        code_block_ranges=code_block_ranges,
+        size_metric=size_metric,
+    )
+    return chunks, warnings
+
+
+def read_thread_urls(path: str) -> list[str]:
+    """Read thread URLs from a file, one per line.
+
+    Blank lines and lines starting with # are ignored.
+
+    Args:
+        path: File listing thread URLs
+
+    Returns:
+        The URLs in file order
+    """
+    urls = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
+
+
+@dataclass
+class PostOutcome:
+    """Result of posting chunks to one thread.
+
+    Attributes:
+        url: Thread URL as given
+        total: Number of chunks in the post
+        posted: Chunks delivered, including those skipped by --resume
+        skipped: Chunks an earlier run had already delivered
+        permalink: Link to the last delivered chunk
+        error: The Slack error that stopped the post, if any
+        message: Why the post stopped, if it did (a Slack error's message,
+            or e.g. a journal that does not match the chunks)
+    """
+
+    url: str
+    total: int = 0
+    posted: int = 0
+    skipped: int = 0
+    permalink: str | None = None
+    error: SlackError | None = None
+    message: str | None = None
+
+
+def post_to_thread(
+    client: SlackClient,
+    thread_ref: ThreadReference,
+    chunks: Iterable[Chunk],
+    journal: PostJournal,
+    resume: bool,
+    url: str = "",
+    show_progress: bool = True,
+) -> PostOutcome:
+    """Post chunks to one thread in order, journaling each delivered chunk.
+
+    Args:
+        client: Client to post with
+        thread_ref: Thread to post to
+        chunks: Chunks to post
+        journal: Journal of this post for this thread
+        resume: Skip chunks the journal already holds; otherwise the
+            journal is started afresh
+        url: Thread URL, for reporting
+        show_progress: Print a progress line before each chunk
+
+    Returns:
+        PostOutcome describing what was delivered
+
+    Raises:
+        click.ClickException: If the journal does not match the chunks
+    """
+    from md2slack.journal import JournalEntry, chunk_digest
+    from md2slack.slack import SlackError
+
+    if resume:
+        posted = journal.load()
+    else:
+        posted = {}
+        journal.remove()
+
+    outcome = PostOutcome(url)
+    try:
+        for c in chunks:
+            outcome.total = c.total or 0
+            text = c.with_indicator
+            digest = chunk_digest(text)
+
+            entry = posted.get(c.index)
+            if entry is not None:
+                if entry.digest != digest:
+                    raise click.ClickException(
+                        "The journal for this post does not match its "
+                        "chunks; post again without --resume"
+                    )
+                outcome.permalink = entry.permalink
+                outcome.posted += 1
+                outcome.skipped += 1
+                continue
+
+            # Progress output to stderr
+            if show_progress and outcome.total > 1:
+                click.echo(
+                    f"Posting chunk {c.index + 1}/{outcome.total}...", err=True
+                )
+
+            result = client.post_message(
+                channel_id=thread_ref.channel_id,
+                thread_ts=thread_ref.thread_ts,
+                text=text,
+            )
+            journal.record(
+                JournalEntry(c.index, digest, result["ts"], result["permalink"])
+            )
+            outcome.permalink = result["permalink"]
+            outcome.posted += 1
+    except SlackError as e:
+        outcome.error = e
+        outcome.message = e.message
+        return outcome
+
+    journal.remove()
+    return outcome
 
 
 @cli.command()
@@ -167,8 +524,15 @@ def convert(
 @click.option(
     "--thread",
     "-t",
-    required=True,
-    help="Slack thread URL (copy from Slack)",
+    "threads",
+    multiple=True,
+    help="Slack thread URL (copy from Slack); repeat to post to several threads",
+)
+@click.option(
+    "--threads-file",
+    type=click.Path(exists=True, dir_okay=False, readable=True),
+    default=None,
+    help="File of thread URLs to post to, one per line (# starts a comment)",
 )
 @click.option(
     "--prefix",
@@ -188,24 +552,90 @@ def convert(
     default=DEFAULT_CHUNK_SIZE,
     help=f"Max chars per chunk (min: {MIN_CHUNK_SIZE}, default: {DEFAULT_CHUNK_SIZE})",
 )
+@click.option(
+    "--chunk-strategy",
+    type=click.Choice([*CHUNK_STRATEGIES, "blocks"]),
+    default="greedy",
+    show_default=True,
+    help="greedy fills each chunk; balanced uses the fewest, most even "
+    "chunks; blocks packs whole rendered blocks (never splits list items "
+    "or quotes)",
+)
+@click.option(
+    "--split-code-blocks",
+    is_flag=True,
+    help="Split code blocks longer than a chunk on line boundaries",
+)
+@click.option(
+    "--continued-marker",
+    default=None,
+    help="Line added after each piece of a split code block (e.g. '(continued)')",
+)
+@click.option(
+    "--size-metric",
+    type=click.Choice(SIZE_METRICS),
+    default="chars",
+    show_default=True,
+    help="How --chunk-size is measured: code points, UTF-8 bytes, UTF-16 "
+    "units or length with &, <, > escaped",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Threads posted to concurrently when posting to several threads",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip chunks an interrupted run of the same post already delivered",
+)
+@click.option(
+    "--rate",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Max messages per second to each channel (default: 1, allowing "
+    "short bursts)",
+)
+@click.option(
+    "--workspace-rate",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Max messages per second across all channels (default: 5)",
+)
 @click.option(
     "--lines",
     "-l",
     callback=parse_line_range,
     help="Extract only specified line range (1-indexed, inclusive). Format: START-END",
 )
+@cache_option
+@cache_stats_option
 def post(
     file: str | None,
-    thread: str,
+    threads: tuple[str, ...],
+    threads_file: str | None,
     prefix: str | None,
     dry_run: bool,
     chunk_size: int,
+    chunk_strategy: str,
+    split_code_blocks: bool,
+    continued_marker: str | None,
+    size_metric: str,
+    rate: float | None,
+    workspace_rate: float | None,
+    jobs: int,
+    resume: bool,
     lines: tuple[int, int] | None,
+    use_cache: bool,
+    cache_stats: bool,
 ) -> None:
-    """Post markdown content to a Slack thread.
+    """Post markdown content to one or more Slack threads.
 
     Reads markdown from FILE (or stdin), converts to Slack mrkdwn format,
-    and posts to the specified thread. Long content is automatically split
+    and posts to the specified threads. Long content is automatically split
     into multiple messages.
 
     Examples:
@@ -215,14 +645,34 @@ def post(
       cat update.md | md2slack post -t "https://..."
 
       md2slack post -t "https://..." -p "Weekly Update:" file.md --dry-run
+
+      md2slack post --threads-file team-threads.txt digest.md
+
+    Content is converted and chunked once, then posted to every thread
+    concurrently; each thread receives its chunks in order.
+
+    Every delivered chunk is recorded in a journal under the cache
+    directory; if a post fails midway, run the same command with --resume
+    to post only the remaining chunks.
     """
+    from md2slack.cache import default_cache_dir
+    from md2slack.converter import Converter
+    from md2slack.journal import PostJournal, journal_key
+    from md2slack.slack import RateLimiter, SlackClient, get_token, parse_thread_url
+
     # Validate chunk-size
     if chunk_size < MIN_CHUNK_SIZE:
         raise click.UsageError(
             f"--chunk-size must be at least {MIN_CHUNK_SIZE} characters"
         )
+    if not threads and not threads_file:
+        raise click.UsageError("Provide --thread or --threads-file")
     # Cap chunk-size at Slack's limit
     chunk_size = min(chunk_size, DEFAULT_CHUNK_SIZE)
+    if chunk_strategy == "blocks" and (use_cache or cache_stats):
+        raise click.UsageError(
+            "--cache/--cache-stats cannot be used with --chunk-strategy blocks"
+        )
 
     # Read input
     if file:
@@ -236,40 +686,68 @@ def post(
 
     # Extract line range if specified
     if lines:
-        start, end = lines
-        total_lines = len(markdown.splitlines())
-        validate_line_range(start, end, total_lines, input_source)
-        markdown = extract_lines(markdown, start, end)
+        markdown = select_lines(markdown, lines, input_source)
 
-    # Parse thread URL
+    # Parse thread URLs, posting once to each distinct thread
+    urls = list(threads)
+    if threads_file:
+        urls += read_thread_urls(threads_file)
     try:
-        thread_ref = parse_thread_url(thread)
+        thread_refs = {url: parse_thread_url(url) for url in urls}
     except ValueError as e:
         raise click.ClickException(str(e)) from e
-
-    # Convert markdown to mrkdwn
-    mrkdwn = convert_markdown(markdown)
-
-    # Apply prefix if provided
-    if prefix:
-        # Handle escaped newlines in prefix
-        prefix_text = prefix.replace("\\n", "\n")
-        mrkdwn = prefix_text + mrkdwn
-
-    # Chunk content (always enabled - handles both long and short content)
-    chunk_result = chunk_content(mrkdwn, max_size=chunk_size)
+    targets = list(
+        {(r.channel_id, r.thread_ts): (url, r) for url, r in thread_refs.items()}
+        .values()
+    )
+    if not targets:
+        raise click.UsageError(f"No thread URLs in {threads_file}")
+
+    # Handle escaped newlines in prefix
+    prefix_text = prefix.replace("\\n", "\n") if prefix else ""
+
+    # Convert markdown to mrkdwn, splitting large tables so that every
+    # table code block fits in a chunk
+    converter = Converter(max_table_size=chunk_size, size_metric=size_metric)
+
+    if chunk_strategy == "blocks":
+        # Pack rendered top-level blocks instead of rescanning the text
+        segments = converter.convert_segments(markdown)
+        if prefix_text:
+            segments.insert(0, Segment(prefix_text, "paragraph"))
+        chunk_result = chunk_segments(
+            segments,
+            chunk_size,
+            split_code_blocks=split_code_blocks,
+            continued_marker=continued_marker,
+            size_metric=size_metric,
+        )
+        chunks: Iterable[Chunk] = chunk_result.chunks
+        warnings = chunk_result.warnings
+    else:
+        chunks, warnings = chunk_text(
+            convert_cached(converter, markdown, use_cache, cache_stats),
+            prefix_text,
+            chunk_size,
+            chunk_strategy,
+            split_code_blocks,
+            continued_marker,
+            size_metric,
+        )
 
     # Display any warnings
-    for warning in chunk_result.warnings:
+    for warning in warnings:
         click.echo(f"Warning: {warning}", err=True)
 
     # Dry run: show chunks with break markers
     if dry_run:
         click.echo("--- DRY RUN (not posting) ---", err=True)
-        for i, c in enumerate(chunk_result.chunks):
-            click.echo(c.with_indicator)
-            if i < len(chunk_result.chunks) - 1:
+        if len(targets) > 1:
+            click.echo(f"Would post to {len(targets)} threads", err=True)
+        for c in chunks:
+            if c.index > 0:
                 click.echo("--- CHUNK BREAK ---", err=True)
+            click.echo(c.with_indicator)
         click.echo("--- END DRY RUN ---", err=True)
         return
 
@@ -279,52 +757,144 @@ def post(
     except ValueError as e:
         raise click.ClickException(str(e)) from e
 
-    # Post chunks sequentially
-    chunks_posted = 0
-    try:
-        client = SlackClient(token)
+    # One limiter paces every target: each channel has its own bucket and
+    # every post also draws from a workspace-wide one, so posting to many
+    # threads at once stays within Slack's limits
+    limits: dict[str, float] = {}
+    if rate is not None:
+        limits["rate"] = rate
+    if workspace_rate is not None:
+        limits["workspace_rate"] = workspace_rate
+    limiter = RateLimiter(**limits)
+
+    def post_target(url: str, thread_ref: ThreadReference) -> PostOutcome:
+        client = SlackClient(token, rate_limiter=limiter)
         client.set_workspace(thread_ref.workspace or "slack")
-
-        last_permalink = None
-
-        for i, c in enumerate(chunk_result.chunks):
-            if i > 0:
-                # Rate limiting: 1 second delay between posts
-                time.sleep(1)
-
-            # Progress output to stderr
-            if chunk_result.chunk_count > 1:
+        # Journal delivered chunks so an interrupted post can be resumed;
+        # the key covers everything that determines the chunks
+        journal = PostJournal.for_post(
+            default_cache_dir(),
+            journal_key(
+                f"{thread_ref.channel_id}/{thread_ref.thread_ts}",
+                converter.fingerprint,
+                markdown,
+                prefix_text,
+                f"{chunk_size} {chunk_strategy} {size_metric} {split_code_blocks}",
+                continued_marker or "",
+            ),
+        )
+        try:
+            return post_to_thread(
+                client,
+                thread_ref,
+                chunks,
+                journal,
+                resume,
+                url=url,
+                show_progress=len(targets) == 1,
+            )
+        except click.ClickException as e:
+            # Keep the other threads' reports when one journal is stale
+            return PostOutcome(url, message=e.format_message())
+
+    if len(targets) == 1:
+        # Post chunks sequentially; the client's rate limiter paces the posts
+        outcome = post_target(*targets[0])
+        if outcome.message is None:
+            if outcome.skipped:
                 click.echo(
-                    f"Posting chunk {i + 1}/{chunk_result.chunk_count}...",
+                    f"Skipped {outcome.skipped} chunks already posted "
+                    "by an earlier run.",
                     err=True,
                 )
+            if outcome.total > 1:
+                click.echo(
+                    f"Posted {outcome.total} chunks to thread: {outcome.permalink}"
+                )
+            else:
+                click.echo(f"Posted to thread: {outcome.permalink}")
+            return
 
-            result = client.post_message(
-                channel_id=thread_ref.channel_id,
-                thread_ts=thread_ref.thread_ts,
-                text=c.with_indicator,
-            )
-            last_permalink = result["permalink"]
-            chunks_posted += 1
-
-        # Success summary
-        if chunk_result.chunk_count > 1:
+        # Report partial success on error
+        error = outcome.error
+        if error is None:
+            raise click.ClickException(outcome.message)
+        if outcome.posted > 0:
             click.echo(
-                f"Posted {chunk_result.chunk_count} chunks to thread: "
-                f"{last_permalink}"
+                f"Error posting chunk {outcome.posted + 1}/{outcome.total}: "
+                f"{error.message}",
+                err=True,
             )
-        else:
-            click.echo(f"Posted to thread: {last_permalink}")
-
-    except SlackError as e:
-        # Report partial success on error
-        if chunks_posted > 0:
-            total = chunk_result.chunk_count
             click.echo(
-                f"Error posting chunk {chunks_posted + 1}/{total}: {e.message}",
+                f"Chunks 1-{outcome.posted} posted successfully. "
+                "Run again with --resume to post the rest.",
                 err=True,
             )
+        raise click.ClickException(f"{error.message}\nHint: {error.hint}")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Several threads: chunk once, then post to the threads concurrently;
+    # each thread still receives its chunks in order
+    chunks = list(chunks)
+    click.echo(f"Posting {len(chunks)} chunks to {len(targets)} threads...", err=True)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        outcomes = list(executor.map(lambda target: post_target(*target), targets))
+
+    failed = [o for o in outcomes if o.message is not None]
+    for o in outcomes:
+        if o.message is None:
+            click.echo(f"Posted to {o.url}: {o.permalink}")
+        elif o.error is None:
+            click.echo(f"Failed {o.url}: {o.message}", err=True)
+        else:
             click.echo(
-                f"Chunks 1-{chunks_posted} posted successfully.", err=True
+                f"Failed {o.url} after {o.posted}/{o.total} chunks: {o.message}",
+                err=True,
             )
-        raise click.ClickException(f"{e.message}\nHint: {e.hint}") from e
+    if failed:
+        raise click.ClickException(
+            f"Failed to post to {len(failed)} of {len(outcomes)} threads. "
+            "Run again with --resume to finish them without duplicates."
+        )
+    click.echo(f"Posted {len(chunks)} chunks to {len(outcomes)} threads")
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Listen on this Unix domain socket instead of stdin/stdout",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Requests handled concurrently (stdin/stdout mode)",
+)
+def serve(socket_path: str | None, workers: int) -> None:
+    """Run a conversion server speaking newline-delimited JSON.
+
+    Keeps a warm converter in memory and answers convert, chunk and
+    convert_chunk requests, one JSON object per line.
+
+    Examples:
+
+      echo '{"id": 1, "op": "convert", "markdown": "**hi**"}' | md2slack serve
+
+      md2slack serve --socket /tmp/md2slack.sock
+    """
+    from md2slack.server import ConversionServer
+
+    server = ConversionServer(workers=workers)
+    if socket_path:
+        click.echo(f"Listening on {socket_path}", err=True)
+        try:
+            server.serve_unix(socket_path)
+        except KeyboardInterrupt:
+            pass
+    else:
+        server.serve_stdio(sys.stdin, sys.stdout)
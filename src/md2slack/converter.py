@@ -6,12 +6,67 @@ standard CommonMark markdown into Slack's mrkdwn format.
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, TYPE_CHECKING, Any
 
 import mistune
-from mistune import HTMLRenderer
-
-__all__ = ["convert", "SlackMrkdwnRenderer"]
+from mistune import BlockState, HTMLRenderer
+
+from md2slack import __version__
+
+if TYPE_CHECKING:
+    from md2slack.chunker import Segment
+    from md2slack.tables import TableRow
+
+__all__ = [
+    "Converter",
+    "SlackMrkdwnRenderer",
+    "convert",
+    "convert_batch",
+    "convert_many",
+    "convert_stream",
+    "get_default_converter",
+    "split_blocks",
+]
+
+# Mistune plugins enabled for every conversion
+DEFAULT_PLUGINS: tuple[str, ...] = ("strikethrough", "table")
+
+# Markdown buffered per conversion call when streaming (characters)
+DEFAULT_STREAM_BATCH_SIZE = 64 * 1024
+
+# Opening/closing line of a fenced code block (``` or ~~~)
+_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})")
+
+# Characters a code block fence adds around its content ("```\n" + "\n```")
+_FENCE_OVERHEAD = len("```\n\n```")
+
+# Segment kind for each top-level mistune token type
+_SEGMENT_KINDS = {
+    "paragraph": "paragraph",
+    "heading": "heading",
+    "list": "list",
+    "block_quote": "quote",
+    "block_code": "code",
+    "table": "table",
+    "thematic_break": "rule",
+    "block_html": "html",
+}
+
+# Start of a list item; a block starting with one may continue a loose list
+_LIST_ITEM = re.compile(r"(?:[-*+]|\d{1,9}[.)])(?:[ \t]|$)")
+
+
+# Precompiled patterns for stripping Slack mrkdwn inline formatting
+_LINK_WITH_TEXT = re.compile(r"<([^|>]+)\|([^>]+)>")
+_LINK = re.compile(r"<([^>]+)>")
+_BOLD = re.compile(r"\*([^*]+)\*")
+# Italic only at word boundaries, not in identifiers like snake_case
+_ITALIC = re.compile(r"(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])")
+_STRIKETHROUGH = re.compile(r"~([^~]+)~")
 
 
 def _strip_mrkdwn_formatting(text: str) -> str:
@@ -19,36 +74,112 @@ def _strip_mrkdwn_formatting(text: str) -> str:
 
     Removes: backticks, bold asterisks, italic underscores,
     strikethrough tildes, and converts links to plain text.
+
+    Each pattern only runs when its marker character is present, so most
+    table cells are handled without any regex pass at all.
     """
     # Remove backticks (inline code)
     text = text.replace("`", "")
 
     # Convert Slack links <url|text> to just text (or url if no text)
-    text = re.sub(r"<([^|>]+)\|([^>]+)>", r"\2", text)
-    text = re.sub(r"<([^>]+)>", r"\1", text)
+    if "<" in text:
+        text = _LINK_WITH_TEXT.sub(r"\2", text)
+        text = _LINK.sub(r"\1", text)
 
     # Remove bold asterisks (but not the content)
-    text = re.sub(r"\*([^*]+)\*", r"\1", text)
+    if "*" in text:
+        text = _BOLD.sub(r"\1", text)
 
-    # Remove italic underscores (only at word boundaries, not in identifiers)
-    text = re.sub(r"(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])", r"\1", text)
+    if "_" in text:
+        text = _ITALIC.sub(r"\1", text)
 
     # Remove strikethrough tildes
-    text = re.sub(r"~([^~]+)~", r"\1", text)
+    if "~" in text:
+        text = _STRIKETHROUGH.sub(r"\1", text)
 
     return text
 
 
 class SlackMrkdwnRenderer(HTMLRenderer):
-    """Custom renderer for converting Markdown to Slack's mrkdwn format."""
+    """Custom renderer for converting Markdown to Slack's mrkdwn format.
+
+    The renderer keeps no per-document state: list numbering is derived
+    from each list token while it is rendered, so a single instance can be
+    shared by concurrent conversions.
+
+    Attributes:
+        max_table_size: If set, tables whose code block would exceed this
+            size are split on row boundaries into several code blocks,
+            each repeating the header
+        size_metric: How max_table_size is measured (see md2slack.sizes)
+    """
 
     NAME = "slack"
 
-    def __init__(self) -> None:
+    def __init__(
+        self, max_table_size: int | None = None, size_metric: str = "chars"
+    ) -> None:
         super().__init__(escape=False)
-        self._list_depth = 0
-        self._ordered_list_counter = 0
-        self._in_ordered_list = False
+        self.max_table_size = max_table_size
+        self.size_metric = size_metric
+
+    def render_token(self, token: dict[str, Any], state: BlockState) -> str:
+        """Render a token, handling lists from their token attributes."""
+        if token["type"] == "list":
+            return self._render_list(token, state, depth=0)
+        if token["type"] == "table":
+            return self._render_table(token, state)
+        return super().render_token(token, state)
+
+    def _render_list(
+        self, token: dict[str, Any], state: BlockState, depth: int
+    ) -> str:
+        """Render a list token, numbering its items locally.
+
+        Args:
+            token: The list token
+            state: Mistune block state for the current document
+            depth: List nesting depth (0 for a top-level list)
+        """
+        items = self._render_list_items(token, state, depth)
+        return self.list("".join(items), **token["attrs"])
+
+    def _render_list_items(
+        self, token: dict[str, Any], state: BlockState, depth: int = 0
+    ) -> list[str]:
+        """Render each item of a list token, numbering them locally.
+
+        Args:
+            token: The list token
+            state: Mistune block state for the current document
+            depth: List nesting depth (0 for a top-level list)
+
+        Returns:
+            Rendered items, nested lists included in their parent item
+        """
+        attrs = token["attrs"]
+        ordered = attrs["ordered"]
+        number = attrs.get("start", 1)
+
+        items = []
+        for item in token["children"]:
+            parts = []
+            for child in item["children"]:
+                if child["type"] == "blank_line":
+                    continue
+                if child["type"] == "list":
+                    part = self._render_list(child, state, depth + 1)
+                else:
+                    part = self.render_token(child, state)
+                parts.append(part.strip("\n"))
+            text = "\n".join(part for part in parts if part)
+            if ordered:
+                marker = f"{number}."
+                number += 1
+            else:
+                marker = "\u2022"
+            items.append(self.list_item(text, marker=marker, depth=depth))
+        return items
 
     # T018: text() - escape &, <, > characters
     def text(self, text: str) -> str:
@@ -87,21 +218,18 @@ class SlackMrkdwnRenderer(HTMLRenderer):
     # T024: list() and list_item() - unordered with bullet
     def list(self, text: str, ordered: bool, **attrs) -> str:
         """Render a list."""
-        self._in_ordered_list = ordered
-        if ordered:
-            self._ordered_list_counter = 0
         return f"{text}\n"
 
-    def list_item(self, text: str, **attrs) -> str:
-        """Render a list item with bullet or number."""
-        text = text.strip()
-        if self._in_ordered_list:
-            # T025: ordered lists preserve numbering
-            self._ordered_list_counter += 1
-            return f"{self._ordered_list_counter}. {text}\n"
-        else:
-            # Unordered list with bullet character
-            return f"\u2022 {text}\n"
+    def list_item(self, text: str, marker: str = "\u2022", depth: int = 0) -> str:
+        """Render a list item with bullet or number.
+
+        Args:
+            text: Rendered item content (nested lists already indented)
+            marker: Bullet character or "N." number for ordered lists (T025)
+            depth: Nesting depth, used to indent nested items
+        """
+        indent = "    " * depth
+        return f"{indent}{marker} {text.strip()}\n"
 
     # T026: paragraph() - add double newline
     def paragraph(self, text: str) -> str:
@@ -141,11 +269,12 @@ class SlackMrkdwnRenderer(HTMLRenderer):
     def inline_html(self, html: str) -> str:
         """Convert <br> to placeholder for newline, pass through other HTML.
 
-        Uses \\x01 as placeholder because table parsing splits on \\n.
-        The placeholder is converted back to \\n when creating TableCell objects.
+        Uses \\x01 as placeholder so line breaks survive cell formatting
+        stripping. The placeholder is converted back to \\n when creating
+        TableCell objects.
         """
         if re.match(r"<br\s*/?>", html, re.IGNORECASE):
-            return "\x01"  # Placeholder for newline (converted in table())
+            return "\x01"  # Placeholder for newline (converted in _table_row())
         return html
 
     def block_html(self, html: str) -> str:
@@ -156,81 +285,331 @@ class SlackMrkdwnRenderer(HTMLRenderer):
         """Render image as link (Slack doesn't support inline images)."""
         return f"<{url}|{alt or 'image'}>"
 
-    # T046-T047: Table rendering methods
-    def table(self, text: str) -> str:
-        """Render table as code block with box-drawing characters.
+    # T046-T047: Table rendering
+    def _render_table(self, token: dict[str, Any], state: BlockState) -> str:
+        """Render a table token as a code block with box-drawing characters.
 
-        The text parameter contains the pre-rendered table content from
-        table_head and table_body methods.
+        The Table is built directly from the table_head/table_body tokens,
+        so cell text is never serialized into an intermediate string and
+        column alignment from the delimiter row is preserved.
         """
-        from md2slack.tables import (
-            Table,
-            TableCell,
-            TableRow,
-            render_table,
-        )
-
-        # Parse the pre-rendered content to extract cells
-        # Format: HEADER:cell1\x00cell2\n for header, ROW:cell1\x00cell2\n for data
-        rows_data = []
-        header_data = []
-
-        def process_cell(content: str, is_header: bool = False) -> TableCell:
-            """Process cell content: strip formatting and convert placeholders."""
+        from md2slack.sizes import text_size
+        from md2slack.tables import Table, render_table, render_table_parts
+
+        head, *body = token["children"]
+        headers = self._table_row(head, state, is_header=True)
+        rows = [
+            self._table_row(row, state, is_header=False)
+            for section in body
+            for row in section["children"]
+        ]
+
+        table = Table(headers=headers, rows=rows)
+        if self.max_table_size is None:
+            parts = [render_table(table)]
+        else:
+            # Leave room for the fence lines around each part
+            parts = render_table_parts(
+                table,
+                self.max_table_size - _FENCE_OVERHEAD,
+                measure=lambda text: text_size(text, self.size_metric),
+            )
+        return "".join(f"```\n{part}\n```\n\n" for part in parts)
+
+    def _table_row(
+        self, token: dict[str, Any], state: BlockState, is_header: bool
+    ) -> TableRow:
+        """Build a TableRow from a table_head or table_row token."""
+        from md2slack.tables import TableCell, TableRow
+
+        cells = []
+        for cell in token["children"]:
+            content = self.render_tokens(cell["children"], state)
             # Convert \x01 placeholder back to newline (from <br> tags)
             content = _strip_mrkdwn_formatting(content.strip()).replace("\x01", "\n")
-            return TableCell(content, is_header=is_header)
-
-        for line in text.strip().split("\n"):
-            if not line:
-                continue
-            if line.startswith("HEADER:"):
-                cells = line[7:].split("\x00")
-                header_data = [
-                    process_cell(c, is_header=True)
-                    for c in cells
-                    if c.strip()
-                ]
-            elif line.startswith("ROW:"):
-                cells = line[4:].split("\x00")
-                rows_data.append(
-                    TableRow(
-                        [
-                            process_cell(c)
-                            for c in cells
-                            if c.strip()
-                        ]
-                    )
+            cells.append(
+                TableCell(
+                    content,
+                    alignment=cell["attrs"].get("align"),
+                    is_header=is_header,
                 )
+            )
+        return TableRow(cells)
 
-        if not header_data:
-            # Fallback: just return as-is in code block
-            return f"```\n{text}\n```\n\n"
 
-        table = Table(headers=TableRow(header_data), rows=rows_data)
-        rendered = render_table(table)
-        return f"```\n{rendered}\n```\n\n"
+def split_blocks(lines: Iterable[str]) -> Iterator[str]:
+    """Group markdown lines into blocks that convert independently.
 
-    def table_head(self, text: str) -> str:
-        """Render table header section.
+    A block ends at a blank line outside fenced code, unless the next line
+    is indented or starts a list item (either may continue the previous
+    list). Tables never contain blank lines, so they are never split.
+    Link reference definitions only apply within their own block.
 
-        Cells come directly here (not through table_row for headers).
+    Args:
+        lines: Markdown lines, with or without trailing newlines
+
+    Yields:
+        Consecutive blocks whose concatenation is the input text
+    """
+    block: list[str] = []
+    fence: str | None = None
+    after_blank = False
+
+    for line in lines:
+        if not line.endswith("\n"):
+            line += "\n"
+        stripped = line.strip()
+
+        if fence is None and after_blank and stripped:
+            if not line[0].isspace() and not _LIST_ITEM.match(line):
+                yield "".join(block)
+                block = []
+            after_blank = False
+
+        block.append(line)
+
+        match = _FENCE.match(line)
+        if fence is None:
+            if match:
+                fence = match.group(1)
+            elif not stripped:
+                after_blank = True
+        elif match and match.group(1)[0] == fence[0]:
+            if len(match.group(1)) >= len(fence) and not line[match.end() :].strip():
+                fence = None
+
+    if block:
+        yield "".join(block)
+
+
+class Converter:
+    """Reusable markdown to Slack mrkdwn converter.
+
+    The mistune parser, renderer and plugins are compiled once when the
+    converter is created and reused for every document, which avoids
+    rebuilding them on each call. Parsing state lives in a fresh mistune
+    BlockState per call and the renderer is stateless, so one converter
+    may be used from several threads at once.
+
+    Attributes:
+        plugins: Names of the mistune plugins enabled for this converter
+        max_table_size: Maximum size of each table code block, or None
+        size_metric: How max_table_size is measured
+        fingerprint: String identifying the package version and options
+            that affect output (used as part of cache keys)
+    """
+
+    def __init__(
+        self,
+        plugins: Iterable[str] = DEFAULT_PLUGINS,
+        max_table_size: int | None = None,
+        size_metric: str = "chars",
+    ) -> None:
+        """Compile the parser and renderer.
+
+        Args:
+            plugins: Mistune plugin names to enable
+            max_table_size: Split rendered tables into code blocks of at
+                most this size (None keeps each table whole)
+            size_metric: How max_table_size is measured, one of
+                md2slack.sizes.SIZE_METRICS
+
+        Raises:
+            ValueError: If size_metric is unknown
+        """
+        from md2slack.sizes import check_size_metric
+
+        check_size_metric(size_metric)
+        self.plugins = tuple(plugins)
+        self.max_table_size = max_table_size
+        self.size_metric = size_metric
+        self.fingerprint = f"md2slack {__version__}; plugins={','.join(self.plugins)}"
+        if max_table_size is not None:
+            self.fingerprint += f"; max_table_size={max_table_size} {size_metric}"
+        self._renderer = SlackMrkdwnRenderer(max_table_size, size_metric)
+        self._markdown = mistune.create_markdown(
+            renderer=self._renderer,
+            plugins=list(self.plugins),
+        )
+        # Same parser without a renderer, for block segments
+        self._parser = mistune.create_markdown(
+            renderer="ast",
+            plugins=list(self.plugins),
+        )
+
+    def convert(self, markdown: str) -> str:
+        """Convert a markdown document to Slack mrkdwn format.
+
+        Args:
+            markdown: The markdown string to convert.
+
+        Returns:
+            The converted Slack mrkdwn string.
         """
-        # The text contains cells with \x00 delimiter
-        return f"HEADER:{text}\n"
+        return self._markdown(markdown)
+
+    def convert_segments(self, markdown: str) -> list[Segment]:
+        """Convert a markdown document into rendered top-level blocks.
 
-    def table_body(self, text: str) -> str:
-        """Render table body section."""
-        return text
+        The document is parsed once and each top-level token is rendered
+        on its own, so the segment texts concatenate to convert(markdown).
+        Lists yield one segment per top-level item.
 
-    def table_row(self, text: str, **attrs) -> str:
-        """Render a table row."""
-        return f"ROW:{text}\n"
+        Args:
+            markdown: The markdown string to convert.
 
-    def table_cell(self, text: str, **attrs) -> str:
-        """Render a table cell."""
-        # Use null byte as delimiter (won't appear in normal text)
-        return f"{text}\x00"
+        Returns:
+            Non-empty segments in document order.
+        """
+        from md2slack.chunker import Segment
+
+        tokens, state = self._parser.parse(markdown)
+        segments: list[Segment] = []
+        for token in tokens:
+            kind = _SEGMENT_KINDS.get(token["type"], "other")
+            if token["type"] == "list":
+                items = self._renderer._render_list_items(token, state)
+                rendered = self._renderer.list("".join(items), **token["attrs"])
+                # Whatever list() adds after the items belongs to the last one
+                items[-1] += rendered[len("".join(items)) :]
+                texts = items
+            else:
+                texts = [self._renderer.render_token(token, state)]
+            segments.extend(Segment(text, kind) for text in texts if text)
+        return segments
+
+    def convert_many(self, documents: Iterable[str]) -> list[str]:
+        """Convert several markdown documents with the same compiled parser.
+
+        Args:
+            documents: Markdown strings to convert.
+
+        Returns:
+            Converted mrkdwn strings, in input order.
+        """
+        return [self.convert(markdown) for markdown in documents]
+
+    def convert_stream(
+        self,
+        lines: Iterable[str],
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+        references: dict[str, dict[str, Any]] | None = None,
+    ) -> Iterator[str]:
+        """Convert markdown incrementally, block by block.
+
+        Lines are grouped with split_blocks() and converted in batches of
+        roughly batch_size characters, so memory use is bounded by the
+        batch size rather than the document size.
+
+        Link reference definitions apply to the whole document, wherever
+        they appear, so they are collected in a first pass and given to
+        every batch. Seekable files are rewound after that pass; other
+        iterables that are not sequences (pipes, generators) are first
+        copied to a temporary file.
+
+        Args:
+            lines: Markdown lines (e.g. an open file or sys.stdin)
+            batch_size: Approximate characters converted per call
+            references: Definitions from collect_references(), if already
+                known; skips the first pass
+
+        Yields:
+            Converted mrkdwn fragments, in document order.
+        """
+        if references is not None:
+            yield from self._convert_batches(lines, batch_size, references)
+        elif isinstance(lines, Sequence):
+            references = self.collect_references(lines)
+            yield from self._convert_batches(lines, batch_size, references)
+        elif _is_seekable(lines):
+            start = lines.tell()  # type: ignore[attr-defined]
+            references = self.collect_references(lines)
+            lines.seek(start)  # type: ignore[attr-defined]
+            yield from self._convert_batches(lines, batch_size, references)
+        else:
+            import tempfile
+
+            with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+                references = self.collect_references(_tee(lines, spool))
+                spool.seek(0)
+                yield from self._convert_batches(spool, batch_size, references)
+
+    def collect_references(self, lines: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Return the link reference definitions of a markdown document.
+
+        Only blocks that may contain a definition are parsed. As in a
+        whole-document parse, the first definition of a label wins.
+
+        Args:
+            lines: Markdown lines
+
+        Returns:
+            Mistune reference entries keyed by normalized label
+        """
+        references: dict[str, dict[str, Any]] = {}
+        for block in split_blocks(lines):
+            if "]:" in block:
+                _, state = self._parser.parse(block)
+                for key, value in state.env["ref_links"].items():
+                    references.setdefault(key, value)
+        return references
+
+    def _convert_batches(
+        self,
+        lines: Iterable[str],
+        batch_size: int,
+        references: dict[str, dict[str, Any]],
+    ) -> Iterator[str]:
+        """Convert blocks in batches, resolving links against references."""
+        batch: list[str] = []
+        buffered = 0
+        for block in split_blocks(lines):
+            batch.append(block)
+            buffered += len(block)
+            if buffered >= batch_size:
+                yield self._convert_with_references("".join(batch), references)
+                batch = []
+                buffered = 0
+        if batch:
+            yield self._convert_with_references("".join(batch), references)
+
+    def _convert_with_references(
+        self, markdown: str, references: dict[str, dict[str, Any]]
+    ) -> str:
+        """Convert markdown with extra link reference definitions in scope."""
+        if not references:
+            return self.convert(markdown)
+        state = self._markdown.block.state_cls()
+        state.env["ref_links"].update(references)
+        result, _ = self._markdown.parse(markdown, state)
+        return result  # type: ignore[return-value]
+
+
+def _is_seekable(stream: object) -> bool:
+    """Return whether stream is a file that can be rewound."""
+    seekable = getattr(stream, "seekable", None)
+    try:
+        return bool(seekable and seekable())
+    except (OSError, ValueError):
+        return False
+
+
+def _tee(lines: Iterable[str], spool: IO[str]) -> Iterator[str]:
+    """Yield lines while copying them to spool."""
+    for line in lines:
+        spool.write(line)
+        yield line
+
+
+_default_converter: Converter | None = None
+
+
+def get_default_converter() -> Converter:
+    """Return the shared module-level converter, creating it on first use."""
+    global _default_converter
+    if _default_converter is None:
+        _default_converter = Converter()
+    return _default_converter
 
 
 def convert(markdown: str) -> str:
@@ -242,8 +621,75 @@ def convert(markdown: str) -> str:
     Returns:
         The converted Slack mrkdwn string.
     """
-    md = mistune.create_markdown(
-        renderer=SlackMrkdwnRenderer(),
-        plugins=["strikethrough", "table"],
-    )
-    return md(markdown)
+    return get_default_converter().convert(markdown)
+
+
+def convert_many(documents: Iterable[str]) -> list[str]:
+    """Convert several markdown documents with the shared converter.
+
+    Args:
+        documents: Markdown strings to convert.
+
+    Returns:
+        Converted mrkdwn strings, in input order.
+    """
+    return get_default_converter().convert_many(documents)
+
+
+def _init_batch_worker() -> None:
+    """Compile the shared converter once when a worker process starts."""
+    get_default_converter()
+
+
+def convert_batch(
+    documents: Iterable[str],
+    workers: int | None = None,
+    chunksize: int | None = None,
+) -> list[str]:
+    """Convert many markdown documents in parallel across processes.
+
+    Each worker process compiles its converter once and reuses it for all
+    documents it receives. Documents are submitted in chunks to amortize
+    inter-process communication.
+
+    Args:
+        documents: Markdown strings to convert.
+        workers: Number of worker processes (default: CPU count). With one
+            worker, or a single document, conversion runs in-process.
+        chunksize: Documents sent to a worker per task (default: spread
+            the batch over about four tasks per worker).
+
+    Returns:
+        Converted mrkdwn strings, in input order.
+    """
+    docs = list(documents)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(docs))
+    if workers <= 1:
+        return convert_many(docs)
+
+    if chunksize is None:
+        chunksize = max(1, len(docs) // (workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_batch_worker
+    ) as pool:
+        return list(pool.map(convert, docs, chunksize=chunksize))
+
+
+def convert_stream(
+    lines: Iterable[str], batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+) -> Iterator[str]:
+    """Convert markdown incrementally with the shared converter.
+
+    See Converter.convert_stream() for how link references are resolved.
+
+    Args:
+        lines: Markdown lines (e.g. an open file or sys.stdin)
+        batch_size: Approximate characters converted per call
+
+    Yields:
+        Converted mrkdwn fragments, in document order.
+    """
+    return get_default_converter().convert_stream(lines, batch_size=batch_size)
@@ -0,0 +1,135 @@
+"""Incremental re-conversion of edited markdown documents.
+
+This module provides a converter that remembers the mrkdwn output of each
+top-level block of the previous document. When a document is converted
+again after a small edit, only the blocks whose text changed are parsed
+and rendered; unchanged blocks reuse their cached output. Link reference
+definitions are collected from the whole document first, so a block may
+use a definition from another block; editing a definition re-renders the
+blocks that could refer to it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+from dataclasses import dataclass, field
+
+from md2slack.converter import Converter, get_default_converter, split_blocks
+
+__all__ = ["BlockOffset", "IncrementalConverter", "IncrementalResult"]
+
+
+@dataclass
+class BlockOffset:
+    """Location of one top-level block in the source and in the output.
+
+    Attributes:
+        source_start: Offset of the block's first character in the markdown
+        source_end: Offset just past the block in the markdown
+        output_start: Offset of the block's mrkdwn in the output
+        output_end: Offset just past the block's mrkdwn in the output
+        reused: True if the mrkdwn came from the previous conversion
+    """
+
+    source_start: int
+    source_end: int
+    output_start: int
+    output_end: int
+    reused: bool
+
+
+@dataclass
+class IncrementalResult:
+    """Result of an incremental conversion.
+
+    Attributes:
+        output: The converted Slack mrkdwn string
+        blocks: Source/output offsets for each top-level block, in order
+    """
+
+    output: str
+    blocks: list[BlockOffset] = field(default_factory=list)
+
+    @property
+    def reused_count(self) -> int:
+        """Return the number of blocks served from the previous conversion."""
+        return sum(1 for block in self.blocks if block.reused)
+
+    @property
+    def rendered_count(self) -> int:
+        """Return the number of blocks that were converted."""
+        return len(self.blocks) - self.reused_count
+
+
+class IncrementalConverter:
+    """Converter that re-renders only the blocks changed since last time."""
+
+    def __init__(self, converter: Converter | None = None) -> None:
+        """Initialize with an empty block cache.
+
+        Args:
+            converter: Converter used for changed blocks (default: shared)
+        """
+        self.converter = converter or get_default_converter()
+        self._blocks: dict[str, str] = {}
+
+    def convert(self, markdown: str) -> IncrementalResult:
+        """Convert markdown, reusing output for unchanged blocks.
+
+        Args:
+            markdown: The full markdown document.
+
+        Returns:
+            IncrementalResult with the output and per-block offsets.
+        """
+        blocks: dict[str, str] = {}
+        offsets: list[BlockOffset] = []
+        parts: list[str] = []
+        source_pos = 0
+        output_pos = 0
+        # Split on "\n" only, so every block is an exact slice of the source
+        lines = list(io.StringIO(markdown, newline="\n"))
+
+        # Only blocks with a "[" can use a reference, so only their output
+        # depends on the definitions
+        references = self.converter.collect_references(lines)
+        references_digest = json.dumps(references, sort_keys=True).encode("utf-8")
+
+        for block in split_blocks(lines):
+            digest = hashlib.sha1(block.encode("utf-8"))
+            if references and "[" in block:
+                digest.update(b"\0")
+                digest.update(references_digest)
+            fingerprint = digest.hexdigest()
+            rendered = blocks.get(fingerprint)
+            if rendered is None:
+                rendered = self._blocks.get(fingerprint)
+            reused = rendered is not None
+            if rendered is None:
+                rendered = self.converter._convert_with_references(block, references)
+            blocks[fingerprint] = rendered
+
+            # split_blocks() terminates the final line; the source may not
+            source_end = min(source_pos + len(block), len(markdown))
+            offsets.append(
+                BlockOffset(
+                    source_start=source_pos,
+                    source_end=source_end,
+                    output_start=output_pos,
+                    output_end=output_pos + len(rendered),
+                    reused=reused,
+                )
+            )
+            parts.append(rendered)
+            source_pos = source_end
+            output_pos += len(rendered)
+
+        # Keep only the current document's blocks for the next call
+        self._blocks = blocks
+        return IncrementalResult(output="".join(parts), blocks=offsets)
+
+    def reset(self) -> None:
+        """Forget cached blocks so the next conversion renders everything."""
+        self._blocks = {}
@@ -0,0 +1,144 @@
+"""On-disk journal of posted chunks for resumable posting.
+
+A multi-chunk post records each chunk it delivers to Slack, together with
+the message timestamp and permalink, in an append-only JSON Lines file.
+If the post is interrupted, re-running it with ``--resume`` skips the
+chunks already in the journal instead of posting them again. Journals are
+keyed by a hash of the thread and of everything that determines the
+chunks, so a changed document or option starts a fresh journal.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+__all__ = ["JournalEntry", "PostJournal", "chunk_digest", "journal_key"]
+
+
+def journal_key(thread: str, *parts: str) -> str:
+    """Return the journal key for a post.
+
+    Args:
+        thread: Thread the chunks are posted to (channel and timestamp)
+        *parts: Everything that determines the chunks, e.g. the markdown,
+            prefix, converter fingerprint and chunking options
+
+    Returns:
+        Hex SHA-256 digest of the thread and parts
+    """
+    digest = hashlib.sha256(thread.encode("utf-8"))
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def chunk_digest(text: str) -> str:
+    """Return a short hash identifying the exact text of a posted chunk."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class JournalEntry:
+    """One chunk delivered to Slack.
+
+    Attributes:
+        index: Zero-based chunk index
+        digest: chunk_digest() of the text that was posted
+        ts: Slack timestamp of the posted message
+        permalink: Link to the posted message
+    """
+
+    index: int
+    digest: str
+    ts: str
+    permalink: str
+
+
+class PostJournal:
+    """Append-only record of the chunks of one post that reached Slack.
+
+    Disk errors are ignored: without a journal a post still succeeds, it
+    just cannot be resumed.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialize the journal.
+
+        Args:
+            path: Journal file (created on the first record)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_post(cls, directory: Path | str, key: str) -> PostJournal:
+        """Return the journal for a post key inside a cache directory.
+
+        Args:
+            directory: Cache directory, e.g. default_cache_dir()
+            key: journal_key() of the post
+
+        Returns:
+            PostJournal stored at directory/journals/{key}.jsonl
+        """
+        return cls(Path(directory) / "journals" / f"{key}.jsonl")
+
+    def load(self) -> dict[int, JournalEntry]:
+        """Return the recorded entries by chunk index.
+
+        A truncated last line, left by a crash mid-write, is skipped.
+
+        Returns:
+            Mapping of chunk index to its entry (empty if no journal)
+        """
+        entries: dict[int, JournalEntry] = {}
+        try:
+            with self.path.open(encoding="utf-8") as stream:
+                for line in stream:
+                    try:
+                        entry = JournalEntry(**json.loads(line))
+                    except (TypeError, ValueError):
+                        continue
+                    entries[entry.index] = entry
+        except OSError:
+            pass
+        return entries
+
+    def record(self, entry: JournalEntry) -> None:
+        """Append an entry and flush it to disk before returning.
+
+        If an earlier crash left a partial last line, the entry starts on
+        a new line so it is not lost with the fragment.
+
+        Args:
+            entry: The chunk that was just posted
+        """
+        line = json.dumps(asdict(entry), separators=(",", ":")) + "\n"
+        data = line.encode("utf-8")
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a+b") as stream:
+                    if stream.seek(0, os.SEEK_END) > 0:
+                        stream.seek(-1, os.SEEK_END)
+                        if stream.read(1) != b"\n":
+                            data = b"\n" + data
+                    stream.write(data)
+                    stream.flush()
+                    os.fsync(stream.fileno())
+            except OSError:
+                pass
+
+    def remove(self) -> None:
+        """Delete the journal, e.g. once every chunk has been posted."""
+        with self._lock:
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError:
+                pass
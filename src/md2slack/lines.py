@@ -0,0 +1,98 @@
+"""Line-number index for mapping character offsets to lines.
+
+This module provides a reusable index of newline positions so that
+character offsets can be mapped to line/column numbers (and line ranges
+to character offsets) with a binary search instead of rescanning the
+text before each offset.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+__all__ = ["LineIndex"]
+
+
+class LineIndex:
+    """Newline offsets of a text, for O(log n) line/column lookups.
+
+    Lines are terminated by "\\n" ("\\r\\n" therefore also works). Line and
+    column numbers are 1-indexed.
+    """
+
+    def __init__(self, content: str) -> None:
+        """Scan content once and record every newline offset.
+
+        Args:
+            content: The text to index
+        """
+        self._length = len(content)
+        self._newlines: list[int] = []
+        pos = content.find("\n")
+        while pos >= 0:
+            self._newlines.append(pos)
+            pos = content.find("\n", pos + 1)
+        # A final line without a trailing newline still counts as a line
+        self._trailing_line = bool(content) and not content.endswith("\n")
+
+    @property
+    def line_count(self) -> int:
+        """Return the number of lines (a trailing newline adds no line)."""
+        return len(self._newlines) + self._trailing_line
+
+    def line_number(self, offset: int) -> int:
+        """Return the 1-indexed line containing a character offset.
+
+        Args:
+            offset: Character offset into the text
+
+        Returns:
+            Line number (a newline character belongs to the line it ends)
+        """
+        return bisect_left(self._newlines, offset) + 1
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """Return the 1-indexed (line, column) of a character offset.
+
+        Args:
+            offset: Character offset into the text
+
+        Returns:
+            Tuple of (line, column)
+        """
+        line = self.line_number(offset)
+        return line, offset - self.line_start(line) + 1
+
+    def line_start(self, line: int) -> int:
+        """Return the offset of the first character of a 1-indexed line.
+
+        Lines past the end map to the end of the text.
+        """
+        if line <= 1:
+            return 0
+        if line - 2 < len(self._newlines):
+            return self._newlines[line - 2] + 1
+        return self._length
+
+    def line_end(self, line: int) -> int:
+        """Return the offset just past a line, including its newline.
+
+        Lines past the end map to the end of the text.
+        """
+        if line < 1:
+            return 0
+        if line - 1 < len(self._newlines):
+            return self._newlines[line - 1] + 1
+        return self._length
+
+    def line_span(self, start: int, end: int) -> tuple[int, int]:
+        """Return the character offsets covering lines start..end inclusive.
+
+        Args:
+            start: First line (1-indexed)
+            end: Last line (1-indexed, inclusive)
+
+        Returns:
+            Tuple of (start_offset, end_offset) for slicing the text
+        """
+        return self.line_start(start), self.line_end(end)
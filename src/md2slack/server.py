@@ -0,0 +1,290 @@
+"""Long-running conversion server speaking newline-delimited JSON.
+
+This module keeps a warm converter in memory and answers requests over
+stdin/stdout or a Unix domain socket, avoiding interpreter startup for
+each conversion.
+
+Each request is one JSON object per line::
+
+    {"id": 1, "op": "convert", "markdown": "**hi**"}
+    {"id": 2, "op": "chunk", "text": "...", "chunk_size": 3900}
+    {"id": 3, "op": "convert_chunk", "markdown": "...", "prefix": "Update:"}
+
+Each response is one JSON object per line carrying the request id::
+
+    {"id": 1, "ok": true, "result": "*hi*\\n\\n"}
+    {"id": 2, "ok": true, "result": {"chunks": [...], "warnings": [...]}}
+    {"id": 9, "ok": false, "error": "Unknown op: 'frobnicate'"}
+
+Requests are handled concurrently, so responses may arrive out of order;
+clients match them by id.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any
+
+from md2slack.chunker import (
+    CHUNK_STRATEGIES,
+    DEFAULT_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    ChunkResult,
+    Segment,
+    chunk_content,
+    chunk_segments,
+)
+from md2slack.converter import Converter, get_default_converter
+from md2slack.sizes import SIZE_METRICS
+
+__all__ = ["ConversionServer", "RequestError"]
+
+DEFAULT_WORKERS = 4
+# Distinct chunk sizes whose table-splitting converters are kept warm
+MAX_CHUNK_CONVERTERS = 8
+
+
+class RequestError(Exception):
+    """A malformed or unsupported server request."""
+
+
+class ConversionServer:
+    """Serve convert/chunk requests from a warm in-memory converter."""
+
+    def __init__(
+        self, converter: Converter | None = None, workers: int = DEFAULT_WORKERS
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            converter: Converter to use (default: shared converter)
+            workers: Threads handling requests concurrently
+        """
+        self.converter = converter or get_default_converter()
+        self.workers = workers
+        # convert_chunk converters splitting tables to fit each chunk size
+        self._chunk_converters: dict[tuple[int, str], Converter] = {}
+        self._chunk_converters_lock = threading.Lock()
+
+    def handle_request(self, request: Any) -> dict[str, Any]:
+        """Handle one decoded request.
+
+        Args:
+            request: Decoded JSON request object
+
+        Returns:
+            Response object with "id", "ok" and "result" or "error"; every
+            request gets a response, even if handling it fails unexpectedly
+        """
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            result = self._dispatch(request)
+        except RequestError as e:
+            return {"id": request_id, "ok": False, "error": str(e)}
+        except Exception as e:
+            error = f"Internal error: {type(e).__name__}: {e}"
+            return {"id": request_id, "ok": False, "error": error}
+        return {"id": request_id, "ok": True, "result": result}
+
+    def handle_line(self, line: str) -> str:
+        """Handle one NDJSON request line and return the response line.
+
+        Args:
+            line: JSON-encoded request
+
+        Returns:
+            JSON-encoded response (without trailing newline), ASCII only
+            so that lone surrogates in a result can always be written
+        """
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {"id": None, "ok": False, "error": f"Invalid JSON: {e}"}
+        else:
+            response = self.handle_request(request)
+        return json.dumps(response)
+
+    def serve_stdio(self, input_stream: IO[str], output_stream: IO[str]) -> None:
+        """Serve requests read from input_stream until it is closed.
+
+        Args:
+            input_stream: Stream of NDJSON requests (e.g., sys.stdin)
+            output_stream: Stream for NDJSON responses (e.g., sys.stdout)
+        """
+        write_lock = threading.Lock()
+
+        def respond(line: str) -> None:
+            response = self.handle_line(line)
+            with write_lock:
+                output_stream.write(response + "\n")
+                output_stream.flush()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for line in input_stream:
+                if line.strip():
+                    pool.submit(respond, line)
+
+    def serve_unix(self, path: str) -> None:
+        """Serve requests on a Unix domain socket until interrupted.
+
+        Each connection is handled in its own thread; requests on one
+        connection are answered in order.
+
+        Args:
+            path: Filesystem path for the socket (replaced if it exists)
+        """
+        server = self.make_unix_server(path)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if os.path.exists(path):
+                os.unlink(path)
+
+    def make_unix_server(self, path: str) -> socketserver.UnixStreamServer:
+        """Create (but do not start) the Unix domain socket server.
+
+        Args:
+            path: Filesystem path for the socket (replaced if it exists)
+
+        Returns:
+            A threading Unix stream server bound to path
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        handle_line = self.handle_line
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for raw in self.rfile:
+                    line = raw.decode("utf-8", errors="replace")
+                    if not line.strip():
+                        continue
+                    response = handle_line(line) + "\n"
+                    self.wfile.write(response.encode("utf-8"))
+                    self.wfile.flush()
+
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+        server.daemon_threads = True
+        return server
+
+    def _dispatch(self, request: Any) -> Any:
+        """Run the operation named by a request."""
+        if not isinstance(request, dict):
+            raise RequestError("Request must be a JSON object")
+
+        op = request.get("op")
+        if op == "convert":
+            return self.converter.convert(_get_str(request, "markdown"))
+        if op == "chunk":
+            options = _get_chunk_options(request, CHUNK_STRATEGIES)
+            return _chunk_response(
+                chunk_content(_get_str(request, "text"), **options)
+            )
+        if op == "convert_chunk":
+            options = _get_chunk_options(request, (*CHUNK_STRATEGIES, "blocks"))
+            converter = self._chunk_converter(
+                options["max_size"], options["size_metric"]
+            )
+            markdown = _get_str(request, "markdown")
+            prefix = request.get("prefix")
+            if prefix is not None and not isinstance(prefix, str):
+                raise RequestError("'prefix' must be a string")
+            if options["strategy"] == "blocks":
+                del options["strategy"]
+                segments = converter.convert_segments(markdown)
+                if prefix:
+                    segments.insert(0, Segment(prefix, "paragraph"))
+                return _chunk_response(chunk_segments(segments, **options))
+            mrkdwn = (prefix or "") + converter.convert(markdown)
+            return _chunk_response(chunk_content(mrkdwn, **options))
+        raise RequestError(f"Unknown op: {op!r}")
+
+    def _chunk_converter(self, chunk_size: int, size_metric: str) -> Converter:
+        """Return a converter splitting tables into chunk_size code blocks."""
+        key = (chunk_size, size_metric)
+        with self._chunk_converters_lock:
+            converter = self._chunk_converters.get(key)
+            if converter is None:
+                if len(self._chunk_converters) >= MAX_CHUNK_CONVERTERS:
+                    self._chunk_converters.clear()
+                converter = Converter(
+                    self.converter.plugins,
+                    max_table_size=chunk_size,
+                    size_metric=size_metric,
+                )
+                self._chunk_converters[key] = converter
+            return converter
+
+
+def _get_chunk_options(
+    request: dict[str, Any], strategies: tuple[str, ...]
+) -> dict[str, Any]:
+    """Return the request's validated chunking options as keyword arguments."""
+    strategy = request.get("chunk_strategy", "greedy")
+    if strategy not in strategies:
+        raise RequestError(
+            f"'chunk_strategy' must be one of: {', '.join(strategies)}"
+        )
+    split_code_blocks = request.get("split_code_blocks", False)
+    if not isinstance(split_code_blocks, bool):
+        raise RequestError("'split_code_blocks' must be a boolean")
+    continued_marker = request.get("continued_marker")
+    if continued_marker is not None and not isinstance(continued_marker, str):
+        raise RequestError("'continued_marker' must be a string")
+    return {
+        "max_size": _get_chunk_size(request),
+        "strategy": strategy,
+        "split_code_blocks": split_code_blocks,
+        "continued_marker": continued_marker,
+        "size_metric": _get_size_metric(request),
+    }
+
+
+def _chunk_response(result: ChunkResult) -> dict[str, Any]:
+    """Serialize a chunking result for a response."""
+    return {
+        "chunks": [
+            {
+                "text": chunk.with_indicator,
+                "content": chunk.content,
+                "index": chunk.index,
+                "total": chunk.total,
+                "split_type": chunk.split_type,
+            }
+            for chunk in result.chunks
+        ],
+        "warnings": result.warnings,
+    }
+
+
+def _get_chunk_size(request: dict[str, Any]) -> int:
+    """Return the request's chunk_size, validated."""
+    chunk_size = request.get("chunk_size", DEFAULT_CHUNK_SIZE)
+    if not isinstance(chunk_size, int) or chunk_size < MIN_CHUNK_SIZE:
+        raise RequestError(
+            f"'chunk_size' must be an integer of at least {MIN_CHUNK_SIZE}"
+        )
+    return chunk_size
+
+
+def _get_size_metric(request: dict[str, Any]) -> str:
+    """Return the request's size_metric, validated."""
+    size_metric = request.get("size_metric", "chars")
+    if size_metric not in SIZE_METRICS:
+        raise RequestError(
+            f"'size_metric' must be one of: {', '.join(SIZE_METRICS)}"
+        )
+    return size_metric
+
+
+def _get_str(request: dict[str, Any], key: str) -> str:
+    """Return a required string field from a request."""
+    value = request.get(key)
+    if not isinstance(value, str):
+        raise RequestError(f"'{key}' must be a string")
+    return value
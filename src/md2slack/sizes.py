@@ -0,0 +1,154 @@
+"""Size metrics for measuring text against Slack's message limits.
+
+Slack's limits do not always count Unicode code points: multi-byte text,
+astral-plane emoji and escaped entities weigh more than one character.
+This module measures text under a chosen metric and indexes a document
+with prefix sums so the size of any range, and the furthest offset that
+fits a budget, are cheap to look up.
+
+Metrics:
+    chars: Unicode code points (len)
+    utf8: UTF-8 bytes
+    utf16: UTF-16 code units (emoji outside the BMP count twice)
+    escaped: Length after escaping &, < and > as &amp;, &lt; and &gt;
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable
+from itertools import accumulate
+
+__all__ = [
+    "METRIC_UNITS",
+    "SIZE_METRICS",
+    "SizeIndex",
+    "check_size_metric",
+    "text_size",
+]
+
+SIZE_METRICS = ("chars", "utf8", "utf16", "escaped")
+
+# Unit used when reporting sizes in messages
+METRIC_UNITS = {
+    "chars": "chars",
+    "utf8": "bytes",
+    "utf16": "UTF-16 units",
+    "escaped": "escaped chars",
+}
+
+_ESCAPE_WEIGHTS = {"&": 5, "<": 4, ">": 4}
+
+
+def _utf8_weight(char: str) -> int:
+    code = ord(char)
+    if code < 0x80:
+        return 1
+    if code < 0x800:
+        return 2
+    if code < 0x10000:
+        return 3
+    return 4
+
+
+def _utf16_weight(char: str) -> int:
+    return 1 if ord(char) < 0x10000 else 2
+
+
+def _escaped_weight(char: str) -> int:
+    return _ESCAPE_WEIGHTS.get(char, 1)
+
+
+# Per-character weight for every metric other than chars
+_CHAR_WEIGHTS: dict[str, Callable[[str], int]] = {
+    "utf8": _utf8_weight,
+    "utf16": _utf16_weight,
+    "escaped": _escaped_weight,
+}
+
+
+def check_size_metric(metric: str) -> None:
+    """Raise ValueError if metric is not one of SIZE_METRICS."""
+    if metric not in SIZE_METRICS:
+        raise ValueError(
+            f"Unknown size metric {metric!r}; "
+            f"expected one of: {', '.join(SIZE_METRICS)}"
+        )
+
+
+def text_size(text: str, metric: str = "chars") -> int:
+    """Return the size of text under a size metric.
+
+    Args:
+        text: The text to measure
+        metric: One of SIZE_METRICS
+
+    Returns:
+        Size of text in the metric's units
+
+    Raises:
+        ValueError: If metric is not one of SIZE_METRICS
+    """
+    if metric == "chars":
+        return len(text)
+    if metric == "utf8":
+        return len(text.encode("utf-8", "surrogatepass"))
+    if metric == "utf16":
+        return len(text.encode("utf-16-le", "surrogatepass")) // 2
+    if metric == "escaped":
+        return len(text) + 4 * text.count("&") + 3 * (
+            text.count("<") + text.count(">")
+        )
+    check_size_metric(metric)
+    raise AssertionError("unreachable")
+
+
+class SizeIndex:
+    """Prefix sums of character weights for O(log n) size queries.
+
+    When every character of the document weighs one unit under the
+    metric (always for chars, and for ASCII text under utf8), sizes are
+    plain offset differences and no prefix array is built.
+    """
+
+    def __init__(self, content: str, metric: str = "chars") -> None:
+        """Index content under a size metric.
+
+        Args:
+            content: The document to index
+            metric: One of SIZE_METRICS
+
+        Raises:
+            ValueError: If metric is not one of SIZE_METRICS
+        """
+        check_size_metric(metric)
+        self.metric = metric
+        self._length = len(content)
+        self._prefix: array[int] | None = None
+        # Every weight is at least 1, so equal totals mean all weights are 1
+        if metric != "chars" and text_size(content, metric) != len(content):
+            weights = map(_CHAR_WEIGHTS[metric], content)
+            self._prefix = array("q", accumulate(weights, initial=0))
+
+    def size(self, start: int = 0, end: int | None = None) -> int:
+        """Return the size of content[start:end]."""
+        if end is None:
+            end = self._length
+        if self._prefix is None:
+            return end - start
+        return self._prefix[end] - self._prefix[start]
+
+    def limit(self, start: int, max_size: int) -> int:
+        """Return the furthest end offset with size(start, end) <= max_size.
+
+        Args:
+            start: Offset the range begins at
+            max_size: Size budget for the range
+
+        Returns:
+            End offset, at most the length of the content
+        """
+        if self._prefix is None:
+            return min(start + max_size, self._length)
+        return bisect_right(self._prefix, self._prefix[start] + max_size) - 1
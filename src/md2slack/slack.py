@@ -4,13 +4,21 @@ This module provides:
 - Thread URL parsing to extract channel ID and thread timestamp
 - Slack API client for posting messages to threads
 - Error mapping for user-friendly error messages
+- Token-bucket rate limiting shared across threads
+- Retries with Retry-After support and jittered exponential backoff
 """
 
 from __future__ import annotations
 
 import os
+import random
 import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from typing import Any
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
@@ -73,6 +81,10 @@ ERROR_MAPPING: dict[str, tuple[str, str]] = {
         "Bot lacks required scope. Ensure chat:write is enabled.",
         "Add scope in Slack app config",
     ),
+    "connection_error": (
+        "Could not connect to Slack.",
+        "Check your network connection and retry",
+    ),
 }
 
 # Message length limits
@@ -80,6 +92,251 @@ MAX_MESSAGE_LENGTH = 39900  # Leave buffer for truncation indicator
 TRUNCATION_INDICATOR = "\n\n[Message truncated due to Slack's 40,000 character limit]"
 
 
+# chat.postMessage allows about one message per second per channel, with
+# short bursts tolerated
+DEFAULT_POST_RATE = 1.0
+DEFAULT_POST_BURST = 3
+
+# Workspace-wide cap across all channels (Slack allows several hundred
+# messages per minute per workspace)
+DEFAULT_WORKSPACE_RATE = 5.0
+DEFAULT_WORKSPACE_BURST = 10
+
+
+@dataclass
+class _Bucket:
+    """Token count of one bucket as of a point in time."""
+
+    tokens: float
+    updated: float
+
+
+class RateLimiter:
+    """Token-bucket rate limiter keyed by API method and channel.
+
+    Each (method, key) pair gets its own bucket holding up to ``burst``
+    tokens, refilled at ``rate`` tokens per second. Every call also takes a
+    token from a workspace-wide bucket for its method, which caps the total
+    rate across all channels. Callers reserve tokens under a lock and sleep
+    outside it, so one limiter can be shared by any number of threads
+    posting to the same or different channels.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_POST_RATE,
+        burst: int = DEFAULT_POST_BURST,
+        rates: dict[str, tuple[float, int]] | None = None,
+        workspace_rate: float | None = DEFAULT_WORKSPACE_RATE,
+        workspace_burst: int = DEFAULT_WORKSPACE_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Default calls per second for each bucket
+            burst: Default number of calls allowed back to back
+            rates: Per-method (rate, burst) overrides, e.g.
+                {"chat.postMessage": (1.0, 3)}
+            workspace_rate: Calls per second per method across all keys,
+                or None for no workspace-wide cap
+            workspace_burst: Calls per method allowed back to back across
+                all keys
+            clock: Monotonic clock returning seconds
+            sleep: Function used to wait for a token
+
+        Raises:
+            ValueError: If a rate is not positive or a burst is below 1
+        """
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self.workspace_rate = workspace_rate
+        self.workspace_burst = workspace_burst
+        limits = [(rate, burst), *self.rates.values()]
+        if workspace_rate is not None:
+            limits.append((workspace_rate, workspace_burst))
+        for limit_rate, limit_burst in limits:
+            if limit_rate <= 0:
+                raise ValueError(f"Rate must be positive, got {limit_rate}")
+            if limit_burst < 1:
+                raise ValueError(f"Burst must be at least 1, got {limit_burst}")
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+        self._workspace_buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _limits(self, method: str) -> tuple[float, int]:
+        return self.rates.get(method, (self.rate, self.burst))
+
+    def _refill(
+        self, buckets: dict, key: object, rate: float, burst: int, now: float
+    ) -> _Bucket:
+        """Return the bucket stored under key, topped up to now."""
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = _Bucket(burst, now)
+        else:
+            elapsed = max(now - bucket.updated, 0.0)
+            bucket.tokens = min(bucket.tokens + elapsed * rate, burst)
+            bucket.updated = now
+        return bucket
+
+    def _bucket_limits(
+        self, method: str, key: str
+    ) -> list[tuple[dict, object, float, int]]:
+        """Return (buckets, key, rate, burst) of every bucket a call uses."""
+        rate, burst = self._limits(method)
+        limits: list[tuple[dict, object, float, int]] = [
+            (self._buckets, (method, key), rate, burst)
+        ]
+        if self.workspace_rate is not None:
+            limits.append(
+                (
+                    self._workspace_buckets,
+                    method,
+                    self.workspace_rate,
+                    self.workspace_burst,
+                )
+            )
+        return limits
+
+    def reserve(self, method: str, key: str = "") -> float:
+        """Take a token for a call without waiting for it.
+
+        The caller must wait the returned delay before calling; async code
+        uses this to wait with asyncio.sleep() instead of blocking.
+
+        Args:
+            method: Slack API method, e.g. "chat.postMessage"
+            key: Scope of the limit within the method, usually a channel ID
+
+        Returns:
+            Seconds until the reserved tokens are available
+        """
+        wait = 0.0
+        with self._lock:
+            now = self._clock()
+            for buckets, bucket_key, rate, burst in self._bucket_limits(method, key):
+                bucket = self._refill(buckets, bucket_key, rate, burst, now)
+                # Reserve the token now; a negative balance queues later callers
+                bucket.tokens -= 1
+                wait = max(wait, -bucket.tokens / rate)
+        return wait
+
+    def acquire(self, method: str, key: str = "") -> float:
+        """Take a token for a call, waiting until one is available.
+
+        Args:
+            method: Slack API method, e.g. "chat.postMessage"
+            key: Scope of the limit within the method, usually a channel ID
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(method, key)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def backoff(
+        self, method: str, key: str, delay: float, workspace: bool = False
+    ) -> None:
+        """Hold off further calls after a failure.
+
+        Drains the bucket so the next acquire() for (method, key) waits at
+        least delay seconds, e.g. the Retry-After of a ratelimited error.
+
+        Args:
+            method: Slack API method that failed
+            key: Scope of the limit within the method
+            delay: Seconds to wait before the next call
+            workspace: Also hold off calls for every other key, as when
+                Slack reports a rate limit
+        """
+        with self._lock:
+            now = self._clock()
+            limits = self._bucket_limits(method, key)
+            if not workspace:
+                limits = limits[:1]
+            for buckets, bucket_key, rate, burst in limits:
+                bucket = self._refill(buckets, bucket_key, rate, burst, now)
+                bucket.tokens = min(bucket.tokens, 1 - delay * rate)
+
+
+# Error codes worth retrying; any HTTP 5xx response is retried as well
+RETRYABLE_ERRORS = frozenset(
+    {
+        "ratelimited",
+        "internal_error",
+        "fatal_error",
+        "service_unavailable",
+        "request_timeout",
+        "connection_error",
+    }
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When to retry a failed API call and how long to wait first.
+
+    Rate-limited calls wait for Slack's Retry-After delay. Other transient
+    failures wait a random time between zero and a cap that doubles with
+    each attempt ("full jitter"), so clients that failed together do not
+    retry together.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    retryable_errors: frozenset[str] = RETRYABLE_ERRORS
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(
+                f"max_attempts must be at least 1, got {self.max_attempts}"
+            )
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("Retry delays must not be negative")
+
+    def should_retry(self, code: str, status: int | None = None) -> bool:
+        """Return whether a failure with this error code or HTTP status is transient."""
+        return code in self.retryable_errors or (status is not None and status >= 500)
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the seconds to wait after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1
+            retry_after: Delay requested by Slack, if any
+
+        Returns:
+            retry_after when given, else a jittered exponential delay
+        """
+        if retry_after is not None:
+            return retry_after
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+
+# Call records kept per client; older ones are dropped so long-running
+# clients do not grow without bound
+MAX_CALL_RECORDS = 1000
+
+
+@dataclass
+class CallRecord:
+    """Outcome of one API call, including its retries."""
+
+    method: str
+    attempts: int
+    latency: float  # Seconds from the first attempt to the outcome
+    error: str | None = None
+
+
 def parse_thread_url(url: str) -> ThreadReference:
     """Parse a Slack thread URL to extract channel ID and thread timestamp.
 
@@ -169,16 +426,22 @@ def truncate_content(content: str) -> tuple[str, bool]:
     return truncated, True
 
 
-class SlackClient:
-    """Client for posting messages to Slack threads."""
+class BaseSlackClient:
+    """State and retry bookkeeping shared by the sync and async clients.
 
-    def __init__(self, token: str) -> None:
-        """Initialize Slack client with bot token.
+    Subclasses perform the API requests; this class decides, after each
+    failed attempt, whether to retry and how long the rate limiter should
+    hold the channel off, and keeps records of the most recent calls.
+    """
 
-        Args:
-            token: Slack bot token (xoxb-...)
-        """
-        self.client = WebClient(token=token)
+    def __init__(
+        self,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.calls: deque[CallRecord] = deque(maxlen=MAX_CALL_RECORDS)
         self._workspace: str | None = None
 
     def set_workspace(self, workspace: str) -> None:
@@ -189,11 +452,108 @@ class SlackClient:
         """
         self._workspace = workspace
 
+    def _message_result(self, channel_id: str, response: Any) -> dict[str, str]:
+        """Return the ts and permalink of a chat.postMessage response."""
+        ts = response.get("ts", "")
+        # Construct permalink from response
+        ts_no_dot = ts.replace(".", "")
+        workspace = self._workspace or "workspace"
+        permalink = f"https://{workspace}.slack.com/archives/{channel_id}/p{ts_no_dot}"
+
+        return {
+            "ts": ts,
+            "permalink": permalink,
+        }
+
+    def _succeeded(self, method: str, attempt: int, started: float) -> None:
+        """Record a call that succeeded on the given attempt."""
+        self.calls.append(CallRecord(method, attempt, time.monotonic() - started))
+
+    def _failed(
+        self,
+        method: str,
+        key: str,
+        attempt: int,
+        started: float,
+        exc: Exception,
+        connection_errors: tuple[type[BaseException], ...] = (OSError,),
+    ) -> None:
+        """Handle a failed attempt: back off and return, or raise.
+
+        Every wait, whether Retry-After or backoff, goes through the rate
+        limiter, so concurrent callers sharing it also hold off a channel
+        that Slack reported as rate limited.
+
+        Args:
+            method: Slack API method, for rate limiting and records
+            key: Rate-limit scope within the method (channel ID)
+            attempt: Number of the attempt that failed, starting at 1
+            started: time.monotonic() when the first attempt began
+            exc: The SlackApiError or connection error raised
+            connection_errors: Exception types meaning Slack was unreachable
+
+        Raises:
+            SlackError: If the error is permanent or attempts ran out
+        """
+        retry_after = None
+        if isinstance(exc, SlackApiError):
+            error = format_slack_error(exc)
+            status = getattr(exc.response, "status_code", None)
+            retryable = self.retry_policy.should_retry(
+                error.code, status if isinstance(status, int) else None
+            )
+            retry_after = _retry_after(exc)
+        elif isinstance(exc, connection_errors):
+            message, hint = ERROR_MAPPING["connection_error"]
+            error = SlackError("connection_error", f"{message} ({exc})", hint)
+            retryable = self.retry_policy.should_retry(error.code)
+        else:
+            raise exc
+
+        give_up = not retryable or attempt >= self.retry_policy.max_attempts
+        if error.code == "ratelimited" or not give_up:
+            delay = self.retry_policy.delay(attempt, retry_after)
+            self.rate_limiter.backoff(
+                method, key, delay, workspace=error.code == "ratelimited"
+            )
+        if give_up:
+            self.calls.append(
+                CallRecord(method, attempt, time.monotonic() - started, error.code)
+            )
+            raise error from exc
+
+
+class SlackClient(BaseSlackClient):
+    """Client for posting messages to Slack threads."""
+
+    def __init__(
+        self,
+        token: str,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        """Initialize Slack client with bot token.
+
+        Args:
+            token: Slack bot token (xoxb-...)
+            rate_limiter: Limiter consulted before each post; share one
+                between clients to pace them together (default: a new
+                RateLimiter with Slack's posting limits)
+            retry_policy: How failed calls are retried (default: RetryPolicy())
+            base_url: Slack Web API URL, e.g. a local server in tests
+        """
+        super().__init__(rate_limiter, retry_policy)
+        self.client = WebClient(token=token, base_url=base_url or WebClient.BASE_URL)
+
     def post_message(
         self, channel_id: str, thread_ts: str, text: str
     ) -> dict[str, str]:
         """Post a message to a Slack thread.
 
+        Waits for the rate limiter before each attempt and retries
+        transient failures according to the retry policy.
+
         Args:
             channel_id: Slack channel ID (e.g., C0123ABCD)
             thread_ts: Parent message timestamp (e.g., 1234567890.123456)
@@ -203,25 +563,43 @@ class SlackClient:
             Dict with 'ts' (message timestamp) and 'permalink'
 
         Raises:
-            SlackError: If the API call fails
+            SlackError: If the API call fails for good
         """
-        try:
-            response = self.client.chat_postMessage(
-                channel=channel_id,
-                text=text,
-                thread_ts=thread_ts,
-            )
-
-            ts = response.get("ts", "")
-            # Construct permalink from response
-            ts_no_dot = ts.replace(".", "")
-            workspace = self._workspace or "workspace"
-            permalink = f"https://{workspace}.slack.com/archives/{channel_id}/p{ts_no_dot}"
-
-            return {
-                "ts": ts,
-                "permalink": permalink,
-            }
-
-        except SlackApiError as e:
-            raise format_slack_error(e) from e
+        method = "chat.postMessage"
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            self.rate_limiter.acquire(method, channel_id)
+            try:
+                response = self.client.chat_postMessage(
+                    channel=channel_id,
+                    text=text,
+                    thread_ts=thread_ts,
+                )
+            except (SlackApiError, OSError) as e:
+                self._failed(method, channel_id, attempt, started, e)
+            else:
+                self._succeeded(method, attempt, started)
+                return self._message_result(channel_id, response)
+
+
+def _retry_after(error: SlackApiError) -> float | None:
+    """Return the Retry-After delay of an error response in seconds, if any.
+
+    Headers may be a plain dict (WebClient) or aiohttp's case-insensitive
+    CIMultiDictProxy (AsyncWebClient).
+    """
+    headers = getattr(error.response, "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get("Retry-After")
+    if value is None:
+        value = next(
+            (v for name, v in headers.items() if name.lower() == "retry-after"),
+            None,
+        )
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -7,6 +7,7 @@ tables as monospace code blocks using Unicode box-drawing characters.
 from __future__ import annotations
 
 import textwrap
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Literal
 
@@ -17,6 +18,7 @@ __all__ = [
     "TableRow",
     "Table",
     "render_table",
+    "render_table_parts",
     "wrap_cell",
 ]
 
@@ -41,6 +43,9 @@ class BoxChars:
 # Default character set using light lines
 LIGHT_BOX = BoxChars()
 
+# Column alignment from the markdown delimiter row (:--, :-:, --:)
+Alignment = Literal["left", "center", "right"]
+
 
 # T039: TableCell dataclass
 @dataclass
@@ -48,7 +53,7 @@ class TableCell:
     """A single cell in a table."""
 
     content: str
-    alignment: Literal["left", "center", "right"] | None = None
+    alignment: Alignment | None = None
     is_header: bool = False
 
     @property
@@ -116,11 +121,21 @@ def wrap_cell(content: str, width: int) -> list[str]:
     return textwrap.wrap(content, width=width) or [""]
 
 
+def _align(text: str, width: int, alignment: Alignment | None) -> str:
+    """Pad text to width according to the column alignment."""
+    if alignment == "right":
+        return text.rjust(width)
+    if alignment == "center":
+        return text.center(width)
+    return text.ljust(width)
+
+
 # T042: render_row_line helper
 def _render_row_line(
     cells: list[str],
     widths: list[int],
     box: BoxChars = LIGHT_BOX,
+    alignments: list[Alignment | None] | None = None,
 ) -> str:
     """Render a single line of a row with vertical bars.
 
@@ -128,13 +143,16 @@ def _render_row_line(
         cells: Cell contents for this line.
         widths: Column widths.
         box: Box-drawing character set.
+        alignments: Per-column alignment (left-aligned when omitted).
 
     Returns:
         Rendered line string.
     """
+    if alignments is None:
+        alignments = [None] * len(widths)
     parts = []
-    for cell, width in zip(cells, widths):
-        parts.append(f" {cell.ljust(width)} ")
+    for cell, width, alignment in zip(cells, widths, alignments):
+        parts.append(f" {_align(cell, width, alignment)} ")
     return box.vertical + box.vertical.join(parts) + box.vertical
 
 
@@ -175,6 +193,8 @@ def _render_multiline_row(row: TableRow, widths: list[int], box: BoxChars) -> li
     """
     height = row.height
     output_lines = []
+    alignments = [cell.alignment for cell in row.cells]
+    alignments += [None] * (len(widths) - len(alignments))
 
     for line_idx in range(height):
         line_contents = []
@@ -186,7 +206,9 @@ def _render_multiline_row(row: TableRow, widths: list[int], box: BoxChars) -> li
         # Pad with empty strings if row has fewer cells than columns
         while len(line_contents) < len(widths):
             line_contents.append("")
-        output_lines.append(_render_row_line(line_contents, widths, box))
+        output_lines.append(
+            _render_row_line(line_contents, widths, box, alignments)
+        )
 
     return output_lines
 
@@ -202,25 +224,58 @@ def render_table(table: Table, box: BoxChars = LIGHT_BOX) -> str:
     Returns:
         Rendered table as a string.
     """
-    widths = table.column_widths()
-    lines: list[str] = []
+    return render_table_parts(table, None, box)[0]
 
-    # Top border
-    lines.append(_render_separator(widths, box.top_left, box.top_t, box.top_right, box))
 
-    # Header row (may be multi-line)
-    lines.extend(_render_multiline_row(table.headers, widths, box))
+def render_table_parts(
+    table: Table,
+    max_size: int | None,
+    box: BoxChars = LIGHT_BOX,
+    measure: Callable[[str], int] = len,
+) -> list[str]:
+    """Render a table as one or more tables split on row boundaries.
 
-    # Header separator
-    lines.append(_render_separator(widths, box.left_t, box.cross, box.right_t, box))
+    Every part repeats the top border, header rows and header separator
+    and ends with the bottom border, using the column widths of the whole
+    table so the parts line up. A row too large to fit in a part on its
+    own is still emitted whole, in a part by itself.
 
-    # Data rows (may be multi-line)
-    for row in table.rows:
-        lines.extend(_render_multiline_row(row, widths, box))
+    Args:
+        table: The table to render.
+        max_size: Maximum characters per rendered part (None for one part).
+        box: Box-drawing character set to use.
+        measure: Size of a line of text, in the units of max_size.
+
+    Returns:
+        Rendered parts, in row order.
+    """
+    widths = table.column_widths()
 
-    # Bottom border
-    lines.append(
-        _render_separator(widths, box.bottom_left, box.bottom_t, box.bottom_right, box)
+    # Top border, header row (may be multi-line) and header separator
+    frame = [
+        _render_separator(widths, box.top_left, box.top_t, box.top_right, box),
+        *_render_multiline_row(table.headers, widths, box),
+        _render_separator(widths, box.left_t, box.cross, box.right_t, box),
+    ]
+    bottom = _render_separator(
+        widths, box.bottom_left, box.bottom_t, box.bottom_right, box
     )
+    frame_size = sum(measure(line) + 1 for line in frame) + measure(bottom)
 
-    return "\n".join(lines)
+    parts: list[str] = []
+    lines: list[str] = []
+    size = frame_size
+
+    # Data rows (may be multi-line)
+    for row in table.rows:
+        row_lines = _render_multiline_row(row, widths, box)
+        row_size = sum(measure(line) + 1 for line in row_lines)
+        if max_size is not None and lines and size + row_size > max_size:
+            parts.append("\n".join([*frame, *lines, bottom]))
+            lines = []
+            size = frame_size
+        lines.extend(row_lines)
+        size += row_size
+
+    parts.append("\n".join([*frame, *lines, bottom]))
+    return parts
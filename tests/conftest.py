@@ -3,8 +3,12 @@
 This module provides fixtures for:
 - markdown_samples: Dictionary of sample markdown patterns for conversion testing
 - markdown_file: Temporary markdown file for file-based input testing
+- fake_slack: Local Slack Web API server with scripted responses
 """
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -74,3 +78,47 @@ def markdown_file(tmp_path: Path) -> Path:
     md_file = tmp_path / "test.md"
     md_file.write_text("# Sample Heading\n\nThis is sample content.")
     return md_file
+
+
+@pytest.fixture
+def fake_slack():
+    """Run a local Slack Web API answering with scripted responses.
+
+    Yields a (base_url, responses, requests) tuple: append
+    (status, headers, body) tuples to responses before posting, and
+    inspect the request bodies received in requests. Once the scripted
+    responses run out, every request succeeds.
+    """
+    responses: list[tuple[int, dict[str, str], dict | str]] = []
+    requests: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            requests.append(self.rfile.read(length).decode())
+            if responses:
+                status, headers, body = responses.pop(0)
+            else:
+                status, headers, body = 200, {}, {"ok": True, "ts": "1.000001"}
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(
+                (body if isinstance(body, str) else json.dumps(body)).encode()
+            )
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/", responses, requests
+    finally:
+        server.shutdown()
+        server.server_close()
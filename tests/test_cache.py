@@ -0,0 +1,90 @@
+"""Tests for the conversion cache."""
+
+from __future__ import annotations
+
+import os
+
+from md2slack.cache import ConversionCache, default_cache_dir
+from md2slack.converter import Converter, convert
+
+
+class TestDefaultCacheDir:
+    """Tests for default_cache_dir function."""
+
+    def test_uses_xdg_cache_home(self, monkeypatch, tmp_path):
+        """XDG_CACHE_HOME overrides the home directory location."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "md2slack"
+
+    def test_defaults_to_home_cache(self, monkeypatch):
+        """Without XDG_CACHE_HOME the cache lives under ~/.cache."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        assert default_cache_dir().parts[-2:] == (".cache", "md2slack")
+
+
+class TestMemoryCache:
+    """Tests for the in-process LRU."""
+
+    def test_miss_then_hit(self):
+        """Second conversion of the same input is a hit."""
+        cache = ConversionCache()
+        first = cache.convert("**status**")
+        second = cache.convert("**status**")
+        assert first == second == convert("**status**")
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    def test_key_depends_on_input(self):
+        """Different inputs produce different keys."""
+        cache = ConversionCache()
+        assert cache.key("a") != cache.key("b")
+
+    def test_key_depends_on_converter_options(self):
+        """Converters with different plugins produce different keys."""
+        default = ConversionCache(Converter())
+        plain = ConversionCache(Converter(plugins=()))
+        assert default.key("a") != plain.key("a")
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted beyond max_entries."""
+        cache = ConversionCache(max_entries=2)
+        cache.convert("one")
+        cache.convert("two")
+        cache.convert("one")  # refresh "one"
+        cache.convert("three")  # evicts "two"
+        cache.convert("one")
+        cache.convert("two")
+        assert cache.stats.hits == 2
+        assert cache.stats.misses == 4
+
+
+class TestDiskCache:
+    """Tests for the on-disk store."""
+
+    def test_shared_between_instances(self, tmp_path):
+        """A new cache instance reads entries written by another."""
+        ConversionCache(directory=tmp_path).convert("# Report")
+        cache = ConversionCache(directory=tmp_path)
+        assert cache.convert("# Report") == convert("# Report")
+        assert cache.stats.hits == 1
+        assert cache.stats.disk_hits == 1
+
+    def test_size_bounded_eviction(self, tmp_path):
+        """Oldest entries are deleted once max_bytes is exceeded."""
+        cache = ConversionCache(directory=tmp_path, max_bytes=250)
+        for i in range(5):
+            cache.convert(f"{i} " + "x" * 100)
+            path = cache._entry_path(cache.key(f"{i} " + "x" * 100))
+            os.utime(path, (i, i))
+        entries = list((tmp_path / "conversions").glob("*.mrkdwn"))
+        assert 0 < len(entries) <= 2
+        assert sum(p.stat().st_size for p in entries) <= 250
+
+    def test_clear(self, tmp_path):
+        """clear() empties memory and disk."""
+        cache = ConversionCache(directory=tmp_path)
+        cache.convert("text")
+        cache.clear()
+        assert list((tmp_path / "conversions").glob("*.mrkdwn")) == []
+        cache.convert("text")
+        assert cache.stats.misses == 2
@@ -1,13 +1,21 @@
 """Tests for md2slack content chunker."""
 
+import pytest
+
 from md2slack.chunker import (
+    BoundaryIndex,
     Chunk,
     ChunkResult,
+    CodeBlockIndex,
+    Segment,
     chunk_content,
+    chunk_segments,
     find_code_block_boundaries,
     find_paragraph_boundary,
     find_sentence_boundary,
     is_inside_code_block,
+    iter_chunks,
+    split_oversized_code_blocks,
 )
 
 # =============================================================================
@@ -278,6 +286,42 @@ class TestHelperFunctions:
         assert is_inside_code_block(75, ranges) is False
         assert is_inside_code_block(200, ranges) is False
 
+    def test_code_block_index_sequence(self):
+        """CodeBlockIndex behaves like a sorted list of ranges."""
+        index = CodeBlockIndex([(100, 150), (10, 50)])
+        assert len(index) == 2
+        assert list(index) == [(10, 50), (100, 150)]
+        assert index[0] == (10, 50)
+
+    def test_code_block_index_block_at(self):
+        """block_at returns the containing range or None."""
+        index = CodeBlockIndex([(10, 50), (100, 150)])
+        assert index.block_at(10) == (10, 50)
+        assert index.block_at(49) == (10, 50)
+        assert index.block_at(50) is None
+        assert index.block_at(125) == (100, 150)
+        assert index.block_at(5) is None
+
+    def test_code_block_index_next_block_start(self):
+        """next_block_start finds the first block at or after a position."""
+        index = CodeBlockIndex([(10, 50), (100, 150)])
+        assert index.next_block_start(0) == 10
+        assert index.next_block_start(10) == 10
+        assert index.next_block_start(60) == 100
+        assert index.next_block_start(151) is None
+
+    def test_find_code_block_boundaries_returns_index(self):
+        """find_code_block_boundaries builds a CodeBlockIndex."""
+        boundaries = find_code_block_boundaries("a\n\n```\nx\n```\n")
+        assert isinstance(boundaries, CodeBlockIndex)
+        assert boundaries.contains(5)
+
+    def test_paragraph_boundary_skips_code_blocks(self):
+        """Paragraph breaks inside code blocks are skipped."""
+        content = "Intro.\n\n```\na\n\nb\n\nc\n```\nTail."
+        boundaries = find_code_block_boundaries(content)
+        assert find_paragraph_boundary(content, len(content), boundaries) == 8
+
     def test_find_paragraph_boundary_found(self):
         """Finds paragraph boundary when present."""
         # Use longer content to ensure search window covers the boundary
@@ -371,6 +415,284 @@ class TestContentPreservation:
         assert positions == sorted(positions), "Chunk order doesn't match doc order"
 
 
+class TestOffsetChunking:
+    """Tests for offset-based chunk extraction."""
+
+    def test_chunks_reassemble_document(self):
+        """Chunks are consecutive slices of the document, minus whitespace."""
+        para = "Sentence one. Sentence two! Sentence three?\n\n"
+        code = "```\ncode line\n```\n\n"
+        content = (para * 10 + code) * 30
+        result = chunk_content(content, max_size=1000)
+        assert result.chunk_count > 1
+
+        pos = 0
+        for chunk in result.chunks:
+            found = content.find(chunk.content, pos)
+            assert found >= 0
+            assert content[pos:found].strip() == ""
+            pos = found + len(chunk.content)
+        assert content[pos:].strip() == ""
+
+    def test_code_blocks_not_split_deep_in_document(self):
+        """Code block positions are tracked correctly far into the document."""
+        para = "Text line here.\n" * 40 + "\n"
+        code = "```\n" + "x = 1\n" * 20 + "```\n\n"
+        content = (para + code) * 20
+        result = chunk_content(content, max_size=1000)
+        for chunk in result.chunks:
+            assert chunk.content.count("```") % 2 == 0
+
+
+class TestBoundaryIndex:
+    """Tests for the precomputed paragraph/sentence boundary index."""
+
+    def test_last_boundaries_before_limit(self):
+        """Lookups return the last boundary ending at or before the limit."""
+        content = "One. Two.\n\nThree! Four? Five.\n\nSix."
+        index = BoundaryIndex(content)
+        assert index.last_paragraph(0, len(content)) == content.rfind("\n\n") + 2
+        assert index.last_paragraph(0, 11) == 11
+        assert index.last_paragraph(0, 10) is None
+        assert index.last_sentence(0, len(content)) == content.rfind("? ") + 2
+
+    def test_respects_start(self):
+        """Boundaries before start are not returned."""
+        content = "One. Two three four"
+        index = BoundaryIndex(content)
+        assert index.last_sentence(0, len(content)) == 5
+        assert index.last_sentence(3, len(content)) == 5
+        assert index.last_sentence(4, len(content)) is None
+
+    def test_ignores_boundaries_in_code_blocks(self):
+        """Boundaries inside code blocks are skipped."""
+        content = "Intro.\n\n```\na. b\n\nc\n```\nTail text"
+        index = BoundaryIndex(content, find_code_block_boundaries(content))
+        assert index.last_paragraph(0, len(content)) == content.find("\n\n") + 2
+        assert index.last_sentence(0, len(content)) is None
+
+    def test_matches_search_helpers(self):
+        """Index lookups agree with the windowed helper functions."""
+        content = ("Alpha. Beta!\n\n```\nx. y\n\n```\nGamma? Delta.\n\n\n") * 20
+        ranges = find_code_block_boundaries(content)
+        index = BoundaryIndex(content, ranges)
+        for start in range(0, len(content), 37):
+            for limit in range(start, len(content) + 1, 53):
+                assert index.last_paragraph(start, limit) == (
+                    find_paragraph_boundary(content, limit, ranges, start)
+                )
+                assert index.last_sentence(start, limit) == (
+                    find_sentence_boundary(content, limit, ranges, start)
+                )
+
+
+class TestIterChunks:
+    """Tests for lazily generated chunks."""
+
+    CONTENT = ("Sentence one. Sentence two! Sentence three?\n\n" * 30) * 5
+
+    def test_matches_chunk_content(self):
+        """iter_chunks yields the same chunks as chunk_content."""
+        result = chunk_content(self.CONTENT, max_size=1000)
+        assert list(iter_chunks(self.CONTENT, max_size=1000)) == result.chunks
+
+    def test_unknown_total_until_last_chunk(self):
+        """Without count_total only the last chunk knows the total."""
+        chunks = list(iter_chunks(self.CONTENT, max_size=1000, count_total=False))
+        assert len(chunks) > 1
+        assert all(chunk.total is None for chunk in chunks[:-1])
+        assert chunks[-1].total == len(chunks)
+        assert chunks[0].indicator == "(1/?)"
+        expected = chunk_content(self.CONTENT, max_size=1000).chunks
+        assert [c.content for c in chunks] == [c.content for c in expected]
+
+    def test_short_content_single_chunk(self):
+        """Content within the limit yields one chunk with total 1."""
+        chunks = list(iter_chunks("short", count_total=False))
+        assert chunks == [Chunk(content="short", index=0, total=1, split_type="none")]
+
+
+class TestBalancedStrategy:
+    """Tests for the balanced (dynamic programming) chunk strategy."""
+
+    def test_avoids_tiny_trailing_chunk(self):
+        """Balanced splits even out what greedy leaves as a small tail."""
+        content = "Short paragraph of text here.\n\n" * 40
+        greedy = chunk_content(content, max_size=1000)
+        balanced = chunk_content(content, max_size=1000, strategy="balanced")
+        assert balanced.chunk_count == greedy.chunk_count
+        greedy_sizes = [len(c.content) for c in greedy.chunks]
+        balanced_sizes = [len(c.content) for c in balanced.chunks]
+        assert min(greedy_sizes) < 300
+        assert max(balanced_sizes) - min(balanced_sizes) < 100
+
+    def test_evens_out_sentence_only_text(self):
+        """Dense sentence boundaries across many chunks still even out."""
+        content = "Rows copied. Next step! Any questions? " * 500
+        greedy = chunk_content(content, max_size=1000)
+        balanced = chunk_content(content, max_size=1000, strategy="balanced")
+        assert balanced.chunk_count == greedy.chunk_count
+        assert "".join(c.content for c in balanced.chunks).replace(" ", "") == (
+            content.replace(" ", "")
+        )
+        sizes = [len(c.content) for c in balanced.chunks]
+        assert len(greedy.chunks[-1].content) < 700
+        assert max(sizes) - min(sizes) < 50
+
+    def test_never_more_chunks_than_greedy(self):
+        """Balanced chunking minimizes the chunk count first."""
+        para = "Sentence one. Sentence two! Sentence three?\n\n"
+        content = (para * 7 + "```\n" + "x = 1\n" * 30 + "```\n\n") * 10
+        greedy = chunk_content(content, max_size=700)
+        balanced = chunk_content(content, max_size=700, strategy="balanced")
+        assert balanced.chunk_count <= greedy.chunk_count
+        for chunk in balanced.chunks:
+            assert len(chunk.content) <= 700
+            assert chunk.content.count("```") % 2 == 0
+
+    def test_prefers_paragraph_over_sentence(self):
+        """A paragraph boundary is used when one is in reach."""
+        content = ("word " * 60 + "end. ") * 2 + "\n\n" + "tail " * 120
+        result = chunk_content(content, max_size=700, strategy="balanced")
+        assert result.chunks[0].split_type == "paragraph"
+        assert result.chunks[-1].split_type == "end"
+
+    def test_unknown_strategy(self):
+        """Unknown strategies raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown chunk strategy"):
+            chunk_content("x" * 2000, max_size=500, strategy="random")
+
+
+class TestSplitCodeBlocks:
+    """Tests for splitting oversized code blocks on line boundaries."""
+
+    LOG = (
+        "Intro.\n\n```python\n"
+        + "".join(f"line {i}: something happened\n" for i in range(200))
+        + "```\n\nAfter the log."
+    )
+
+    def test_pieces_fit_and_reopen_fence(self):
+        """Every chunk fits and each piece is a complete fenced block."""
+        result = chunk_content(self.LOG, max_size=1000, split_code_blocks=True)
+        assert result.warnings == []
+        assert result.chunk_count > 1
+        for chunk in result.chunks:
+            assert len(chunk.content) <= 1000
+            assert chunk.content.count("```") % 2 == 0
+        assert result.chunks[1].content.startswith("```python\n")
+
+    def test_all_lines_preserved_in_order(self):
+        """Splitting keeps every line of the block, in order."""
+        result = chunk_content(self.LOG, max_size=1000, split_code_blocks=True)
+        lines = [
+            line
+            for chunk in result.chunks
+            for line in chunk.content.split("\n")
+            if line.startswith("line ")
+        ]
+        assert lines == [f"line {i}: something happened" for i in range(200)]
+
+    def test_continued_marker(self):
+        """The marker follows every piece except the last."""
+        content, warnings = split_oversized_code_blocks(
+            self.LOG, 1000, continued_marker="(continued)"
+        )
+        pieces = content.count("```python")
+        assert pieces > 1
+        assert content.count("```\n(continued)") == pieces - 1
+        assert content.endswith("```\n\nAfter the log.")
+
+    def test_small_blocks_untouched(self):
+        """Blocks within the limit are left exactly as they are."""
+        content = "Text.\n\n```\nshort\n```\n\n" + "More text. " * 200
+        assert split_oversized_code_blocks(content, 1000) == (content, [])
+
+    def test_overlong_line_warns(self):
+        """A single line longer than a chunk is kept whole and reported."""
+        content = "```\n" + "x" * 1500 + "\nshort\n```"
+        rewritten, warnings = split_oversized_code_blocks(content, 1000)
+        assert "x" * 1500 in rewritten
+        assert len(warnings) == 1
+        assert "line 1" in warnings[0]
+
+
+class TestSizeMetric:
+    """Tests for chunking under non-character size metrics."""
+
+    def test_utf8_chunks_fit_in_bytes(self):
+        """CJK text is packed by UTF-8 bytes, not code points."""
+        content = "漢字のテキストです。これは文です。\n\n" * 200
+        result = chunk_content(content, max_size=1000, size_metric="utf8")
+        assert result.chunk_count > chunk_content(content, max_size=1000).chunk_count
+        for chunk in result.chunks:
+            assert len(chunk.content.encode("utf-8")) <= 1000
+
+    def test_utf16_counts_emoji_twice(self):
+        """Astral-plane emoji weigh two UTF-16 units each."""
+        content = "\U0001F600" * 600
+        assert chunk_content(content, max_size=1000).chunk_count == 1
+        result = chunk_content(content, max_size=1000, size_metric="utf16")
+        assert [len(c.content) for c in result.chunks] == [500, 100]
+
+    def test_warning_uses_metric_unit(self):
+        """Oversized block warnings report sizes in the metric's unit."""
+        content = "```\n" + "é" * 800 + "\n```\n\n" + "Text. " * 100
+        result = chunk_content(content, max_size=1000, size_metric="utf8")
+        assert "bytes" in result.warnings[0]
+
+
+class TestChunkSegments:
+    """Tests for packing rendered blocks into chunks."""
+
+    def test_never_splits_a_segment(self):
+        """Segments that fit a chunk are never split across chunks."""
+        segments = [
+            Segment(f"• item {i} " + "word " * 40 + "\n", "list")
+            for i in range(30)
+        ]
+        result = chunk_segments(segments, max_size=1000)
+        assert result.chunk_count > 1
+        texts = {s.text for s in segments}
+        for chunk in result.chunks:
+            assert len(chunk.content) <= 1000
+            parts = chunk.content.split("\n")[:-1]
+            assert all(part + "\n" in texts for part in parts)
+
+    def test_split_types(self):
+        """Chunks end at block boundaries, and the last one at the end."""
+        segments = [Segment("x" * 600 + "\n\n", "paragraph")] * 3
+        result = chunk_segments(segments, max_size=1000)
+        assert [c.split_type for c in result.chunks] == ["block", "block", "end"]
+        assert result.chunks[-1].total == 3
+
+    def test_single_chunk(self):
+        """Content that fits in one chunk is returned unsplit."""
+        result = chunk_segments([Segment("Hi.\n\n", "paragraph")], max_size=1000)
+        assert result.chunk_count == 1
+        assert result.chunks[0].split_type == "none"
+
+    def test_oversized_segment_falls_back(self):
+        """A segment larger than a chunk is split by the text chunker."""
+        big = Segment("Sentence here. " * 200 + "\n\n", "paragraph")
+        result = chunk_segments(
+            [Segment("Intro.\n\n", "paragraph"), big], max_size=1000
+        )
+        assert result.chunk_count > 2
+        for chunk in result.chunks:
+            assert len(chunk.content) <= 1000
+
+    def test_oversized_code_warning_line(self):
+        """Warnings for oversized code give the line in the whole document."""
+        segments = [
+            Segment("One.\n\nTwo.\n\n", "paragraph"),
+            Segment("```\n" + "x" * 1500 + "\n```\n\n", "code"),
+        ]
+        result = chunk_segments(segments, max_size=1000)
+        assert len(result.warnings) == 1
+        assert "line 5" in result.warnings[0]
+
+
 class TestEdgeCases:
     """Tests for edge cases."""
 
@@ -1,7 +1,17 @@
 """Tests for the markdown to Slack mrkdwn converter."""
 
+from concurrent.futures import ThreadPoolExecutor
 
-from md2slack.converter import SlackMrkdwnRenderer, convert
+from md2slack.converter import (
+    Converter,
+    SlackMrkdwnRenderer,
+    convert,
+    convert_batch,
+    convert_many,
+    convert_stream,
+    get_default_converter,
+    split_blocks,
+)
 
 
 class TestConvert:
@@ -100,6 +110,32 @@ class TestConvert:
             assert "Second" in result
             assert "Third" in result
 
+        def test_numbered_list_numbers_items(self):
+            """Ordered list items are numbered from 1."""
+            result = convert("1. First\n2. Second\n3. Third")
+            assert result == "1. First\n2. Second\n3. Third\n\n"
+
+        def test_numbered_list_start_number(self):
+            """Ordered lists keep their starting number."""
+            result = convert("3. Third\n4. Fourth")
+            assert result.startswith("3. Third\n4. Fourth")
+
+        def test_ordered_list_after_bullet_list(self):
+            """A preceding bullet list does not affect ordered numbering."""
+            result = convert("- a\n\n1. First\n2. Second")
+            assert "1. First\n2. Second" in result
+
+        def test_nested_ordered_lists_keep_counters(self):
+            """Nested ordered lists do not clobber the outer counter."""
+            md = "1. Outer one\n   1. Inner one\n   2. Inner two\n2. Outer two"
+            result = convert(md)
+            assert result == (
+                "1. Outer one\n"
+                "    1. Inner one\n"
+                "    2. Inner two\n"
+                "2. Outer two\n\n"
+            )
+
 
 class TestSlackMrkdwnRenderer:
     """Test the SlackMrkdwnRenderer class."""
@@ -110,6 +146,208 @@ class TestSlackMrkdwnRenderer:
         assert renderer.NAME == "slack"
 
 
+class TestConverter:
+    """Test the reusable Converter object."""
+
+    def test_convert_matches_module_function(self):
+        """Converter.convert() produces the same output as convert()."""
+        md = "# Title\n\n**bold** and [link](https://example.com)"
+        assert Converter().convert(md) == convert(md)
+
+    def test_converter_reused_across_documents(self):
+        """One converter converts several documents independently."""
+        converter = Converter()
+        assert converter.convert("**a**") == "*a*\n\n"
+        assert converter.convert("~~b~~") == "~b~\n\n"
+
+    def test_list_state_reset_between_documents(self):
+        """List state from one document does not leak into the next."""
+        converter = Converter()
+        first = converter.convert("1. One\n2. Two")
+        second = converter.convert("1. One\n2. Two")
+        assert first == second
+
+    def test_max_table_size_splits_tables(self):
+        """Tables larger than max_table_size become several code blocks."""
+        rows = "\n".join(f"| row {i} | {i} |" for i in range(300))
+        md = f"| Name | Value |\n|---|---|\n{rows}\n"
+        result = Converter(max_table_size=1000).convert(md)
+        blocks = [b for b in result.split("\n\n") if b]
+        assert len(blocks) > 1
+        for block in blocks:
+            assert len(block) <= 1000
+            assert block.startswith("```\n\u250c")
+            assert block.endswith("\u2518\n```")
+            assert "Name" in block
+        assert Converter().convert(md).count("```") == 2
+
+    def test_max_table_size_in_fingerprint(self):
+        """Table splitting changes output, so it changes the fingerprint."""
+        assert Converter(max_table_size=1000).fingerprint != Converter().fingerprint
+
+    def test_convert_many_preserves_order(self):
+        """convert_many() returns outputs in input order."""
+        results = convert_many(["**one**", "**two**", "**three**"])
+        assert results == ["*one*\n\n", "*two*\n\n", "*three*\n\n"]
+
+    def test_default_converter_is_cached(self):
+        """get_default_converter() returns the same instance each time."""
+        assert get_default_converter() is get_default_converter()
+
+    def test_shared_converter_across_threads(self):
+        """One converter can be shared by a thread pool."""
+        converter = Converter()
+        docs = [
+            "\n".join(f"{i}. item {n}" for i in range(1, 30)) for n in range(40)
+        ]
+        expected = [converter.convert(doc) for doc in docs]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(converter.convert, docs))
+        assert results == expected
+
+    def test_plugins_recorded(self):
+        """Converter exposes the enabled plugin names."""
+        assert Converter().plugins == ("strikethrough", "table")
+
+
+STREAM_DOC = """# Release notes
+
+Intro paragraph with **bold** text.
+
+- first
+- second
+
+  continued item
+
+1. one
+2. two
+
+```
+code
+
+# not a heading
+```
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+> quoted
+
+Final paragraph.
+"""
+
+
+class TestConvertSegments:
+    """Test rendering markdown as one segment per block."""
+
+    MD = (
+        "# Title\n\nPara.\n\n- a\n- b\n  - c\n\n> quote\n\n"
+        "```\nx\n```\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+    )
+
+    def test_segments_concatenate_to_convert(self):
+        """Joining the segments gives exactly the converted document."""
+        converter = Converter()
+        segments = converter.convert_segments(self.MD)
+        assert "".join(s.text for s in segments) == converter.convert(self.MD)
+
+    def test_segment_kinds(self):
+        """Each top-level block and list item gets its own segment."""
+        kinds = [s.kind for s in Converter().convert_segments(self.MD)]
+        assert kinds == [
+            "heading", "paragraph", "list", "list", "quote", "code", "table"
+        ]
+
+    def test_nested_list_stays_with_item(self):
+        """A nested list belongs to the segment of its parent item."""
+        segments = Converter().convert_segments("- a\n- b\n  - c\n")
+        assert [s.text for s in segments] == ["• a\n", "• b\n    • c\n\n"]
+
+
+class TestConvertBatch:
+    """Test parallel batch conversion."""
+
+    def test_batch_matches_sequential(self):
+        """Process pool output equals in-process conversion, in order."""
+        docs = [f"# Doc {i}\n\n**item** {i}" for i in range(20)]
+        assert convert_batch(docs, workers=2, chunksize=3) == convert_many(docs)
+
+    def test_single_worker_runs_in_process(self):
+        """One worker converts without starting a pool."""
+        assert convert_batch(["**a**", "**b**"], workers=1) == ["*a*\n\n", "*b*\n\n"]
+
+    def test_empty_batch(self):
+        """An empty batch returns an empty list."""
+        assert convert_batch([]) == []
+
+
+class TestConvertStream:
+    """Test streaming conversion."""
+
+    def test_split_blocks_round_trip(self):
+        """Blocks concatenate back to the original text."""
+        lines = STREAM_DOC.splitlines(keepends=True)
+        assert "".join(split_blocks(lines)) == STREAM_DOC
+
+    def test_split_blocks_keeps_fenced_code_together(self):
+        """Blank lines inside fenced code do not end a block."""
+        blocks = list(split_blocks(STREAM_DOC.splitlines(keepends=True)))
+        code_blocks = [b for b in blocks if "```" in b]
+        assert len(code_blocks) == 1
+        assert "# not a heading" in code_blocks[0]
+
+    def test_split_blocks_keeps_loose_list_together(self):
+        """A list item after a blank line stays in the same block."""
+        blocks = list(split_blocks(["- a\n", "\n", "- b\n"]))
+        assert blocks == ["- a\n\n- b\n"]
+
+    def test_stream_matches_convert(self):
+        """Streaming output equals whole-document conversion."""
+        lines = STREAM_DOC.splitlines(keepends=True)
+        streamed = "".join(convert_stream(lines, batch_size=1))
+        assert streamed == convert(STREAM_DOC)
+
+    def test_stream_yields_incrementally(self):
+        """Small batches yield several fragments."""
+        lines = STREAM_DOC.splitlines(keepends=True)
+        fragments = list(convert_stream(lines, batch_size=1))
+        assert len(fragments) > 1
+
+    def test_stream_empty_input(self):
+        """Empty input yields nothing."""
+        assert list(convert_stream([])) == []
+
+    CHANGELOG = "# Changelog\n\n" + "".join(
+        f"## [1.0.{i}] - 2024-01-01\n\n- Change {i}\n\n" for i in range(300)
+    ) + "".join(f"[1.0.{i}]: https://example.com/v1.0.{i}\n" for i in range(300))
+
+    def test_stream_resolves_later_references(self, tmp_path):
+        """Definitions beyond the first batch resolve in every batch."""
+        path = tmp_path / "CHANGELOG.md"
+        path.write_text(self.CHANGELOG)
+        with open(path, encoding="utf-8") as stream:
+            fragments = list(convert_stream(stream, batch_size=1024))
+        assert len(fragments) > 1
+        assert "".join(fragments) == convert(self.CHANGELOG)
+        assert "*<https://example.com/v1.0.0|1.0.0> - 2024-01-01*" in fragments[0]
+
+    def test_stream_references_from_unseekable_input(self):
+        """Definitions also resolve when lines can only be read once."""
+        lines = iter(self.CHANGELOG.splitlines(keepends=True))
+        streamed = "".join(convert_stream(lines, batch_size=1024))
+        assert streamed == convert(self.CHANGELOG)
+
+    def test_collect_references_first_wins(self):
+        """The first definition of a label wins; code is not parsed."""
+        lines = [
+            "```\n", "[a]: https://code\n", "```\n", "\n",
+            "[a]: https://one\n", "\n", "[A]: https://two\n",
+        ]
+        references = Converter().collect_references(lines)
+        assert [ref["url"] for ref in references.values()] == ["https://one"]
+
+
 # Phase 5: User Story 3 - Edge Cases
 class TestEdgeCases:
     """Test edge case handling (US3)."""
@@ -266,3 +504,39 @@ class TestBrTagSupport:
         assert "X" in result
         assert "Y" in result
         assert "Z" in result
+
+
+class TestStripMrkdwnFormatting:
+    """Test stripping of mrkdwn formatting from table cells."""
+
+    def test_strips_each_markup_type(self):
+        """Backticks, links, bold, italic and strikethrough are removed."""
+        from md2slack.converter import _strip_mrkdwn_formatting
+
+        assert _strip_mrkdwn_formatting("`code`") == "code"
+        assert _strip_mrkdwn_formatting("<https://example.com|Docs>") == "Docs"
+        assert _strip_mrkdwn_formatting("<https://example.com>") == (
+            "https://example.com"
+        )
+        assert _strip_mrkdwn_formatting("*bold*") == "bold"
+        assert _strip_mrkdwn_formatting("_italic_") == "italic"
+        assert _strip_mrkdwn_formatting("~old~") == "old"
+
+    def test_nested_markup(self):
+        """Markup nested inside links or bold is stripped too."""
+        from md2slack.converter import _strip_mrkdwn_formatting
+
+        assert _strip_mrkdwn_formatting("<https://x.io|*bold* link>") == "bold link"
+        assert _strip_mrkdwn_formatting("*bold _and italic_*") == "bold and italic"
+
+    def test_identifiers_keep_underscores(self):
+        """Underscores inside identifiers are not treated as italics."""
+        from md2slack.converter import _strip_mrkdwn_formatting
+
+        assert _strip_mrkdwn_formatting("snake_case_name") == "snake_case_name"
+
+    def test_plain_text_unchanged(self):
+        """Text without formatting is returned unchanged."""
+        from md2slack.converter import _strip_mrkdwn_formatting
+
+        assert _strip_mrkdwn_formatting("plain &amp; simple") == "plain &amp; simple"
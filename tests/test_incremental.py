@@ -0,0 +1,92 @@
+"""Tests for incremental block-level re-conversion."""
+
+from __future__ import annotations
+
+from md2slack.converter import convert
+from md2slack.incremental import IncrementalConverter
+
+DOC = """# Notes
+
+First paragraph.
+
+- item one
+- item two
+
+```
+code block
+```
+
+Last paragraph.
+"""
+
+
+class TestIncrementalConverter:
+    """Tests for IncrementalConverter."""
+
+    def test_first_conversion_matches_convert(self):
+        """Initial conversion renders every block and matches convert()."""
+        result = IncrementalConverter().convert(DOC)
+        assert result.output == convert(DOC)
+        assert result.reused_count == 0
+        assert result.rendered_count == len(result.blocks)
+
+    def test_unchanged_document_reuses_all_blocks(self):
+        """Re-converting the same document renders nothing."""
+        converter = IncrementalConverter()
+        converter.convert(DOC)
+        result = converter.convert(DOC)
+        assert result.output == convert(DOC)
+        assert result.rendered_count == 0
+
+    def test_single_edit_renders_one_block(self):
+        """Editing one paragraph re-renders only that block."""
+        converter = IncrementalConverter()
+        converter.convert(DOC)
+        edited = DOC.replace("First paragraph.", "First **edited** paragraph.")
+        result = converter.convert(edited)
+        assert result.output == convert(edited)
+        assert result.rendered_count == 1
+
+    def test_offsets_map_source_to_output(self):
+        """Block offsets slice the source and output consistently."""
+        result = IncrementalConverter().convert(DOC)
+        assert result.blocks[0].source_start == 0
+        assert result.blocks[-1].source_end == len(DOC)
+        assert result.blocks[-1].output_end == len(result.output)
+        for block in result.blocks:
+            source = DOC[block.source_start : block.source_end]
+            output = result.output[block.output_start : block.output_end]
+            assert output == convert(source)
+
+    def test_missing_trailing_newline(self):
+        """Offsets stay within the source when it lacks a final newline."""
+        result = IncrementalConverter().convert("Para one.\n\nPara two.")
+        assert result.blocks[-1].source_end == len("Para one.\n\nPara two.")
+
+    def test_offsets_past_other_line_breaks(self):
+        """Only "\\n" ends a line, so offsets stay aligned with the source."""
+        doc = "a\u2028b\r\n\r\npara two\x0c\n\nthird\n"
+        result = IncrementalConverter().convert(doc)
+        assert result.output == convert(doc)
+        sources = [doc[b.source_start : b.source_end] for b in result.blocks]
+        assert sources == ["a\u2028b\r\n\r\n", "para two\x0c\n\n", "third\n"]
+
+    def test_reset_forgets_blocks(self):
+        """reset() forces a full re-render."""
+        converter = IncrementalConverter()
+        converter.convert(DOC)
+        converter.reset()
+        assert converter.convert(DOC).reused_count == 0
+
+    def test_references_from_other_blocks(self):
+        """Reference links resolve against definitions in any block."""
+        doc = "See [docs][d] here.\n\nOther para.\n\n[d]: https://example.com\n"
+        converter = IncrementalConverter()
+        result = converter.convert(doc)
+        assert result.output == convert(doc)
+        assert "<https://example.com|docs>" in result.output
+
+        edited = doc.replace("example.com", "example.org")
+        result = converter.convert(edited)
+        assert result.output == convert(edited)
+        assert result.rendered_count == 2
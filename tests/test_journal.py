@@ -0,0 +1,76 @@
+"""Tests for the resumable posting journal."""
+
+from md2slack.journal import JournalEntry, PostJournal, chunk_digest, journal_key
+
+
+class TestJournalKey:
+    """Tests for journal_key and chunk_digest."""
+
+    def test_key_is_stable(self):
+        """The same thread and parts give the same key."""
+        assert journal_key("C1/1.2", "doc", "opts") == journal_key(
+            "C1/1.2", "doc", "opts"
+        )
+
+    def test_key_depends_on_thread_and_parts(self):
+        """Changing the thread or any part changes the key."""
+        key = journal_key("C1/1.2", "doc", "opts")
+        assert journal_key("C2/1.2", "doc", "opts") != key
+        assert journal_key("C1/1.2", "doc!", "opts") != key
+        assert journal_key("C1/1.2", "docopts") != key
+
+    def test_chunk_digest(self):
+        """Digests identify exact chunk text."""
+        assert chunk_digest("a") == chunk_digest("a")
+        assert chunk_digest("a") != chunk_digest("a ")
+
+
+class TestPostJournal:
+    """Tests for PostJournal storage."""
+
+    def test_record_and_load(self, tmp_path):
+        """Recorded entries are loaded back by chunk index."""
+        journal = PostJournal.for_post(tmp_path, "abc")
+        entries = [
+            JournalEntry(0, "d0", "1.1", "https://x/p11"),
+            JournalEntry(1, "d1", "1.2", "https://x/p12"),
+        ]
+        for entry in entries:
+            journal.record(entry)
+
+        assert journal.path == tmp_path / "journals" / "abc.jsonl"
+        assert PostJournal(journal.path).load() == {0: entries[0], 1: entries[1]}
+
+    def test_missing_journal_is_empty(self, tmp_path):
+        """A journal that was never written loads as empty."""
+        assert PostJournal(tmp_path / "none.jsonl").load() == {}
+
+    def test_truncated_line_skipped(self, tmp_path):
+        """A partial line left by a crash is ignored, even once resumed."""
+        journal = PostJournal(tmp_path / "j.jsonl")
+        journal.record(JournalEntry(0, "d0", "1.1", "https://x/p11"))
+        with journal.path.open("a", encoding="utf-8") as stream:
+            stream.write('{"index": 1, "dig')
+
+        assert list(journal.load()) == [0]
+
+        # The resumed run's records must not be glued onto the fragment
+        journal.record(JournalEntry(1, "d1", "1.2", "https://x/p12"))
+        journal.record(JournalEntry(2, "d2", "1.3", "https://x/p13"))
+        assert list(PostJournal(journal.path).load()) == [0, 1, 2]
+
+    def test_remove(self, tmp_path):
+        """remove() deletes the journal and tolerates a missing file."""
+        journal = PostJournal(tmp_path / "j.jsonl")
+        journal.record(JournalEntry(0, "d0", "1.1", "https://x/p11"))
+        journal.remove()
+        journal.remove()
+        assert not journal.path.exists()
+
+    def test_disk_errors_ignored(self, tmp_path):
+        """An unwritable location does not raise."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        journal = PostJournal(blocker / "j.jsonl")
+        journal.record(JournalEntry(0, "d0", "1.1", "https://x/p11"))
+        assert journal.load() == {}
@@ -0,0 +1,62 @@
+"""Tests for the line-number index."""
+
+import pytest
+
+from md2slack.lines import LineIndex
+
+
+class TestLineCount:
+    """Tests for LineIndex.line_count."""
+
+    @pytest.mark.parametrize(
+        "content",
+        ["", "a", "a\n", "a\nb", "a\nb\n", "a\n\n\n", "\n", "a\r\nb\r\n"],
+    )
+    def test_matches_splitlines(self, content):
+        """Line count agrees with str.splitlines for newline-terminated text."""
+        assert LineIndex(content).line_count == len(content.splitlines())
+
+
+class TestPosition:
+    """Tests for offset to line/column mapping."""
+
+    def test_positions_match_naive_scan(self):
+        """Every offset maps to the same line/column as a prefix scan."""
+        content = "first\n\nthird line\nlast"
+        index = LineIndex(content)
+        for offset in range(len(content) + 1):
+            prefix = content[:offset]
+            expected_line = prefix.count("\n") + 1
+            expected_col = offset - (prefix.rfind("\n") + 1) + 1
+            assert index.position(offset) == (expected_line, expected_col)
+
+    def test_newline_belongs_to_its_line(self):
+        """The newline character is reported on the line it terminates."""
+        index = LineIndex("ab\ncd")
+        assert index.line_number(2) == 1
+        assert index.line_number(3) == 2
+
+
+class TestLineSpan:
+    """Tests for line range to offset mapping."""
+
+    def test_span_matches_splitlines(self):
+        """Slicing by line_span equals joining the selected lines."""
+        content = "one\ntwo\nthree\nfour\n"
+        lines = content.splitlines(keepends=True)
+        index = LineIndex(content)
+        for start in range(1, 5):
+            for end in range(start, 5):
+                s, e = index.line_span(start, end)
+                assert content[s:e] == "".join(lines[start - 1 : end])
+
+    def test_last_line_without_newline(self):
+        """A final unterminated line extends to the end of the text."""
+        content = "one\ntwo"
+        index = LineIndex(content)
+        assert content[slice(*index.line_span(2, 2))] == "two"
+
+    def test_out_of_range_clamps_to_end(self):
+        """Lines past the end map to the end of the text."""
+        index = LineIndex("one\n")
+        assert index.line_span(5, 6) == (4, 4)
@@ -0,0 +1,211 @@
+"""Tests for the NDJSON conversion server."""
+
+from __future__ import annotations
+
+import io
+import json
+import socket
+import threading
+
+from click.testing import CliRunner
+
+from md2slack.cli import cli
+from md2slack.converter import convert
+from md2slack.server import ConversionServer
+
+
+class TestHandleRequest:
+    """Tests for ConversionServer.handle_request."""
+
+    def test_convert(self):
+        """convert returns the mrkdwn for the markdown."""
+        response = ConversionServer().handle_request(
+            {"id": 7, "op": "convert", "markdown": "**hi**"}
+        )
+        assert response == {"id": 7, "ok": True, "result": "*hi*\n\n"}
+
+    def test_chunk(self):
+        """chunk splits text and reports chunk metadata."""
+        text = "A" * 600 + "\n\n" + "B" * 600
+        response = ConversionServer().handle_request(
+            {"id": 1, "op": "chunk", "text": text, "chunk_size": 1000}
+        )
+        chunks = response["result"]["chunks"]
+        assert response["ok"] is True
+        assert len(chunks) == 2
+        assert chunks[0]["text"].endswith("(1/2)")
+        assert chunks[1]["total"] == 2
+
+    def test_convert_chunk_splits_large_tables(self):
+        """convert_chunk splits big tables so no chunk is oversized."""
+        rows = "\n".join(f"| row {i} | {i} |" for i in range(300))
+        markdown = f"| Name | Value |\n|---|---|\n{rows}\n"
+        response = ConversionServer().handle_request(
+            {"id": 8, "op": "convert_chunk", "markdown": markdown,
+             "chunk_size": 1000}
+        )
+        result = response["result"]
+        assert result["warnings"] == []
+        assert len(result["chunks"]) > 1
+        for chunk in result["chunks"]:
+            assert len(chunk["content"]) <= 1000
+            assert "Name" in chunk["content"]
+
+    def test_convert_chunk_with_prefix(self):
+        """convert_chunk converts, prepends the prefix and chunks."""
+        response = ConversionServer().handle_request(
+            {"id": 2, "op": "convert_chunk", "markdown": "# Hi", "prefix": "Update: "}
+        )
+        chunks = response["result"]["chunks"]
+        assert chunks == [
+            {
+                "text": "Update: *Hi*\n\n",
+                "content": "Update: *Hi*\n\n",
+                "index": 0,
+                "total": 1,
+                "split_type": "none",
+            }
+        ]
+
+    def test_unknown_op(self):
+        """Unknown operations produce an error response."""
+        response = ConversionServer().handle_request({"id": 3, "op": "nope"})
+        assert response["ok"] is False
+        assert "Unknown op" in response["error"]
+
+    def test_missing_field(self):
+        """A missing markdown field produces an error response."""
+        response = ConversionServer().handle_request({"id": 4, "op": "convert"})
+        assert response == {
+            "id": 4,
+            "ok": False,
+            "error": "'markdown' must be a string",
+        }
+
+    def test_chunk_size_too_small(self):
+        """chunk_size below the minimum is rejected."""
+        response = ConversionServer().handle_request(
+            {"id": 5, "op": "chunk", "text": "x", "chunk_size": 10}
+        )
+        assert response["ok"] is False
+        assert "chunk_size" in response["error"]
+
+    def test_unknown_chunk_strategy(self):
+        """An unknown chunk_strategy is rejected."""
+        response = ConversionServer().handle_request(
+            {"id": 6, "op": "chunk", "text": "x", "chunk_strategy": "random"}
+        )
+        assert response["ok"] is False
+        assert "chunk_strategy" in response["error"]
+
+    def test_convert_chunk_blocks(self):
+        """convert_chunk with the blocks strategy splits between list items."""
+        markdown = "".join(f"- item {i}: " + "word " * 30 + "\n" for i in range(40))
+        response = ConversionServer().handle_request(
+            {
+                "id": 7,
+                "op": "convert_chunk",
+                "markdown": markdown,
+                "chunk_size": 1000,
+                "chunk_strategy": "blocks",
+            }
+        )
+        assert response["ok"] is True
+        chunks = response["result"]["chunks"]
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk["content"].startswith("• item")
+            assert chunk["content"].rstrip("\n").endswith("word")
+
+    def test_chunk_rejects_blocks_strategy(self):
+        """The blocks strategy needs markdown, so plain chunk rejects it."""
+        response = ConversionServer().handle_request(
+            {"id": 8, "op": "chunk", "text": "x", "chunk_strategy": "blocks"}
+        )
+        assert response["ok"] is False
+        assert "chunk_strategy" in response["error"]
+
+    def test_unexpected_error(self, monkeypatch):
+        """A failure outside request validation still gets a response."""
+        server = ConversionServer()
+
+        def fail(request):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(server, "_dispatch", fail)
+        response = server.handle_request({"id": 9, "op": "convert"})
+        assert response == {
+            "id": 9,
+            "ok": False,
+            "error": "Internal error: RuntimeError: boom",
+        }
+
+    def test_invalid_json_line(self):
+        """Malformed JSON produces an error line instead of crashing."""
+        response = json.loads(ConversionServer().handle_line("{not json"))
+        assert response["ok"] is False
+        assert response["id"] is None
+
+
+class TestServeStdio:
+    """Tests for stdin/stdout mode."""
+
+    def test_concurrent_requests_answered_by_id(self):
+        """Every request gets exactly one response with its id."""
+        requests = [
+            json.dumps({"id": i, "op": "convert", "markdown": f"**{i}**"})
+            for i in range(50)
+        ]
+        output = io.StringIO()
+        ConversionServer(workers=8).serve_stdio(
+            io.StringIO("\n".join(requests) + "\n"), output
+        )
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        by_id = {r["id"]: r["result"] for r in responses}
+        assert by_id == {i: convert(f"**{i}**") for i in range(50)}
+
+    def test_lone_surrogate_answered(self):
+        """A lone surrogate in a request still produces a writable response."""
+        requests = [
+            '{"id": 1, "op": "convert", "markdown": "bad \\ud800 x"}',
+            '{"id": 2, "op": "convert", "markdown": "ok"}',
+        ]
+        output = io.BytesIO()
+        stream = io.TextIOWrapper(output, encoding="utf-8")
+        ConversionServer().serve_stdio(io.StringIO("\n".join(requests) + "\n"), stream)
+        stream.flush()
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert sorted(r["id"] for r in responses) == [1, 2]
+        assert all(r["ok"] for r in responses)
+
+    def test_serve_command_stdio(self):
+        """md2slack serve answers requests from stdin."""
+        runner = CliRunner()
+        request = json.dumps({"id": "a", "op": "convert", "markdown": "~~x~~"})
+        result = runner.invoke(cli, ["serve"], input=request + "\n")
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {"id": "a", "ok": True, "result": "~x~\n\n"}
+
+
+class TestServeUnix:
+    """Tests for Unix domain socket mode."""
+
+    def test_round_trip(self, tmp_path):
+        """Requests over the socket are answered in order."""
+        path = str(tmp_path / "md2slack.sock")
+        server = ConversionServer().make_unix_server(path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(path)
+                stream = sock.makefile("rw", encoding="utf-8")
+                for i in range(3):
+                    request = {"id": i, "op": "convert", "markdown": f"# {i}"}
+                    stream.write(json.dumps(request) + "\n")
+                    stream.flush()
+                    response = json.loads(stream.readline())
+                    assert response == {"id": i, "ok": True, "result": f"*{i}*\n\n"}
+        finally:
+            server.shutdown()
+            server.server_close()
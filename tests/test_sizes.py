@@ -0,0 +1,53 @@
+"""Tests for message size metrics."""
+
+import pytest
+
+from md2slack.sizes import SIZE_METRICS, SizeIndex, text_size
+
+SAMPLE = "abc 漢字 😀 a&b <tag> é"
+
+
+class TestTextSize:
+    """Tests for text_size()."""
+
+    def test_metrics(self):
+        """Each metric counts the units it is named after."""
+        assert text_size(SAMPLE, "chars") == len(SAMPLE)
+        assert text_size(SAMPLE, "utf8") == len(SAMPLE.encode("utf-8"))
+        assert text_size(SAMPLE, "utf16") == len(SAMPLE.encode("utf-16-le")) // 2
+        escaped = SAMPLE.replace("&", "&amp;").replace("<", "&lt;")
+        assert text_size(SAMPLE, "escaped") == len(escaped.replace(">", "&gt;"))
+
+    def test_unknown_metric(self):
+        """Unknown metrics raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown size metric"):
+            text_size("x", "bytes")
+
+
+class TestSizeIndex:
+    """Tests for prefix-sum size lookups."""
+
+    @pytest.mark.parametrize("metric", SIZE_METRICS)
+    def test_size_matches_text_size(self, metric):
+        """Range sizes agree with measuring the slice directly."""
+        index = SizeIndex(SAMPLE, metric)
+        for start in range(len(SAMPLE) + 1):
+            for end in range(start, len(SAMPLE) + 1):
+                assert index.size(start, end) == text_size(SAMPLE[start:end], metric)
+
+    @pytest.mark.parametrize("metric", SIZE_METRICS)
+    def test_limit_is_furthest_fitting_offset(self, metric):
+        """limit() returns the furthest end whose range fits the budget."""
+        index = SizeIndex(SAMPLE, metric)
+        for start in range(len(SAMPLE)):
+            for budget in range(1, 12):
+                end = index.limit(start, budget)
+                assert index.size(start, end) <= budget
+                if end < len(SAMPLE):
+                    assert index.size(start, end + 1) > budget
+
+    def test_ascii_needs_no_prefix_array(self):
+        """Text where every character weighs one unit uses offsets."""
+        index = SizeIndex("plain ascii", "utf8")
+        assert index._prefix is None
+        assert index.limit(2, 4) == 6
@@ -0,0 +1,72 @@
+"""Tests for CLI startup cost (lazy imports)."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+# Generous budget: the CLI imports in well under 100 ms on a laptop, so
+# exceeding this means a heavy import crept back into module scope.
+IMPORT_BUDGET_MS = 500
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the loaded module names."""
+    script = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def _import_time_ms(module: str) -> float:
+    """Return the cumulative import time of module in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.rstrip().endswith(f"| {module}"):
+            return int(line.split("|")[1]) / 1000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_cli_import_skips_heavy_modules():
+    """Importing the CLI does not load slack_sdk or mistune."""
+    modules = _loaded_modules("import md2slack.cli")
+    assert "slack_sdk" not in modules
+    assert "mistune" not in modules
+
+
+def test_help_skips_heavy_modules():
+    """md2slack --help does not load slack_sdk or mistune."""
+    modules = _loaded_modules(
+        "from md2slack.cli import cli\n"
+        "try:\n"
+        "    cli(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert "slack_sdk" not in modules
+    assert "mistune" not in modules
+
+
+def test_convert_skips_slack_sdk():
+    """md2slack convert does not load slack_sdk."""
+    modules = _loaded_modules(
+        "from md2slack.cli import cli\n"
+        "try:\n"
+        "    cli(['convert', '--text', '**hi**'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert "mistune" in modules
+    assert "slack_sdk" not in modules
+
+
+def test_cli_import_time_budget():
+    """Cold import of the CLI stays within budget."""
+    best = min(_import_time_ms("md2slack.cli") for _ in range(3))
+    assert best < IMPORT_BUDGET_MS
@@ -187,8 +187,94 @@ class TestRenderTable:
         # Should still have proper structure
         assert "\u2502" in result  # vertical bar
 
+    def test_cell_alignment_rendering(self):
+        """Right and center aligned cells are padded accordingly."""
+        from md2slack.tables import Table, TableCell, TableRow, render_table
+
+        headers = TableRow([
+            TableCell("Left", alignment="left", is_header=True),
+            TableCell("Right", alignment="right", is_header=True),
+            TableCell("Center", alignment="center", is_header=True),
+        ])
+        rows = [
+            TableRow([
+                TableCell("a", alignment="left"),
+                TableCell("b", alignment="right"),
+                TableCell("c", alignment="center"),
+            ])
+        ]
+        result = render_table(Table(headers=headers, rows=rows))
+        data_line = result.split("\n")[3]
+        assert data_line == "\u2502 a    \u2502     b \u2502   c    \u2502"
+
 
 # Test multi-line cell rendering
+class TestRenderTableParts:
+    """Test splitting a rendered table on row boundaries."""
+
+    @staticmethod
+    def _table(row_count):
+        from md2slack.tables import Table, TableCell, TableRow
+
+        headers = TableRow([
+            TableCell("Name", is_header=True),
+            TableCell("Value", is_header=True),
+        ])
+        rows = [
+            TableRow([TableCell(f"row {i}"), TableCell(str(i * 7))])
+            for i in range(row_count)
+        ]
+        return Table(headers=headers, rows=rows)
+
+    def test_unlimited_matches_render_table(self):
+        """Without a size limit the table renders as a single part."""
+        from md2slack.tables import render_table, render_table_parts
+
+        table = self._table(50)
+        assert render_table_parts(table, None) == [render_table(table)]
+
+    def test_parts_fit_and_repeat_header(self):
+        """Each part fits the limit and starts with the same header."""
+        from md2slack.tables import render_table, render_table_parts
+
+        table = self._table(200)
+        parts = render_table_parts(table, 500)
+        assert len(parts) > 1
+        header = render_table(table).split("\n")[:3]
+        for part in parts:
+            assert len(part) <= 500
+            lines = part.split("\n")
+            assert lines[:3] == header
+            assert lines[-1].startswith("\u2514")
+
+    def test_parts_keep_every_row_in_order(self):
+        """Data rows are distributed across parts without loss."""
+        from md2slack.tables import render_table, render_table_parts
+
+        table = self._table(200)
+        full_rows = render_table(table).split("\n")[3:-1]
+        split_rows = [
+            line
+            for part in render_table_parts(table, 500)
+            for line in part.split("\n")[3:-1]
+        ]
+        assert split_rows == full_rows
+
+    def test_oversized_row_gets_own_part(self):
+        """A row larger than the limit is emitted whole, alone."""
+        from md2slack.tables import Table, TableCell, TableRow, render_table_parts
+
+        headers = TableRow([TableCell("H", is_header=True)])
+        rows = [
+            TableRow([TableCell("a")]),
+            TableRow([TableCell("x" * 300)]),
+            TableRow([TableCell("b")]),
+        ]
+        parts = render_table_parts(Table(headers=headers, rows=rows), 200)
+        assert len(parts) == 3
+        assert "x" * 300 in parts[1]
+
+
 class TestMultiLineCells:
     """Test rendering of multi-line cells."""
 
@@ -276,3 +362,33 @@ class TestTableConversion:
         assert "```" in result
         # Should have box-drawing characters
         assert "\u2500" in result or "\u2502" in result
+
+    def test_alignment_from_delimiter_row(self):
+        """Column alignment from the delimiter row is applied."""
+        from md2slack.converter import convert
+
+        md = """| Item | Qty |
+|:-----|----:|
+| apple | 5 |"""
+        result = convert(md)
+        assert "\u2502 apple \u2502   5 \u2502" in result
+
+    def test_empty_cells_keep_their_column(self):
+        """Empty cells do not shift later cells into the wrong column."""
+        from md2slack.converter import convert
+
+        md = """| A | B |
+|---|---|
+|   | x |"""
+        result = convert(md)
+        assert "\u2502   \u2502 x \u2502" in result
+
+    def test_sentinel_like_cell_text(self):
+        """Cell text resembling internal markers renders verbatim."""
+        from md2slack.converter import convert
+
+        md = """| Key | Value |
+|-----|-------|
+| HEADER:x | ROW:y |"""
+        result = convert(md)
+        assert "\u2502 HEADER:x \u2502 ROW:y \u2502" in result